@@ -2,13 +2,12 @@
 import os
 import sys
 from flask import Flask, request, g
-from flask import has_request_context
 from flask_cors import CORS
 from dotenv import load_dotenv
 import logging
-import os as _os
-from logging.handlers import RotatingFileHandler
+import time
 import uuid
+from app.core.structured_logging import configure_logging, LOG_SAMPLE_RATE
 
 # Add the root directory to the path so we can find the .env file
 root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
@@ -36,64 +35,63 @@ def create_app():
         # Fallback to backend dir if cannot create
         log_dir = os.path.dirname(__file__)
 
-    # Configure rotating file handler
-    file_handler = RotatingFileHandler(
-        os.path.join(log_dir, 'server.log'), maxBytes=5 * 1024 * 1024, backupCount=3, encoding='utf-8'
-    )
-    fmt = logging.Formatter(
-        '%(asctime)s %(levelname)s %(name)s [%(request_id)s] %(message)s'
-    )
-    file_handler.setFormatter(fmt)
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(fmt)
-
-    class RequestIdFilter(logging.Filter):
-        def filter(self, record):
-            try:
-                if has_request_context():
-                    record.request_id = getattr(g, 'request_id', '-')
-                else:
-                    record.request_id = '-'
-            except Exception:
-                record.request_id = '-'
-            return True
-
-    file_handler.addFilter(RequestIdFilter())
-    console_handler.addFilter(RequestIdFilter())
-
-    root_logger = logging.getLogger()
-    root_logger.setLevel(_level)
-    # Avoid duplicate handlers on reload
-    if not any(isinstance(h, RotatingFileHandler) for h in root_logger.handlers):
-        root_logger.addHandler(file_handler)
-    if not any(isinstance(h, logging.StreamHandler) for h in root_logger.handlers):
-        root_logger.addHandler(console_handler)
+    configure_logging(log_dir, _level)
+    access_logger = logging.getLogger(__name__)
 
     @app.before_request
     def _inject_request_id():
         g.request_id = str(uuid.uuid4())
-        logging.getLogger(__name__).debug(
-            f"Incoming {request.method} {request.path}")
+        g.request_started = time.perf_counter()
+        access_logger.debug("Incoming %s %s", request.method, request.path)
 
     @app.after_request
     def _log_response(resp):
-        logging.getLogger(__name__).info(
-            f"{request.method} {request.path} -> {resp.status_code}")
+        if not access_logger.isEnabledFor(logging.INFO):
+            return resp
+        # Successful requests are the bulk of the log volume, so only they are sampled
+        access_logger.info(
+            "%s %s -> %s", request.method, request.path, resp.status_code,
+            extra={
+                'method': request.method,
+                'path': request.path,
+                'status': resp.status_code,
+                'duration_ms': round((time.perf_counter() - g.request_started) * 1000, 1) if 'request_started' in g else None,
+                'sample_rate': LOG_SAMPLE_RATE if resp.status_code < 400 else 1.0,
+            })
         return resp
 
+    # Per-route latency and in-flight gauges plus /metrics; registered before the cache hook so
+    # the status it records is the final one (e.g. a 304)
+    from app.core.metrics import init_app as init_metrics
+    init_metrics(app)
+
+    # Opt-in cProfile/sampled stack profiles written under LOG_DIR/profiles
+    from app.core.profiling import init_app as init_profiling
+    init_profiling(app, log_dir)
+
+    # ETags/304s and response compression; registered last so it runs first after each request
+    from app.core.http_cache import init_app as init_http_cache
+    init_http_cache(app)
+
     @app.errorhandler(Exception)
     def _handle_exception(err):
-        logging.getLogger(__name__).exception(f"Unhandled error: {err}")
+        access_logger.exception("Unhandled error: %s", err)
         return ({'error': 'Internal server error', 'request_id': getattr(g, 'request_id', '-')}, 500)
     
     # Import and register blueprints
     from app.api.users import users_bp
     from app.api.multilingual import multilingual_bp
     from app.api.saved_jobs import saved_jobs_bp
+    from app.api.listings import listings_bp
+    from app.api.recommendations import recommendations_bp
+    from app.api.resume import resume_bp
     
     app.register_blueprint(users_bp)
     app.register_blueprint(multilingual_bp)
     app.register_blueprint(saved_jobs_bp)
+    app.register_blueprint(listings_bp)
+    app.register_blueprint(recommendations_bp)
+    app.register_blueprint(resume_bp)
     
     # Health check endpoint
     @app.route('/health')
@@ -0,0 +1,230 @@
+# backend/app/api/listings.py
+from flask import Blueprint, request, jsonify
+from app.core.auth import login_required, get_current_user
+from app.core.bulk_ingest import ingest_postings, DEFAULT_BATCH_SIZE
+from app.core.candidate_ranking import candidate_ranking_service
+from app.core.http_cache import not_modified, version_etag
+from app.core.localization import request_language, localized_columns, localize
+from app.core.services import internship_service, freelance_job_service, POSTING_COLUMNS, POSTING_LIST_COLUMNS
+import logging
+import io
+import os
+import uuid
+
+listings_bp = Blueprint('listings', __name__, url_prefix='/api')
+
+MAX_CANDIDATES_PAGE = 50
+MAX_LISTING_PAGE = 100
+# Seconds browsers and proxies may reuse a listing response before revalidating it (ETag)
+LISTING_MAX_AGE = int(os.getenv('LISTING_MAX_AGE', '30'))
+
+def _detect_format():
+    """Pick csv/ndjson from ?format= or the request Content-Type"""
+    fmt = (request.args.get('format') or '').lower()
+    if fmt in ('csv', 'ndjson'):
+        return fmt
+    content_type = (request.content_type or '').lower()
+    if 'csv' in content_type:
+        return 'csv'
+    if 'ndjson' in content_type or 'jsonl' in content_type or 'json' in content_type:
+        return 'ndjson'
+    return None
+
+def _is_uuid(value):
+    try:
+        uuid.UUID(str(value))
+        return True
+    except ValueError:
+        return False
+
+def _page_args():
+    """(limit, offset) from the query string; raises ValueError on non-integers"""
+    limit = max(1, min(int(request.args.get('limit', 20)), MAX_LISTING_PAGE))
+    offset = max(0, int(request.args.get('offset', 0)))
+    return limit, offset
+
+def _skills_arg():
+    """?skills=a&skills=b or ?skills=a,b"""
+    return [s.strip() for value in request.args.getlist('skills') for s in value.split(',') if s.strip()]
+
+def _cacheable(payload):
+    """JSON response shared caches may keep for LISTING_MAX_AGE (ETag and 304s come from http_cache)"""
+    response = jsonify(payload)
+    response.cache_control.public = True
+    response.cache_control.max_age = LISTING_MAX_AGE
+    return response
+
+def _page(rows, limit, offset):
+    # One extra row was fetched to tell whether another page follows
+    items = rows[:limit]
+    return {
+        'items': items,
+        'count': len(items),
+        'offset': offset,
+        'limit': limit,
+        'next_offset': offset + limit if len(rows) > limit else None
+    }
+
+@listings_bp.route('/internships', methods=['GET'])
+def list_internships():
+    """Open internships, newest first (?skills=&location=&work_type=&lang=&limit=&offset=)"""
+    try:
+        try:
+            limit, offset = _page_args()
+        except ValueError:
+            return jsonify({'error': 'limit and offset must be integers'}), 400
+
+        lang = request_language()
+        rows = internship_service.get_internships(
+            skills=_skills_arg(),
+            location=request.args.get('location'),
+            work_type=request.args.get('work_type'),
+            limit=limit + 1,
+            offset=offset,
+            columns=localized_columns(POSTING_LIST_COLUMNS['internships'], 'internships', lang)
+        )
+        return _cacheable(_page(localize(rows, 'internships', lang), limit, offset))
+
+    except Exception as e:
+        logging.error(f"Error listing internships: {str(e)}")
+        return jsonify({'error': 'Failed to list internships'}), 500
+
+@listings_bp.route('/internships/<internship_id>', methods=['GET'])
+def get_internship(internship_id):
+    """One internship by id (translated fields in ?lang= or the Accept-Language)"""
+    try:
+        lang = request_language()
+        columns = localized_columns(POSTING_COLUMNS['internships'], 'internships', lang)
+        internship = internship_service.get_internship_by_id(internship_id, columns) if _is_uuid(internship_id) else None
+        if not internship:
+            return jsonify({'error': 'Internship not found'}), 404
+        updated_at = internship.get('updated_at')
+        cached = not_modified(version_etag('internships', internship_id, updated_at, lang), updated_at)
+        return cached or _cacheable({'item': localize([internship], 'internships', lang)[0]})
+
+    except Exception as e:
+        logging.error(f"Error fetching internship: {str(e)}")
+        return jsonify({'error': 'Failed to fetch internship'}), 500
+
+@listings_bp.route('/jobs/freelance', methods=['GET'])
+def list_freelance_jobs():
+    """Open freelance jobs, newest first (?category=&skills=&work_type=&budget_min=&budget_max=&lang=&limit=&offset=)"""
+    try:
+        try:
+            limit, offset = _page_args()
+        except ValueError:
+            return jsonify({'error': 'limit and offset must be integers'}), 400
+        try:
+            budget_min = float(request.args['budget_min']) if request.args.get('budget_min') else None
+            budget_max = float(request.args['budget_max']) if request.args.get('budget_max') else None
+        except ValueError:
+            return jsonify({'error': 'budget_min and budget_max must be numbers'}), 400
+
+        lang = request_language()
+        rows = freelance_job_service.get_freelance_jobs(
+            category=request.args.get('category'),
+            budget_min=budget_min,
+            budget_max=budget_max,
+            skills=_skills_arg(),
+            work_type=request.args.get('work_type'),
+            limit=limit + 1,
+            offset=offset,
+            columns=localized_columns(POSTING_LIST_COLUMNS['freelance_jobs'], 'freelance_jobs', lang)
+        )
+        return _cacheable(_page(localize(rows, 'freelance_jobs', lang), limit, offset))
+
+    except Exception as e:
+        logging.error(f"Error listing freelance jobs: {str(e)}")
+        return jsonify({'error': 'Failed to list freelance jobs'}), 500
+
+@listings_bp.route('/jobs/freelance/<job_id>', methods=['GET'])
+def get_freelance_job(job_id):
+    """One freelance job by id (translated fields in ?lang= or the Accept-Language)"""
+    try:
+        lang = request_language()
+        columns = localized_columns(POSTING_COLUMNS['freelance_jobs'], 'freelance_jobs', lang)
+        job = freelance_job_service.get_freelance_job_by_id(job_id, columns) if _is_uuid(job_id) else None
+        if not job:
+            return jsonify({'error': 'Freelance job not found'}), 404
+        updated_at = job.get('updated_at')
+        cached = not_modified(version_etag('freelance_jobs', job_id, updated_at, lang), updated_at)
+        return cached or _cacheable({'item': localize([job], 'freelance_jobs', lang)[0]})
+
+    except Exception as e:
+        logging.error(f"Error fetching freelance job: {str(e)}")
+        return jsonify({'error': 'Failed to fetch freelance job'}), 500
+
+def _bulk_ingest(table):
+    current_user = get_current_user()
+    if not current_user or current_user.get('role') != 'recruiter':
+        return jsonify({'error': 'Forbidden', 'message': 'Only recruiters can post listings'}), 403
+
+    fmt = _detect_format()
+    if not fmt:
+        return jsonify({'error': 'Unsupported format', 'message': 'Send text/csv or application/x-ndjson'}), 415
+
+    try:
+        batch_size = int(request.args.get('batch_size', DEFAULT_BATCH_SIZE))
+    except ValueError:
+        return jsonify({'error': 'batch_size must be an integer'}), 400
+
+    # Read the body as a text stream so large uploads are never buffered in full
+    stream = io.TextIOWrapper(request.stream, encoding='utf-8', newline='')
+    summary = ingest_postings(
+        stream,
+        fmt,
+        table=table,
+        recruiter_id=current_user['id'],
+        batch_size=batch_size,
+        translate=request.args.get('translate', 'true').lower() != 'false'
+    )
+    status = 201 if summary['inserted'] else 400
+    return jsonify(summary), status
+
+@listings_bp.route('/internships/bulk', methods=['POST'])
+@login_required
+def bulk_create_internships():
+    """Bulk-create internships from a CSV or NDJSON body"""
+    try:
+        return _bulk_ingest('internships')
+    except Exception as e:
+        logging.error(f"Error in bulk internship ingestion: {str(e)}")
+        return jsonify({'error': 'Bulk ingestion failed'}), 500
+
+@listings_bp.route('/jobs/freelance/bulk', methods=['POST'])
+@login_required
+def bulk_create_freelance_jobs():
+    """Bulk-create freelance jobs from a CSV or NDJSON body"""
+    try:
+        return _bulk_ingest('freelance_jobs')
+    except Exception as e:
+        logging.error(f"Error in bulk freelance job ingestion: {str(e)}")
+        return jsonify({'error': 'Bulk ingestion failed'}), 500
+
+@listings_bp.route('/internships/<internship_id>/candidates', methods=['GET'])
+@login_required
+def get_internship_candidates(internship_id):
+    """Talents ranked for one of the recruiter's internships, with per-candidate score breakdowns"""
+    try:
+        current_user = get_current_user()
+        if not current_user or current_user.get('role') != 'recruiter':
+            return jsonify({'error': 'Forbidden', 'message': 'Only recruiters can view candidates'}), 403
+
+        try:
+            limit = max(1, min(int(request.args.get('limit', 20)), MAX_CANDIDATES_PAGE))
+            offset = max(0, int(request.args.get('offset', 0)))
+        except ValueError:
+            return jsonify({'error': 'limit and offset must be integers'}), 400
+
+        internship = internship_service.get_internship_by_id(internship_id) if _is_uuid(internship_id) else None
+        if not internship:
+            return jsonify({'error': 'Internship not found'}), 404
+        if str(internship.get('recruiter_id')) != str(current_user['id']):
+            return jsonify({'error': 'Forbidden', 'message': 'You can only view candidates for your own internships'}), 403
+
+        ranked = candidate_ranking_service.rank_for_internship(internship, limit, offset)
+        return jsonify({**ranked, 'count': len(ranked['items']), 'offset': offset, 'limit': limit}), 200
+
+    except Exception as e:
+        logging.error(f"Error ranking candidates: {str(e)}")
+        return jsonify({'error': 'Failed to rank candidates'}), 500
@@ -1,13 +1,33 @@
 # backend/app/api/multilingual.py
 from flask import Blueprint, request, jsonify
 from app.core.translation import translation_service
+from app.core.async_translation import async_translation_service, run_sync
+from app.core.http_cache import not_modified, version_etag
 from app.core.auth import login_required, require_user_id, get_current_user
+from app.core.admission import admission_control
+from app.core.services import application_service, internship_service, freelance_job_service
+from app.core.exports import EXPORT_FORMATS, iter_keyset, stream_export
+from app.models.application import ApplicationBulkStatusUpdate
+from pydantic import ValidationError
 import logging
+import os
+import uuid
 from app.core.database import get_supabase_client
 
 multilingual_bp = Blueprint('multilingual', __name__, url_prefix='/api/multilingual')
 
+# Every text is sent to each target language's provider, so inputs are bounded per request
+MAX_TRANSLATE_CHARS = int(os.getenv('MAX_TRANSLATE_CHARS', '5000'))
+MAX_BATCH_TEXTS = int(os.getenv('MAX_BATCH_TEXTS', '50'))
+MAX_BATCH_CHARS = int(os.getenv('MAX_BATCH_CHARS', '50000'))
+
+def _batch_cost():
+    """Rate-limit tokens for a batch: one per text (an oversized batch is rejected, so it costs one)"""
+    texts = (request.get_json(silent=True) or {}).get('texts')
+    return len(texts) if isinstance(texts, list) and len(texts) <= MAX_BATCH_TEXTS else 1
+
 @multilingual_bp.route('/detect', methods=['POST'])
+@admission_control('translation')
 def detect_language():
     """Detect the language of input text"""
     try:
@@ -16,6 +36,8 @@ def detect_language():
         
         if not text:
             return jsonify({'error': 'Text is required'}), 400
+        if len(text) > MAX_TRANSLATE_CHARS:
+            return jsonify({'error': f'Text is limited to {MAX_TRANSLATE_CHARS} characters'}), 413
         
         detected_lang = translation_service.detect_language(text)
         language_name = translation_service.TARGET_LANGUAGES.get(detected_lang, 'Unknown')
@@ -31,6 +53,7 @@ def detect_language():
         return jsonify({'error': 'Language detection failed'}), 500
 
 @multilingual_bp.route('/translate', methods=['POST'])
+@admission_control('translation')
 def translate_text():
     """Translate text to target language(s)"""
     try:
@@ -41,6 +64,8 @@ def translate_text():
         
         if not text:
             return jsonify({'error': 'Text is required'}), 400
+        if len(text) > MAX_TRANSLATE_CHARS:
+            return jsonify({'error': f'Text is limited to {MAX_TRANSLATE_CHARS} characters'}), 413
         
         # If no target languages specified, translate to all
         if not target_languages:
@@ -50,12 +75,10 @@ def translate_text():
         if not source_language:
             source_language = translation_service.detect_language(text)
         
-        translations = {}
-        for target_lang in target_languages:
-            if target_lang in translation_service.TARGET_LANGUAGES:
-                translated = translation_service.translate_text(text, source_language, target_lang)
-                if translated:
-                    translations[target_lang] = translated
+        targets = [lang for lang in target_languages if lang in translation_service.TARGET_LANGUAGES]
+        translations = run_sync(async_translation_service.translate_to_languages(text, source_language, targets))
+        if source_language not in targets:
+            translations.pop(source_language, None)
         
         return jsonify({
             'source_language': source_language,
@@ -68,6 +91,7 @@ def translate_text():
         return jsonify({'error': 'Translation failed'}), 500
 
 @multilingual_bp.route('/batch-translate', methods=['POST'])
+@admission_control('translation', cost=_batch_cost)
 def batch_translate():
     """Translate multiple texts at once"""
     try:
@@ -75,15 +99,25 @@ def batch_translate():
         texts = data.get('texts', [])  # List of texts to translate
         target_languages = data.get('target_languages', list(translation_service.TARGET_LANGUAGES.keys()))
         
-        if not texts:
+        if not texts or not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
             return jsonify({'error': 'Texts array is required'}), 400
+        if len(texts) > MAX_BATCH_TEXTS:
+            return jsonify({'error': f'At most {MAX_BATCH_TEXTS} texts per request'}), 413
+        if any(len(text) > MAX_TRANSLATE_CHARS for text in texts) or sum(map(len, texts)) > MAX_BATCH_CHARS:
+            return jsonify({'error': f'Texts are limited to {MAX_TRANSLATE_CHARS} characters each and {MAX_BATCH_CHARS} in total'}), 413
         
+        # Detect every text first, then translate all of them to every language in one concurrent batch
+        pending = [(i, text, translation_service.detect_language(text)) for i, text in enumerate(texts) if text.strip()]
+        batch = run_sync(async_translation_service.translate_batch(
+            [(text, source_lang) for _, text, source_lang in pending],
+            [lang for lang in target_languages if lang in translation_service.TARGET_LANGUAGES]
+        ))
+        translated = {i: (source_lang, translations) for (i, _, source_lang), translations in zip(pending, batch)}
+
         results = []
         for i, text in enumerate(texts):
-            if text.strip():
-                source_lang = translation_service.detect_language(text)
-                translations = translation_service.translate_to_all_languages(text, source_lang)
-                
+            if i in translated:
+                source_lang, translations = translated[i]
                 results.append({
                     'index': i,
                     'original_text': text,
@@ -110,6 +144,9 @@ def batch_translate():
 @multilingual_bp.route('/languages', methods=['GET'])
 def get_supported_languages():
     """Get list of supported languages"""
+    cached = not_modified(version_etag('languages', *sorted(translation_service.TARGET_LANGUAGES.items())))
+    if cached:
+        return cached
     return jsonify({
         'supported_languages': translation_service.TARGET_LANGUAGES,
         'total_languages': len(translation_service.TARGET_LANGUAGES)
@@ -220,4 +257,132 @@ def applications():
         
     except Exception as e:
         logging.error(f"applications error: {str(e)}")
-        return jsonify({'error': 'applications failed'}), 500
\ No newline at end of file
+        return jsonify({'error': 'applications failed'}), 500
+
+@multilingual_bp.route('/applications/status', methods=['PATCH'])
+@login_required
+def bulk_update_application_status():
+    """Change the status of many applications at once (recruiters only)"""
+    try:
+        current_user = get_current_user()
+        if not current_user or current_user.get('role') != 'recruiter':
+            return jsonify({'error': 'Forbidden', 'message': 'Only recruiters can update application status'}), 403
+
+        update = ApplicationBulkStatusUpdate(**(request.get_json() or {}))
+        filters = update.filter
+        if not update.application_ids and not (filters and (filters.internship_id or filters.job_id)):
+            return jsonify({'error': 'application_ids or a filter with internship_id/job_id is required'}), 400
+
+        requested_ids = [str(i) for i in update.application_ids] if update.application_ids else None
+        updated = application_service.bulk_update_status(
+            recruiter_id=current_user['id'],
+            status=update.status.value,
+            application_ids=requested_ids,
+            internship_id=str(filters.internship_id) if filters and filters.internship_id else None,
+            job_id=str(filters.job_id) if filters and filters.job_id else None,
+            current_status=filters.status.value if filters and filters.status else None
+        )
+
+        results = [
+            {'id': row['id'], 'outcome': 'updated', 'previous_status': row['previous_status'], 'status': row['status']}
+            for row in updated
+        ]
+        if requested_ids:
+            # Ids the statement did not touch are missing, not owned by this recruiter, or filtered out
+            touched = {row['id'] for row in updated}
+            results.extend(
+                {'id': app_id, 'outcome': 'not_found'}
+                for app_id in dict.fromkeys(requested_ids) if app_id not in touched
+            )
+
+        return jsonify({'results': results, 'updated': len(updated)}), 200
+
+    except ValidationError as e:
+        return jsonify({'error': 'Validation error', 'details': e.errors()}), 400
+    except Exception as e:
+        logging.error(f"Error in bulk application status update: {str(e)}")
+        return jsonify({'error': 'Bulk status update failed'}), 500
+
+APPLICATION_EXPORT_COLUMNS = ('id', 'job_type', 'internship_id', 'job_id', 'status', 'applied_at', 'updated_at',
+                              'interview_scheduled_at', 'talent_id', 'cover_letter', 'resume_url', 'portfolio_url')
+APPLICANT_EXPORT_COLUMNS = ('full_name', 'email', 'location', 'experience_level', 'years_of_experience', 'skills')
+
+
+def _owned_posting(service_get, posting_id, recruiter_id):
+    """(posting, error response) for a posting the recruiter must own"""
+    try:
+        uuid.UUID(str(posting_id))
+    except ValueError:
+        return None, (jsonify({'error': 'Posting not found'}), 404)
+    posting = service_get(posting_id, 'id,recruiter_id')
+    if not posting:
+        return None, (jsonify({'error': 'Posting not found'}), 404)
+    if posting.get('recruiter_id') != recruiter_id:
+        return None, (jsonify({'error': 'Forbidden', 'message': 'You can only export applications to your own postings'}), 403)
+    return posting, None
+
+
+def _with_applicants(pages):
+    """Add the applicant's profile fields to each page of applications with one users query per page"""
+    client = get_supabase_client()
+    for page in pages:
+        talent_ids = list({row['talent_id'] for row in page if row.get('talent_id')})
+        applicants = {}
+        if talent_ids:
+            res = client.table('users').select('id,' + ','.join(APPLICANT_EXPORT_COLUMNS)).in_('id', talent_ids).execute()
+            applicants = {row['id']: row for row in res.data or []}
+        for row in page:
+            applicant = applicants.get(row.get('talent_id'), {})
+            for column in APPLICANT_EXPORT_COLUMNS:
+                row[f'applicant_{column}'] = applicant.get(column)
+        yield page
+
+
+@multilingual_bp.route('/applications/export', methods=['GET'])
+@login_required
+@admission_control('export')
+def export_applications():
+    """
+    Stream applications as NDJSON or CSV: a recruiter's applicants for one posting
+    (internship_id/job_id) or for all of their postings, or a talent's own applications.
+    """
+    try:
+        current_user = get_current_user()
+        fmt = (request.args.get('format') or 'ndjson').lower()
+        if fmt not in EXPORT_FORMATS:
+            return jsonify({'error': f"format must be one of: {', '.join(EXPORT_FORMATS)}"}), 400
+        internship_id = request.args.get('internshipId') or request.args.get('internship_id')
+        job_id = request.args.get('jobId') or request.args.get('job_id')
+        status = request.args.get('status')
+        columns = ','.join(APPLICATION_EXPORT_COLUMNS)
+
+        if current_user.get('role') == 'recruiter':
+            if internship_id:
+                _, error = _owned_posting(internship_service.get_internship_by_id, internship_id, current_user['id'])
+                scopes = [{'internship_id': internship_id}]
+            elif job_id:
+                _, error = _owned_posting(freelance_job_service.get_freelance_job_by_id, job_id, current_user['id'])
+                scopes = [{'job_id': job_id}]
+            else:
+                error = None
+                posting_ids = application_service.recruiter_posting_ids(current_user['id'])
+                scopes = ([{'internship_id': i} for i in posting_ids['internships']]
+                          + [{'job_id': j} for j in posting_ids['freelance_jobs']])
+            if error:
+                return error
+            export_columns = APPLICATION_EXPORT_COLUMNS + tuple(f'applicant_{c}' for c in APPLICANT_EXPORT_COLUMNS)
+        else:
+            scopes = [{'talent_id': current_user['id'], 'internship_id': internship_id, 'job_id': job_id}]
+            export_columns = APPLICATION_EXPORT_COLUMNS
+
+        def pages():
+            # One keyset walk per posting, so every page is an ordered (posting, id) index range
+            for scope in scopes:
+                yield from iter_keyset(lambda: application_service.applications_query(status=status, columns=columns, **scope))
+
+        rows = _with_applicants(pages()) if current_user.get('role') == 'recruiter' else pages()
+        return stream_export(rows, fmt, export_columns, 'applications')
+
+    except Exception as e:
+        logging.error(f"Error exporting applications: {str(e)}")
+        return jsonify({'error': 'Applications export failed'}), 500
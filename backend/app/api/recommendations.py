@@ -0,0 +1,72 @@
+# backend/app/api/recommendations.py
+from flask import Blueprint, request, jsonify
+from app.core.auth import login_required, get_current_user
+from app.core.recommendations import recommendation_service
+from app.core.skill_matching import skill_ranking_service
+from app.core.localization import request_language, localized_columns, localize
+from app.core.services import user_service, POSTING_LIST_COLUMNS
+import logging
+
+recommendations_bp = Blueprint('recommendations', __name__, url_prefix='/api/recommendations')
+
+MAX_K = 50
+POSTING_TABLES = {'internships': 'internships', 'freelance': 'freelance_jobs'}
+
+@recommendations_bp.route('/', methods=['GET'])
+@login_required
+def get_recommendations():
+    """Top-k open internships for the authenticated talent, served from the precomputed cache"""
+    try:
+        current_user = get_current_user()
+        if not current_user or current_user.get('role') != 'talent':
+            return jsonify({'error': 'Forbidden', 'message': 'Recommendations are available to talents only'}), 403
+
+        try:
+            k = int(request.args.get('k', 10))
+        except ValueError:
+            return jsonify({'error': 'k must be an integer'}), 400
+        k = max(1, min(k, MAX_K))
+
+        cached = recommendation_service.cached_for_talent(current_user['id'], k)
+        return jsonify({**cached, 'count': len(cached['items'])}), 200
+
+    except Exception as e:
+        logging.error(f"Error getting recommendations: {str(e)}")
+        return jsonify({'error': 'Failed to get recommendations'}), 500
+
+@recommendations_bp.route('/skills', methods=['GET'])
+@login_required
+def rank_by_skills():
+    """Open postings ranked by weighted skill overlap, with match explanations"""
+    try:
+        table = POSTING_TABLES.get(request.args.get('type', 'internships'))
+        if not table:
+            return jsonify({'error': 'type must be internships or freelance'}), 400
+        try:
+            k = max(1, min(int(request.args.get('k', 20)), MAX_K))
+            offset = max(0, int(request.args.get('offset', 0)))
+        except ValueError:
+            return jsonify({'error': 'k and offset must be integers'}), 400
+
+        # Default to the caller's own profile skills
+        skills = request.args.getlist('skills')
+        if not skills:
+            user = user_service.get_user_by_id(get_current_user()['id']) or {}
+            skills = user.get('skills') or []
+        if not skills:
+            return jsonify({'error': 'skills required'}), 400
+
+        ranked = skill_ranking_service.rank_postings(skills, table, k, offset)
+        if ranked:
+            lang = request_language()
+            columns = localized_columns(POSTING_LIST_COLUMNS[table], table, lang)
+            rows = user_service.client.table(table).select(columns).in_('id', [r['id'] for r in ranked]).execute().data or []
+            localize(rows, table, lang)
+            by_id = {str(r['id']): r for r in rows}
+            ranked = [{**by_id[r['id']], 'match': r} for r in ranked if r['id'] in by_id]
+
+        return jsonify({'items': ranked, 'count': len(ranked), 'offset': offset}), 200
+
+    except Exception as e:
+        logging.error(f"Error ranking by skills: {str(e)}")
+        return jsonify({'error': 'Failed to rank postings'}), 500
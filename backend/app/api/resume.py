@@ -0,0 +1,86 @@
+# backend/app/api/resume.py
+from flask import Blueprint, request, jsonify
+from app.core.auth import login_required, get_current_user
+from app.core.admission import admission_control
+from app.core.resume_parser import resume_parsing_service, extract_text, merge_profile_update, UnsupportedResumeError
+from app.core.services import user_service
+from app.models.user import UserUpdate
+import logging
+
+resume_bp = Blueprint('resume', __name__, url_prefix='/api')
+
+MAX_RESUME_FILES = 20
+MAX_RESUME_BYTES = 5 * 1024 * 1024
+
+def _merge(parsed_docs):
+    """Combine several parsed documents into one profile view"""
+    if len(parsed_docs) == 1:
+        return parsed_docs[0]
+    merged = dict(parsed_docs[0])
+    for field in ('skills', 'education', 'experience'):
+        merged[field] = list(dict.fromkeys(v for doc in parsed_docs for v in doc[field]))
+    merged['years_of_experience'] = max(doc['years_of_experience'] for doc in parsed_docs)
+    return merged
+
+@resume_bp.route('/resume-analyze', methods=['POST'])
+@login_required
+@admission_control('resume')
+def analyze_resume():
+    """
+    Extract skills, education and experience from resumes.
+    Accepts JSON {"text": "...", "save": bool} or multipart uploads (file/files fields, PDF, DOCX or text).
+    With save=true a talent's profile is updated with the extracted skills.
+    """
+    try:
+        current_user = get_current_user()
+        if request.files:
+            save = request.form.get('save', 'false').lower() == 'true'
+        else:
+            data = request.get_json(silent=True) or {}
+            save = bool(data.get('save'))
+        # Checked before any file is read or parsed
+        if save and (not current_user or current_user.get('role') != 'talent'):
+            return jsonify({'error': 'Forbidden', 'message': 'Only talents can save resume data to their profile'}), 403
+
+        texts = []
+        if request.files:
+            uploads = request.files.getlist('files') + request.files.getlist('file')
+            if len(uploads) > MAX_RESUME_FILES:
+                return jsonify({'error': f'At most {MAX_RESUME_FILES} files per request'}), 413
+            for upload in uploads:
+                data = upload.read(MAX_RESUME_BYTES + 1)
+                if len(data) > MAX_RESUME_BYTES:
+                    return jsonify({'error': f'{upload.filename} is larger than {MAX_RESUME_BYTES // (1024 * 1024)} MB'}), 413
+                try:
+                    texts.append(extract_text(upload.filename, data))
+                except UnsupportedResumeError as e:
+                    return jsonify({'error': 'Unsupported file', 'message': str(e)}), 415
+        elif data.get('text'):
+            texts.append(str(data['text']))
+
+        if not any(t.strip() for t in texts):
+            return jsonify({'error': 'Resume text or file is required'}), 400
+
+        parsed_docs = resume_parsing_service.parse(texts)
+        parsed = _merge(parsed_docs)
+        response = {
+            'parsed': parsed,
+            'suggestedSkills': resume_parsing_service.suggest_skills(parsed['skills']),
+            'saved': False
+        }
+        if len(parsed_docs) > 1:
+            response['items'] = parsed_docs
+
+        if save:
+            user = user_service.get_user_by_id(current_user['id']) or {}
+            update = merge_profile_update(user, parsed)
+            if update:
+                user_service.update_user(current_user['id'], UserUpdate(**update))
+            response['saved'] = True
+            response['updated_fields'] = sorted(update)
+
+        return jsonify(response), 200
+
+    except Exception as e:
+        logging.error(f"Error analyzing resume: {str(e)}")
+        return jsonify({'error': 'Failed to analyze resume'}), 500
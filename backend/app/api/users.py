@@ -3,7 +3,12 @@
 from flask import Blueprint, request, jsonify
 from app.models.user import UserCreate, UserUpdate
 from pydantic import EmailStr
-from app.core.services import user_service
+from app.core.localization import request_language, localized_columns, localize
+from app.core.services import user_service, PROFILE_COLUMNS
+from app.core.http_cache import not_modified, version_etag
+from app.core.auth import login_required, get_current_user
+from app.core.admission import admission_control
+from app.core.exports import EXPORT_FORMATS, iter_keyset, stream_export
 from pydantic import ValidationError
 import logging
 from app.core.database import get_supabase_client
@@ -57,35 +62,23 @@ def signup_user():
             return jsonify({'error': 'Password must be at least 6 characters'}), 400
 
         client = get_supabase_client()
-        # Check if user exists
-        exists = client.table('users').select('id').eq('email', email).limit(1).execute()
-        if exists.data:
-            return jsonify({'error': 'An account with this email already exists.'}), 400
         password_hash = generate_password_hash(password)
-        # Attempt Supabase insert (requires service role key or permissive RLS)
-        payload = {
-            'role': role,
-            'full_name': name or '',
-            'email': email,
-            'password_hash': password_hash
-        }
-        # Create in unified credentials table
-        res = client.table('users').insert(payload).execute()
-        created = (res.data or [{}])[0]
-        # Also ensure role-specific profile exists without password_hash
-        if created and created.get('id'):
-            profile = {
-                'id': created.get('id'),
-                'email': email,
-                'full_name': name or ''
-            }
-            target_table = 'talents' if role == 'talent' else 'recruiters'
-            try:
-                client.table(target_table).insert(profile).execute()
-            except Exception:
-                pass
-        if created and created.get('id'):
-            return jsonify({'message': 'Signup successful.', 'user': {'id': created.get('id'), 'email': email, 'role': role}}), 201
+        # One RPC inserts the credentials row and the role profile in a single transaction;
+        # duplicates are rejected by the unique constraint on users.email
+        try:
+            res = client.rpc('signup_user', {
+                'p_email': email,
+                'p_password_hash': password_hash,
+                'p_full_name': name or '',
+                'p_role': role
+            }).execute()
+        except Exception as e:
+            if getattr(e, 'code', None) == '23505':
+                return jsonify({'error': 'An account with this email already exists.'}), 400
+            raise
+        user_id = res.data
+        if user_id:
+            return jsonify({'message': 'Signup successful.', 'user': {'id': user_id, 'email': email, 'role': role}}), 201
         return jsonify({'error': 'Signup failed'}), 400
     except Exception as e:
         error_msg = str(e)
@@ -95,11 +88,16 @@ def signup_user():
 def get_user(user_id):
     """Get user by ID"""
     try:
-        user = user_service.get_user_by_id(user_id)
+        lang = request_language()
+        user = user_service.get_user_by_id(user_id, localized_columns(PROFILE_COLUMNS, 'users', lang))
         if not user:
             return jsonify({'error': 'User not found'}), 404
-            
-        return jsonify({'user': user}), 200
+
+        updated_at = user.get('updated_at')
+        cached = not_modified(version_etag('users', user_id, updated_at, lang), updated_at)
+        if cached:
+            return cached
+        return jsonify({'user': localize([user], 'users', lang)[0]}), 200
         
     except Exception as e:
         logging.error(f"Error getting user: {str(e)}")
@@ -134,12 +132,15 @@ def get_talents():
         experience_level = request.args.get('experience_level')
         availability = request.args.get('availability')
         
+        lang = request_language()
         talents = user_service.get_talents(
             skills=skills if skills else None,
             location=location,
             experience_level=experience_level,
-            availability=availability
+            availability=availability,
+            columns=localized_columns(PROFILE_COLUMNS, 'users', lang)
         )
+        localize(talents, 'users', lang)
         
         return jsonify({'talents': talents, 'count': len(talents)}), 200
         
@@ -147,6 +148,50 @@ def get_talents():
         logging.error(f"Error getting talents: {str(e)}")
         return jsonify({'error': 'Internal server error'}), 500
 
+TALENT_EXPORT_COLUMNS = ('id', 'full_name', 'email', 'location', 'current_position', 'experience_level',
+                         'years_of_experience', 'availability', 'skills', 'preferred_work_type',
+                         'professional_summary', 'linkedin_url', 'github_url', 'portfolio_website')
+
+@users_bp.route('/talents/export', methods=['GET'])
+@login_required
+@admission_control('export')
+def export_talents():
+    """Stream every talent matching the /talents filters as NDJSON or CSV (recruiters only)"""
+    try:
+        current_user = get_current_user()
+        if not current_user or current_user.get('role') != 'recruiter':
+            return jsonify({'error': 'Forbidden', 'message': 'Only recruiters can export talents'}), 403
+
+        fmt = (request.args.get('format') or 'ndjson').lower()
+        if fmt not in EXPORT_FORMATS:
+            return jsonify({'error': f"format must be one of: {', '.join(EXPORT_FORMATS)}"}), 400
+
+        skills = request.args.getlist('skills')
+        location = request.args.get('location')
+        experience_level = request.args.get('experience_level')
+        availability = request.args.get('availability')
+
+        lang = request_language()
+        columns = ','.join(TALENT_EXPORT_COLUMNS + ('full_name_source_language', 'professional_summary_source_language'))
+        if lang:
+            columns = localized_columns(columns, 'users', lang)
+
+        def query():
+            return user_service.talents_query(
+                skills=skills if skills else None,
+                location=location,
+                experience_level=experience_level,
+                availability=availability,
+                columns=columns
+            )
+
+        pages = (localize(page, 'users', lang) for page in iter_keyset(query))
+        return stream_export(pages, fmt, TALENT_EXPORT_COLUMNS, 'talents')
+
+    except Exception as e:
+        logging.error(f"Error exporting talents: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
 @users_bp.route('/search', methods=['GET'])
 def search_users():
     """Search users by email or name"""
@@ -0,0 +1,213 @@
+# backend/app/core/admission.py
+import logging
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Callable, Optional
+
+from flask import Response, jsonify, request
+
+from app.core.auth import get_current_user, get_optional_user
+from app.core.metrics import count_rejection
+
+try:
+    import redis  # type: ignore
+except ImportError:
+    redis = None  # Optional: without it every process keeps its own buckets in memory
+
+logger = logging.getLogger(__name__)
+
+# Shared buckets across workers and hosts; unset keeps them in process memory
+RATE_LIMIT_REDIS_URL = os.getenv('RATE_LIMIT_REDIS_URL') or os.getenv('REDIS_URL')
+# Reverse proxies in front of the app whose X-Forwarded-For entries can be trusted (0 = use the peer address)
+TRUSTED_PROXY_COUNT = int(os.getenv('TRUSTED_PROXY_COUNT', '0'))
+# Distinct clients kept by the in-memory limiter; the least recently seen are forgotten first
+MEMORY_LIMITER_MAX_KEYS = int(os.getenv('MEMORY_LIMITER_MAX_KEYS', '10000'))
+# After a Redis error the in-memory limiter is used for this long before Redis is tried again
+REDIS_RETRY_SECONDS = 30
+
+
+class EndpointClass:
+    """
+    Limits shared by endpoints of similar cost: a token bucket per client refilled at
+    rate_per_minute up to burst, at most `concurrency` requests running at once in each
+    process, and a cap on the request body size.
+    """
+
+    def __init__(self, name: str, rate_per_minute: float, burst: int, concurrency: int, max_body_bytes: Optional[int]):
+        prefix = name.upper()
+        self.name = name
+        self.rate = float(os.getenv(f'{prefix}_RATE_PER_MINUTE', rate_per_minute)) / 60
+        self.burst = int(os.getenv(f'{prefix}_BURST', burst))
+        self.concurrency = int(os.getenv(f'{prefix}_CONCURRENCY', concurrency))
+        self.max_body_bytes = max_body_bytes
+        self.semaphore = threading.BoundedSemaphore(self.concurrency)
+
+
+ENDPOINT_CLASSES = {
+    # Every call fans out to one provider request per target language
+    'translation': EndpointClass('translation', rate_per_minute=60, burst=60, concurrency=2, max_body_bytes=256 * 1024),
+    # CPU-bound parsing in a worker process
+    'resume': EndpointClass('resume', rate_per_minute=10, burst=5, concurrency=1, max_body_bytes=101 * 1024 * 1024),
+    # Long-running streamed table walks
+    'export': EndpointClass('export', rate_per_minute=6, burst=3, concurrency=2, max_body_bytes=None),
+}
+
+
+class MemoryRateLimiter:
+    """Token buckets in this process only; each gunicorn worker enforces its own share"""
+
+    def __init__(self, max_keys: int = MEMORY_LIMITER_MAX_KEYS):
+        self.max_keys = max_keys
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str, rate: float, burst: int, cost: int = 1) -> float:
+        """Take `cost` tokens; returns 0 when admitted, else the seconds until enough have refilled"""
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (burst, now))
+            tokens = min(burst, tokens + (now - updated) * rate)
+            wait = 0.0
+            if tokens >= cost:
+                tokens -= cost
+            else:
+                wait = (cost - tokens) / rate
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return wait
+
+
+# Refill and take atomically on the server, using the server clock so hosts never disagree
+_TOKEN_BUCKET_SCRIPT = """
+local rate, burst, cost = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(state[1]) or burst
+local updated = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - updated) * rate)
+local wait = 0
+if tokens >= cost then
+  tokens = tokens - cost
+else
+  wait = (cost - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+return tostring(wait)
+"""
+
+
+class RedisRateLimiter:
+    """Token buckets in Redis, shared by every worker; falls back to memory while Redis is unreachable"""
+
+    def __init__(self, url: str, fallback: MemoryRateLimiter):
+        self.url = url
+        self.fallback = fallback
+        self._script = None
+        self._down_until = 0.0
+
+    @property
+    def script(self):
+        # Created on first use; redis-py re-creates its connections after a fork
+        if self._script is None:
+            client = redis.Redis.from_url(self.url, socket_timeout=0.1, socket_connect_timeout=0.1)
+            self._script = client.register_script(_TOKEN_BUCKET_SCRIPT)
+        return self._script
+
+    def acquire(self, key: str, rate: float, burst: int, cost: int = 1) -> float:
+        if time.monotonic() < self._down_until:
+            return self.fallback.acquire(key, rate, burst, cost)
+        try:
+            return float(self.script(keys=[f'jobbly:ratelimit:{key}'], args=[rate, burst, cost]))
+        except redis.RedisError as e:
+            logger.warning("Rate limiting in memory for %ss, Redis failed: %s", REDIS_RETRY_SECONDS, e)
+            self._down_until = time.monotonic() + REDIS_RETRY_SECONDS
+            return self.fallback.acquire(key, rate, burst, cost)
+
+
+def _rate_limiter():
+    if RATE_LIMIT_REDIS_URL and redis is not None:
+        return RedisRateLimiter(RATE_LIMIT_REDIS_URL, MemoryRateLimiter())
+    return MemoryRateLimiter()
+
+
+rate_limiter = _rate_limiter()
+
+
+def client_key() -> str:
+    """Signed-in users are limited per account, everyone else per address"""
+    user = get_current_user() or get_optional_user()
+    if user and user.get('id'):
+        return f"user:{user['id']}"
+    route = request.access_route
+    if TRUSTED_PROXY_COUNT and len(route) >= TRUSTED_PROXY_COUNT:
+        # The entry the outermost trusted proxy saw; anything before it is client-supplied
+        return f"ip:{route[-TRUSTED_PROXY_COUNT]}"
+    return f"ip:{request.remote_addr}"
+
+
+def _reject(endpoint_class: str, reason: str, status: int, body: dict, retry_after: float = None):
+    count_rejection(endpoint_class, reason)
+    response = jsonify(body)
+    response.status_code = status
+    if retry_after is not None:
+        response.headers['Retry-After'] = str(max(1, math.ceil(retry_after)))
+    return response
+
+
+def admission_control(endpoint_class: str, cost: Callable[[], int] = None):
+    """
+    Admit a request to an endpoint of `endpoint_class` (see ENDPOINT_CLASSES) or answer at once:
+    411 for a chunked body where the size is capped, 413 for an oversized body, 503 when the class
+    is already running its maximum concurrent requests (no tokens are taken), 429 when the
+    client's bucket is empty; 429 and 503 carry Retry-After.
+    `cost` returns how many tokens the request takes (default 1), e.g. the number of texts in a batch.
+    """
+    limits = ENDPOINT_CLASSES[endpoint_class]
+
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            if limits.max_body_bytes is not None:
+                if request.content_length is None and 'chunked' in request.headers.get('Transfer-Encoding', ''):
+                    return _reject(endpoint_class, 'length_required', 411, {
+                        'error': 'Length required', 'message': 'Send the request body with a Content-Length'})
+                if (request.content_length or 0) > limits.max_body_bytes:
+                    return _reject(endpoint_class, 'payload', 413, {
+                        'error': 'Payload too large', 'message': f'Request body is limited to {limits.max_body_bytes} bytes'})
+
+            # The slot is taken first so a 503 never spends the client's tokens on a request that did not run
+            if not limits.semaphore.acquire(blocking=False):
+                return _reject(endpoint_class, 'overloaded', 503, {
+                    'error': 'Service busy', 'message': 'Too many requests in progress, retry shortly'}, 1)
+            try:
+                # A cost above the burst could never be admitted, so it is charged as a full bucket
+                tokens = min(max(1, cost()) if cost else 1, limits.burst)
+                wait = rate_limiter.acquire(f'{endpoint_class}:{client_key()}', limits.rate, limits.burst, tokens)
+            except Exception:
+                limits.semaphore.release()
+                raise
+            if wait > 0:
+                limits.semaphore.release()
+                return _reject(endpoint_class, 'rate_limited', 429, {
+                    'error': 'Too many requests', 'message': 'Rate limit exceeded, retry later'}, wait)
+
+            try:
+                rv = f(*args, **kwargs)
+            except Exception:
+                limits.semaphore.release()
+                raise
+            if isinstance(rv, Response) and rv.is_streamed:
+                # A streamed body (exports) keeps its slot until the last byte is sent
+                rv.call_on_close(limits.semaphore.release)
+            else:
+                limits.semaphore.release()
+            return rv
+        return decorated_function
+    return decorator
@@ -0,0 +1,154 @@
+# backend/app/core/async_translation.py
+import asyncio
+import html
+import logging
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.core.metrics import observe_translation
+
+logger = logging.getLogger(__name__)
+
+# Provider calls in flight at once across the whole process, however many requests fan out
+TRANSLATION_CONCURRENCY = int(os.getenv('TRANSLATION_CONCURRENCY', '8'))
+TRANSLATION_TIMEOUT = float(os.getenv('TRANSLATION_TIMEOUT', '10'))
+
+GOOGLE_WEB_URL = 'https://translate.google.com/m'
+GOOGLE_API_URL = 'https://translation.googleapis.com/language/translate/v2'
+# DeepL only covers English and Hindi of our languages
+DEEPL_LANGUAGES = {'en': 'EN', 'hi': 'HI'}
+_RESULT_CONTAINER = re.compile(r'<div class="result-container">(.*?)</div>', re.S)
+
+
+class AsyncTranslationService:
+    """
+    Non-blocking counterpart of TranslationService.translate_text: Google (the Cloud API when
+    GOOGLE_TRANSLATE_API_KEY is set, else the web endpoint deep-translator scrapes) with DeepL as
+    fallback, over one pooled httpx.AsyncClient, at most TRANSLATION_CONCURRENCY calls at a time.
+    """
+
+    def __init__(self, concurrency: int = TRANSLATION_CONCURRENCY, transport: Any = None):
+        self.google_api_key = os.getenv('GOOGLE_TRANSLATE_API_KEY')
+        self.deepl_auth_key = os.getenv('DEEPL_AUTH_KEY')
+        self.concurrency = concurrency
+        self._transport = transport
+        self._client = None
+        self._semaphore = None
+
+    @property
+    def client(self):
+        # Created on first use inside the event loop that will drive it
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                timeout=TRANSLATION_TIMEOUT,
+                limits=httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency),
+                transport=self._transport
+            )
+        return self._client
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._semaphore
+
+    def reset(self):
+        """Forget the client and semaphore, which belong to an event loop that no longer runs"""
+        self._client = None
+        self._semaphore = None
+
+    async def _google(self, text: str, source_lang: str, target_lang: str) -> str:
+        if self.google_api_key:
+            res = await self.client.post(GOOGLE_API_URL, params={'key': self.google_api_key}, data={
+                'q': text, 'source': source_lang, 'target': target_lang, 'format': 'text'
+            })
+            res.raise_for_status()
+            return res.json()['data']['translations'][0]['translatedText']
+        res = await self.client.get(GOOGLE_WEB_URL, params={'sl': source_lang, 'tl': target_lang, 'q': text})
+        res.raise_for_status()
+        match = _RESULT_CONTAINER.search(res.text)
+        if not match:
+            raise ValueError('No translation in Google response')
+        return html.unescape(match.group(1))
+
+    async def _deepl(self, text: str, source_lang: str, target_lang: str) -> str:
+        host = 'api-free.deepl.com' if self.deepl_auth_key.endswith(':fx') else 'api.deepl.com'
+        res = await self.client.post(
+            f'https://{host}/v2/translate',
+            headers={'Authorization': f'DeepL-Auth-Key {self.deepl_auth_key}'},
+            data={'text': text, 'source_lang': DEEPL_LANGUAGES[source_lang], 'target_lang': DEEPL_LANGUAGES[target_lang]}
+        )
+        res.raise_for_status()
+        return res.json()['translations'][0]['text']
+
+    def _providers(self, source_lang: str, target_lang: str):
+        yield 'google', self._google
+        if self.deepl_auth_key and source_lang in DEEPL_LANGUAGES and target_lang in DEEPL_LANGUAGES:
+            yield 'deepl', self._deepl
+
+    async def translate_text(self, text: str, source_lang: str, target_lang: str) -> str:
+        """Translate one text; like the sync service, the original text is returned on failure"""
+        if not text or source_lang == target_lang:
+            return text
+        async with self.semaphore:
+            for provider, translate in self._providers(source_lang, target_lang):
+                started = time.perf_counter()
+                try:
+                    translated = await translate(text, source_lang, target_lang)
+                    observe_translation(provider, source_lang, target_lang, time.perf_counter() - started)
+                    return translated
+                except Exception as e:
+                    observe_translation(provider, source_lang, target_lang, time.perf_counter() - started, 'error')
+                    logger.warning("%s translation failed from %s to %s: %s", provider, source_lang, target_lang, e)
+        return text
+
+    async def translate_to_languages(self, text: str, source_lang: str, target_languages: Iterable[str]) -> Dict[str, str]:
+        """{language: translation} for every target, requested concurrently; the source text keeps its own language"""
+        targets = [lang for lang in dict.fromkeys(target_languages) if lang != source_lang]
+        results = await asyncio.gather(*(self.translate_text(text, source_lang, lang) for lang in targets))
+        translations = {source_lang: text}
+        translations.update({lang: translated for lang, translated in zip(targets, results) if translated})
+        return translations
+
+    async def translate_batch(self, items: List[Tuple[str, str]], target_languages: Iterable[str]) -> List[Dict[str, str]]:
+        """translate_to_languages for many (text, source_lang) pairs at once, sharing the concurrency limit"""
+        target_languages = list(target_languages)
+        return list(await asyncio.gather(
+            *(self.translate_to_languages(text, source_lang, target_languages) for text, source_lang in items)
+        ))
+
+
+class _LoopThread:
+    """One event loop per process, on a daemon thread, that sync code hands coroutines to"""
+
+    def __init__(self):
+        self._loop = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            # A forked worker inherits the loop object but not its thread
+            if self._loop is None or self._pid != os.getpid():
+                self._loop = asyncio.new_event_loop()
+                self._pid = os.getpid()
+                async_translation_service.reset()
+                threading.Thread(target=self._loop.run_forever, name='translation-loop', daemon=True).start()
+            return self._loop
+
+    def run(self, coro, timeout: Optional[float] = None):
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop()).result(timeout)
+
+
+async_translation_service = AsyncTranslationService()
+_loop_thread = _LoopThread()
+
+
+def run_sync(coro, timeout: Optional[float] = None):
+    """Run a translation coroutine on the shared loop and wait for its result (for sync views and services)"""
+    return _loop_thread.run(coro, timeout)
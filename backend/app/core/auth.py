@@ -51,6 +51,21 @@ def login_required(f):
     
     return decorated_function
 
+def get_optional_user():
+    """
+    The caller's identity from a valid token, or None, for public endpoints that still want to
+    know who is calling (e.g. to rate-limit per user rather than per address)
+    """
+    auth_header = request.headers.get('Authorization', '')
+    token = auth_header.split(' ')[1] if auth_header.startswith('Bearer ') else request.cookies.get('auth_token')
+    if not token:
+        return None
+    try:
+        decoded_token = jwt.decode(token, os.getenv('JWT_SECRET', 'dev-secret'), algorithms=['HS256'])
+    except jwt.InvalidTokenError:
+        return None
+    return {'id': decoded_token.get('sub'), 'email': decoded_token.get('email'), 'role': decoded_token.get('role')}
+
 def get_current_user():
     """
     Helper function to get current user from request context.
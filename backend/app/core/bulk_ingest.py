@@ -0,0 +1,180 @@
+# backend/app/core/bulk_ingest.py
+import csv
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Type
+from pydantic import BaseModel, ValidationError
+from app.core.database import get_supabase_client
+from app.core.recommendations import on_postings_changed
+from app.models.internship import InternshipCreate
+from app.models.freelance_job import FreelanceJobCreate
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = int(os.getenv('BULK_INGEST_BATCH_SIZE', '500'))
+MAX_BATCH_SIZE = 1000
+
+# table name -> row model used to validate incoming rows
+INGEST_TARGETS: Dict[str, Type[BaseModel]] = {
+    'internships': InternshipCreate,
+    'freelance_jobs': FreelanceJobCreate,
+}
+TRANSLATED_FIELDS = ('title', 'description')
+
+# A single worker keeps translation provider traffic serialized and off the request thread
+_translation_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='bulk-translate')
+_pending_translations = []
+# Request threads queue batches concurrently
+_pending_lock = threading.Lock()
+
+
+def iter_rows(stream: TextIO, fmt: str) -> Iterator[Tuple[int, Any]]:
+    """Yield (line_number, raw_row) pairs from a CSV or NDJSON text stream without buffering it"""
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        for row in reader:
+            # Empty CSV cells mean "not provided" so column defaults apply
+            yield reader.line_num, {k: v for k, v in row.items() if k and v not in (None, '')}
+    elif fmt == 'ndjson':
+        for line_number, line in enumerate(stream, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield line_number, json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_number, e
+    else:
+        raise ValueError(f"Unsupported format: {fmt}")
+
+
+def _chunks(rows: Iterable[Tuple[int, Dict[str, Any]]], size: int) -> Iterator[List[Tuple[int, Dict[str, Any]]]]:
+    batch = []
+    for item in rows:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _translate_batch(table: str, rows: List[Dict[str, Any]]):
+    """Fill *_translations for a batch of freshly inserted postings"""
+    from app.core.translation import detect_and_translate
+
+    client = get_supabase_client()
+    for row in rows:
+        update = {}
+        for field in TRANSLATED_FIELDS:
+            text = row.get(field)
+            if not text:
+                continue
+            source_lang, translations = detect_and_translate(text, field)
+            update[f'{field}_source_language'] = source_lang
+            update[f'{field}_translations'] = translations
+        if not update:
+            continue
+        try:
+            client.table(table).update(update).eq('id', row['id']).execute()
+        except Exception as e:
+            logger.error(f"Bulk translation update failed for {table} {row.get('id')}: {str(e)}")
+
+
+def queue_translations(table: str, rows: List[Dict[str, Any]]):
+    """Queue translation of one inserted batch on the background worker"""
+    payload = [{'id': r['id'], **{f: r.get(f) for f in TRANSLATED_FIELDS}} for r in rows if r.get('id')]
+    if not payload:
+        return
+    future = _translation_executor.submit(_translate_batch, table, payload)
+    with _pending_lock:
+        _pending_translations[:] = [f for f in _pending_translations if not f.done()]
+        _pending_translations.append(future)
+
+
+def wait_for_translations():
+    """Block until every queued translation batch has finished (used by the CLI before exit)"""
+    with _pending_lock:
+        pending = list(_pending_translations)
+    for future in pending:
+        future.result()
+    with _pending_lock:
+        # Batches queued while waiting stay tracked
+        _pending_translations[:] = [f for f in _pending_translations if f not in pending]
+
+
+def _insert_batch(client, table: str, batch: List[Tuple[int, Dict[str, Any]]], record_error) -> List[Dict[str, Any]]:
+    """Insert a validated batch in one request; on failure retry row by row to isolate bad rows"""
+    try:
+        res = client.table(table).insert([payload for _, payload in batch]).execute()
+        return res.data or []
+    except Exception as e:
+        logger.warning(f"Batch insert into {table} failed, retrying {len(batch)} rows individually: {str(e)}")
+
+    inserted = []
+    for line, payload in batch:
+        try:
+            res = client.table(table).insert(payload).execute()
+            inserted.extend(res.data or [])
+        except Exception as e:
+            record_error(line, [{'msg': str(e)}])
+    return inserted
+
+
+def ingest_postings(stream: TextIO,
+                    fmt: str,
+                    table: str = 'internships',
+                    recruiter_id: Optional[str] = None,
+                    batch_size: int = DEFAULT_BATCH_SIZE,
+                    translate: bool = True,
+                    max_errors: int = 1000) -> Dict[str, Any]:
+    """
+    Stream postings from a CSV/NDJSON source into `table`.
+    Rows are validated one at a time and inserted in batches of `batch_size`, so memory stays
+    bounded by a single batch. Invalid rows are reported and skipped; they never abort a batch.
+    """
+    if table not in INGEST_TARGETS:
+        raise ValueError(f"Unsupported table: {table}")
+    model = INGEST_TARGETS[table]
+    batch_size = max(1, min(int(batch_size), MAX_BATCH_SIZE))
+    client = get_supabase_client()
+
+    summary = {'received': 0, 'inserted': 0, 'failed': 0, 'errors': []}
+
+    def record_error(line, details):
+        # Count every failure but keep only the first `max_errors` so dirty files stay bounded
+        summary['failed'] += 1
+        if len(summary['errors']) < max_errors:
+            summary['errors'].append({'line': line, 'errors': details})
+        else:
+            summary['errors_truncated'] = True
+
+    def valid_rows():
+        for line, raw in iter_rows(stream, fmt):
+            summary['received'] += 1
+            if isinstance(raw, Exception):
+                record_error(line, [{'msg': f'Invalid JSON: {raw}'}])
+                continue
+            if not isinstance(raw, dict):
+                record_error(line, [{'msg': 'Row must be an object'}])
+                continue
+            if recruiter_id:
+                raw['recruiter_id'] = recruiter_id
+            try:
+                row = model(**raw)
+            except ValidationError as e:
+                record_error(line, e.errors(include_url=False, include_context=False))
+                continue
+            yield line, row.model_dump(mode='json', exclude_unset=True)
+
+    for batch in _chunks(valid_rows(), batch_size):
+        inserted = _insert_batch(client, table, batch, record_error)
+        summary['inserted'] += len(inserted)
+        on_postings_changed(table, inserted)
+        if translate and inserted:
+            queue_translations(table, inserted)
+
+    return summary
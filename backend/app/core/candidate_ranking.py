@@ -0,0 +1,283 @@
+# backend/app/core/candidate_ranking.py
+import hashlib
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from app.core.database import get_supabase_client
+from app.core.embeddings import embedding_service, internship_text, talent_text, pivot_columns, TRANSLATED_TALENT_FIELDS
+from app.core.recommendations import INDEX_DIR
+from app.core.skill_matching import SkillIndex, normalize_skill, skill_vocabulary, REQUIRED_WEIGHT, PREFERRED_WEIGHT
+from app.core.vector_store import VectorStore
+
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 1000
+# Fields loaded for every talent in the pool; kept narrow (no contact details, pivot-language translation only)
+TALENT_POOL_COLUMNS = ','.join(filter(None, [
+    'id,full_name,profile_picture_url,location,current_position,professional_summary,'
+    'experience_level,years_of_experience,availability,skills,preferred_work_type,job_preferences',
+    pivot_columns(TRANSLATED_TALENT_FIELDS)
+]))
+CANDIDATE_CARD_FIELDS = ('id', 'full_name', 'profile_picture_url', 'location', 'current_position',
+                         'experience_level', 'years_of_experience', 'availability', 'skills')
+
+# Talent embeddings shared by all workers on a host; rewritten once more than this share of
+# talents (and at least STORE_MIN_OVERLAY) had to be embedded in-process
+TALENT_VECTOR_STORE = os.path.join(INDEX_DIR, 'talents')
+STORE_REWRITE_RATIO = float(os.getenv('TALENT_STORE_REWRITE_RATIO', '0.2'))
+STORE_MIN_OVERLAY = int(os.getenv('TALENT_STORE_MIN_OVERLAY', '500'))
+
+# Relative weight of each score component (normalized to sum to 1)
+CANDIDATE_WEIGHTS = {
+    'skills': float(os.getenv('CANDIDATE_WEIGHT_SKILLS', '0.4')),
+    'semantic': float(os.getenv('CANDIDATE_WEIGHT_SEMANTIC', '0.3')),
+    'experience': float(os.getenv('CANDIDATE_WEIGHT_EXPERIENCE', '0.1')),
+    'availability': float(os.getenv('CANDIDATE_WEIGHT_AVAILABILITY', '0.1')),
+    'location': float(os.getenv('CANDIDATE_WEIGHT_LOCATION', '0.1')),
+}
+
+# experience_required on internships -> minimum years; experience_level on talents -> typical years
+REQUIRED_YEARS = {'none': 0.0, '0-1': 0.0, '1-2': 1.0, '2+': 2.0}
+# Talent levels as offered in the profile and recruiter filters (fresher .. expert)
+LEVEL_YEARS = {'fresher': 0.0, 'junior': 1.0, 'mid': 2.0, 'senior': 4.0, 'expert': 6.0}
+FULL_TIME_HOURS = 30
+# talent availability -> fit for (full-time posting, part-time posting)
+AVAILABILITY_FIT = {
+    'full-time': (1.0, 1.0),
+    'part-time': (0.3, 1.0),
+    'freelance': (0.2, 0.7),
+    'contract': (0.5, 0.8),
+}
+
+
+def iter_talents(columns: str = TALENT_POOL_COLUMNS, page_size: int = PAGE_SIZE) -> Iterator[List[Dict[str, Any]]]:
+    """Yield pages of talent profiles using keyset pagination on id"""
+    client = get_supabase_client()
+    last_id = None
+    while True:
+        q = client.table('users').select(columns).eq('role', 'talent').order('id').limit(page_size)
+        if last_id:
+            q = q.gt('id', last_id)
+        rows = q.execute().data or []
+        if not rows:
+            return
+        yield rows
+        if len(rows) < page_size:
+            return
+        last_id = rows[-1]['id']
+
+
+def _city(location: Optional[str]) -> str:
+    """'Chennai, Tamil Nadu' -> 'chennai'"""
+    return (location or '').split(',')[0].strip().lower()
+
+
+class TalentPool:
+    """
+    Column-oriented snapshot of all talents for batched scoring: a SkillIndex over their skills,
+    one embedding per talent, and numpy arrays for experience, availability and location.
+
+    Embeddings come from the shared memory-mapped VectorStore when its row for a talent was
+    computed from the same text; the rest are embedded in-process (or reused from the previous
+    pool). Once too many rows are served in-process the store is rewritten.
+    """
+
+    def __init__(self, rows: List[Dict[str, Any]], embedder, previous: 'TalentPool' = None, store_path: str = None):
+        self.rows = rows
+        self.ids = [str(r['id']) for r in rows]
+        self.skills = SkillIndex(skill_vocabulary, {'skills': 1.0}).fit(rows)
+
+        texts = [talent_text(r) for r in rows]
+        self.text_keys = [hashlib.blake2b(t.encode('utf-8'), digest_size=16).hexdigest() for t in texts]
+        self.store = VectorStore.open(store_path) if store_path else None
+        store_keys = self.store.keys if self.store is not None and self.store.keys else []
+        store_rows = self.store.rows if self.store is not None else {}
+        reused = previous.overlay_by_key() if previous is not None else {}
+
+        self.store_positions, self.store_rows, self.overlay_positions = [], [], []
+        for i, (talent_id, key) in enumerate(zip(self.ids, self.text_keys)):
+            row = store_rows.get(talent_id)
+            if row is not None and row < len(store_keys) and store_keys[row] == key:
+                self.store_positions.append(i)
+                self.store_rows.append(row)
+            else:
+                self.overlay_positions.append(i)
+        self.overlay = np.zeros((len(self.overlay_positions), embedder.dimension), dtype=np.float32)
+        missing = []
+        for j, i in enumerate(self.overlay_positions):
+            vector = reused.get(self.text_keys[i])
+            if vector is None:
+                missing.append(j)
+            else:
+                self.overlay[j] = vector
+        if missing:
+            self.overlay[missing] = embedder.encode([texts[self.overlay_positions[j]] for j in missing])
+        self.embedded = len(missing)
+
+        if store_path and len(self.overlay_positions) > max(STORE_MIN_OVERLAY, STORE_REWRITE_RATIO * len(rows)):
+            self._rewrite_store(store_path)
+
+        self.years = np.array([
+            max(float(r.get('years_of_experience') or 0), LEVEL_YEARS.get((r.get('experience_level') or '').lower(), 0.0))
+            for r in rows
+        ], dtype=np.float32)
+        fits = [AVAILABILITY_FIT.get((r.get('availability') or '').lower(), (0.5, 0.5)) for r in rows]
+        self.full_time_fit = np.array([f[0] for f in fits], dtype=np.float32)
+        self.part_time_fit = np.array([f[1] for f in fits], dtype=np.float32)
+        self.cities = np.array([_city(r.get('location')) for r in rows], dtype=object)
+        self.remote_only = np.array([
+            set(r.get('preferred_work_type') or []) == {'remote'} for r in rows
+        ], dtype=bool)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _rewrite_store(self, store_path: str):
+        vectors = np.zeros((len(self.ids), self.overlay.shape[1]), dtype=np.float32)
+        if self.store_positions:
+            vectors[self.store_positions] = self.store.get(self.store_rows)
+        vectors[self.overlay_positions] = self.overlay
+        self.store = VectorStore.write(store_path, self.ids, vectors, keys=self.text_keys)
+        self.store_positions, self.store_rows = list(range(len(self.ids))), list(range(len(self.ids)))
+        self.overlay_positions = []
+        self.overlay = np.zeros((0, vectors.shape[1]), dtype=np.float32)
+        logger.info(f"Wrote talent vector store: {len(self.ids)} rows ({self.store.dtype})")
+
+    def overlay_by_key(self) -> Dict[str, np.ndarray]:
+        return {self.text_keys[i]: self.overlay[j] for j, i in enumerate(self.overlay_positions)}
+
+    def similarity(self, query: np.ndarray) -> np.ndarray:
+        """Inner product of `query` with every talent's embedding"""
+        out = np.zeros(len(self.ids), dtype=np.float32)
+        if self.store_positions:
+            out[self.store_positions] = self.store.scores(query)[self.store_rows]
+        if self.overlay_positions:
+            out[self.overlay_positions] = self.overlay @ query
+        return out
+
+
+class CandidateRankingService:
+    """Ranks talents for a posting; the talent pool is rebuilt in the background on a TTL"""
+
+    def __init__(self, embedder=None, ttl_seconds: int = None, store_path: str = None):
+        self.embedder = embedder or embedding_service
+        self.store_path = store_path or TALENT_VECTOR_STORE
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else int(os.getenv('TALENT_POOL_TTL', '300'))
+        self._pool: Optional[TalentPool] = None
+        self._built_at = 0.0
+        self._lock = threading.Lock()
+        self._rebuilding = False
+        self._rebuild_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='talent-pool')
+
+    def reinit_after_fork(self):
+        """Fresh lock and executor in a forked worker; the parent's rebuild thread does not exist here"""
+        self._lock = threading.Lock()
+        self._rebuilding = False
+        self._rebuild_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='talent-pool')
+
+    def _build(self) -> TalentPool:
+        started = time.time()
+        rows = [r for page in iter_talents() for r in page]
+        pool = TalentPool(rows, self.embedder, previous=self._pool, store_path=self.store_path)
+        self._pool, self._built_at = pool, time.time()
+        logger.info(f"Built talent pool: {len(rows)} talents ({pool.embedded} embedded) in {time.time() - started:.2f}s")
+        return pool
+
+    def _rebuild(self):
+        try:
+            self._build()
+        except Exception as e:
+            logger.error(f"Rebuilding talent pool failed: {str(e)}")
+        finally:
+            with self._lock:
+                self._rebuilding = False
+
+    def pool(self) -> TalentPool:
+        pool = self._pool
+        if pool is not None:
+            if time.time() - self._built_at >= self.ttl_seconds:
+                with self._lock:
+                    if not self._rebuilding:
+                        self._rebuilding = True
+                        self._rebuild_executor.submit(self._rebuild)
+            return pool
+        # Only the first build blocks (normally done by the warm-up before serving)
+        with self._lock:
+            pool = self._pool
+            if pool is None:
+                pool = self._build()
+        return pool
+
+    def score(self, pool: TalentPool, internship: Dict[str, Any]) -> Dict[str, np.ndarray]:
+        """Per-component scores in [0, 1] for every talent in the pool"""
+        weights = pool.skills.weighted_query([
+            (internship.get('required_skills') or [], REQUIRED_WEIGHT),
+            (internship.get('preferred_skills') or [], PREFERRED_WEIGHT),
+        ])
+        skills = pool.skills.coverage_of_query(weights)
+
+        query = self.embedder.encode([internship_text(internship)])[0]
+        semantic = np.clip(pool.similarity(query), 0.0, 1.0)
+
+        required_years = REQUIRED_YEARS.get(internship.get('experience_required') or 'none', 0.0)
+        if required_years > 0:
+            experience = np.minimum(pool.years / required_years, 1.0)
+        else:
+            experience = np.ones(len(pool), dtype=np.float32)
+
+        full_time = (internship.get('hours_per_week') or 40) >= FULL_TIME_HOURS
+        availability = pool.full_time_fit if full_time else pool.part_time_fit
+
+        work_type = internship.get('work_type') or 'onsite'
+        if work_type == 'remote':
+            location = np.ones(len(pool), dtype=np.float32)
+        else:
+            city = _city(internship.get('location'))
+            location = ((pool.cities == city) & (city != '')).astype(np.float32)
+            if work_type == 'hybrid':
+                location = np.maximum(location, 0.25)
+            location[pool.remote_only] = 0.0
+
+        return {
+            'skills': skills.astype(np.float32),
+            'semantic': semantic.astype(np.float32),
+            'experience': experience.astype(np.float32),
+            'availability': availability.astype(np.float32),
+            'location': location,
+        }
+
+    def rank_for_internship(self, internship: Dict[str, Any], limit: int = 20, offset: int = 0) -> Dict[str, Any]:
+        """Page of ranked candidates with a per-component score breakdown"""
+        return self.rank(self.pool(), internship, limit, offset)
+
+    def rank(self, pool: TalentPool, internship: Dict[str, Any], limit: int = 20, offset: int = 0) -> Dict[str, Any]:
+        if not len(pool):
+            return {'items': [], 'total': 0}
+        components = self.score(pool, internship)
+        total_weight = sum(CANDIDATE_WEIGHTS.values()) or 1.0
+        total = sum(components[name] * (weight / total_weight) for name, weight in CANDIDATE_WEIGHTS.items())
+
+        required = internship.get('required_skills') or []
+        items = []
+        for position in pool.skills.top(total, limit, offset):
+            row = pool.rows[position]
+            matched = pool.skills.explain(position, required)['matched_skills']
+            have = {normalize_skill(s) for s in row.get('skills') or []}
+            items.append({
+                **{field: row.get(field) for field in CANDIDATE_CARD_FIELDS},
+                'score': round(float(total[position]), 4),
+                'breakdown': {name: round(float(values[position]), 4) for name, values in components.items()},
+                'matched_skills': matched,
+                'missing_skills': [s for s in required if normalize_skill(s) not in have],
+            })
+        return {'items': items, 'total': int(np.count_nonzero(total > 0))}
+
+
+# Global instance
+candidate_ranking_service = CandidateRankingService()
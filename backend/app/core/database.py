@@ -1,15 +1,8 @@
 # backend/app/core/database.py
 import os
-from dotenv import load_dotenv
-try:
-    from supabase import create_client as _create_supabase_client  # type: ignore
-except Exception:
-    _create_supabase_client = None  # Supabase client is optional; configured via env + requirements
+from app.core.metrics import instrument_supabase
 
-# Load environment variables from root directory
-root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../'))
-env_path = os.path.join(root_dir, '.env')
-load_dotenv(env_path)
+# Environment variables come from the root .env, loaded once by the app package (app/__init__.py)
 
 _supabase_client = None
 
@@ -32,11 +25,16 @@ def get_supabase_client():
         or os.getenv('SUPABASE_ANON_KEY')
     )
 
-    if _create_supabase_client is None:
+    try:
+        # Imported on first use: the supabase package takes a noticeable part of a cold start
+        from supabase import create_client as _create_supabase_client  # type: ignore
+    except Exception:
+        # Supabase client is optional; configured via env + requirements
         raise ImportError("Supabase client library not installed. Add 'supabase' to requirements and pip install.")
 
     if not supabase_url or not supabase_key:
         raise RuntimeError("Supabase not configured. Set SUPABASE_URL and SUPABASE_ANON_KEY (or SERVICE_ROLE) in .env")
 
-    _supabase_client = _create_supabase_client(supabase_url, supabase_key)
+    # Query latency per table and operation is recorded for /metrics
+    _supabase_client = instrument_supabase(_create_supabase_client(supabase_url, supabase_key))
     return _supabase_client
\ No newline at end of file
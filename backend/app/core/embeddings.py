@@ -0,0 +1,155 @@
+# backend/app/core/embeddings.py
+import hashlib
+import logging
+import os
+import re
+import threading
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = 'all-MiniLM-L6-v2'
+DEFAULT_BATCH_SIZE = 64
+HASHING_DIMENSION = 384
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# Text fields are embedded in this language, read from the stored <field>_translations, so a Tamil
+# summary and an English posting land in the same space without translating at query time.
+# Multilingual models embed the source text directly; EMBEDDING_PIVOT_LANGUAGE='' forces that.
+MULTILINGUAL_MODEL = 'multilingual' in os.getenv('EMBEDDING_MODEL', DEFAULT_MODEL).lower()
+PIVOT_LANGUAGE = os.getenv('EMBEDDING_PIVOT_LANGUAGE', '' if MULTILINGUAL_MODEL else 'en')
+TRANSLATED_POSTING_FIELDS = ('title', 'description')
+TRANSLATED_TALENT_FIELDS = ('professional_summary',)
+
+
+def _join(*parts) -> str:
+    return '. '.join(p.strip() for p in parts if isinstance(p, str) and p.strip())
+
+
+def _skills(values) -> str:
+    return ', '.join(v for v in (values or []) if v)
+
+
+def pivot_columns(fields) -> str:
+    """PostgREST select entries fetching only the pivot-language translation of each field"""
+    if not PIVOT_LANGUAGE:
+        return ''
+    return ','.join(f"{field}_pivot:{field}_translations->>{PIVOT_LANGUAGE}" for field in fields)
+
+
+def _localized(row: Dict[str, Any], field: str):
+    """A text field in the pivot language when a translation is stored, else the source text"""
+    if PIVOT_LANGUAGE:
+        if row.get(f'{field}_pivot'):
+            return row[f'{field}_pivot']
+        translations = row.get(f'{field}_translations')
+        if isinstance(translations, dict) and translations.get(PIVOT_LANGUAGE):
+            return translations[PIVOT_LANGUAGE]
+    return row.get(field)
+
+
+def _preferences(values) -> str:
+    """Flatten job_preferences ({'roles': [...], 'locations': [...], ...}) into plain text"""
+    if not isinstance(values, dict):
+        return ''
+    parts = []
+    for value in values.values():
+        if isinstance(value, str):
+            parts.append(value)
+        elif isinstance(value, (list, tuple)):
+            parts.extend(v for v in value if isinstance(v, str))
+    return ', '.join(p for p in parts if p)
+
+
+def internship_text(row: Dict[str, Any]) -> str:
+    """Text embedded for a posting (internship or freelance job)"""
+    skills = (row.get('required_skills') or []) + (row.get('preferred_skills') or []) + (row.get('skills_required') or [])
+    return _join(
+        _localized(row, 'title'),
+        _localized(row, 'description'),
+        f"Skills: {_skills(skills)}" if skills else None
+    )
+
+
+def talent_text(row: Dict[str, Any]) -> str:
+    """Text embedded for a talent profile"""
+    skills = row.get('skills') or []
+    preferences = _preferences(row.get('job_preferences'))
+    return _join(
+        row.get('current_position'),
+        _localized(row, 'professional_summary'),
+        f"Skills: {_skills(skills)}" if skills else None,
+        f"Looking for: {preferences}" if preferences else None
+    )
+
+
+class EmbeddingService:
+    """
+    Sentence embeddings on CPU, computed in batches and L2-normalized so inner product equals
+    cosine similarity. The model is loaded on first use.
+
+    EMBEDDING_BACKEND=hashing swaps in a deterministic bag-of-words hashing embedder that needs
+    no model download; it is meant for offline benchmarks and local development only.
+    """
+
+    def __init__(self, model_name: str = None, backend: str = None, batch_size: int = None):
+        self.model_name = model_name or os.getenv('EMBEDDING_MODEL', DEFAULT_MODEL)
+        self.backend = (backend or os.getenv('EMBEDDING_BACKEND', 'sentence-transformers')).lower()
+        self.batch_size = batch_size or int(os.getenv('EMBEDDING_BATCH_SIZE', DEFAULT_BATCH_SIZE))
+        self._model = None
+        self._lock = threading.Lock()
+
+    @property
+    def model(self):
+        if self.backend == 'hashing':
+            return None
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    from sentence_transformers import SentenceTransformer
+                    logger.info(f"Loading embedding model {self.model_name}")
+                    self._model = SentenceTransformer(self.model_name, device='cpu')
+        return self._model
+
+    @property
+    def dimension(self) -> int:
+        if self.backend == 'hashing':
+            return HASHING_DIMENSION
+        return int(self.model.get_sentence_embedding_dimension())
+
+    def _hash_encode(self, texts: Sequence[str]) -> np.ndarray:
+        out = np.zeros((len(texts), HASHING_DIMENSION), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for token in _TOKEN_RE.findall((text or '').lower()):
+                digest = hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest()
+                bucket = int.from_bytes(digest[:4], 'little') % HASHING_DIMENSION
+                out[row, bucket] += 1.0 if digest[4] & 1 else -1.0
+        norms = np.linalg.norm(out, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return out / norms
+
+    def encode(self, texts: Sequence[str], batch_size: int = None) -> np.ndarray:
+        """Embed `texts` into a (len(texts), dimension) float32 matrix of unit vectors"""
+        texts = [t or '' for t in texts]
+        if not texts:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+        if self.backend == 'hashing':
+            return self._hash_encode(texts)
+        vectors = self.model.encode(
+            texts,
+            batch_size=batch_size or self.batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        )
+        return np.ascontiguousarray(vectors, dtype=np.float32)
+
+    def encode_rows(self, rows: List[Dict[str, Any]], text_fn) -> np.ndarray:
+        return self.encode([text_fn(r) for r in rows])
+
+
+# Global instance
+embedding_service = EmbeddingService()
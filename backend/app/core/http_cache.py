@@ -0,0 +1,131 @@
+# backend/app/core/http_cache.py
+import gzip
+import hashlib
+import os
+from datetime import datetime
+from typing import Optional
+
+from flask import g, request, make_response
+
+from app.core.metrics import count_cache
+
+try:
+    import brotli  # type: ignore
+except ImportError:
+    brotli = None  # Optional: without it responses are gzip-compressed only
+
+# Bodies smaller than this are sent as-is; compressing them costs more than it saves
+COMPRESS_MIN_SIZE = int(os.getenv('COMPRESS_MIN_SIZE', '1024'))
+GZIP_LEVEL = int(os.getenv('COMPRESS_GZIP_LEVEL', '6'))
+BROTLI_QUALITY = int(os.getenv('COMPRESS_BROTLI_QUALITY', '4'))
+COMPRESSIBLE_TYPES = ('application/json', 'application/x-ndjson', 'text/')
+CACHEABLE_METHODS = ('GET', 'HEAD')
+
+
+def version_etag(*parts) -> str:
+    """Strong ETag value from whatever identifies a representation (id, updated_at, version, ...)"""
+    return hashlib.blake2b('\x1f'.join(str(p) for p in parts).encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _parse_timestamp(value) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
+def _matches(etag: str) -> bool:
+    # A compressed representation is tagged "<etag>-gzip"/"<etag>-br"; any of them validates
+    for candidate in request.if_none_match:
+        if candidate == etag or candidate.rsplit('-', 1)[0] == etag:
+            return True
+    return request.if_none_match.star_tag
+
+
+def not_modified(etag: str = None, last_modified=None):
+    """
+    Record validators for the current GET before the body is built and return a 304 response
+    when the client's copy is still current (None otherwise). The validators are attached to
+    the full response after the request; routes that skip this get a content-hash ETag.
+    """
+    if request.method not in CACHEABLE_METHODS:
+        return None
+    g.http_etag = etag
+    g.http_last_modified = _parse_timestamp(last_modified) if last_modified else None
+    if etag and request.if_none_match:
+        fresh = _matches(etag)
+    elif g.http_last_modified and request.if_modified_since:
+        fresh = g.http_last_modified.replace(microsecond=0) <= request.if_modified_since
+    else:
+        return None
+    count_cache('http_conditional', 'hit' if fresh else 'miss')
+    if not fresh:
+        return None
+    response = make_response('', 304)
+    response.vary.add('Accept-Encoding')
+    if etag:
+        response.set_etag(etag)
+    if g.http_last_modified:
+        response.last_modified = g.http_last_modified
+    return response
+
+
+def _encoding():
+    accepted = request.accept_encodings
+    if brotli is not None and accepted['br']:
+        return 'br'
+    if accepted['gzip']:
+        return 'gzip'
+    return None
+
+
+def _compress(response):
+    if (response.direct_passthrough or response.is_streamed or 'Content-Encoding' in response.headers
+            or response.status_code < 200 or response.status_code in (204, 206, 304)
+            or not (response.mimetype or '').startswith(COMPRESSIBLE_TYPES)):
+        return
+    response.vary.add('Accept-Encoding')
+    body = response.get_data()
+    encoding = _encoding() if len(body) >= COMPRESS_MIN_SIZE else None
+    if not encoding:
+        return
+    if encoding == 'br':
+        compressed = brotli.compress(body, quality=BROTLI_QUALITY)
+    else:
+        compressed = gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    response.set_data(compressed)
+    response.headers['Content-Encoding'] = encoding
+    # Each encoding is its own representation, so it needs its own strong ETag
+    etag, weak = response.get_etag()
+    if etag:
+        response.set_etag(f'{etag}-{encoding}', weak=bool(weak))
+
+
+def _conditional_and_compress(response):
+    if request.method in CACHEABLE_METHODS and response.status_code == 200 and not response.is_streamed:
+        etag = getattr(g, 'http_etag', None)
+        last_modified = getattr(g, 'http_last_modified', None)
+        if not response.get_etag()[0]:
+            if etag:
+                response.set_etag(etag)
+            elif not response.direct_passthrough:
+                response.set_etag(hashlib.blake2b(response.get_data(), digest_size=16).hexdigest())
+        if last_modified and response.last_modified is None:
+            response.last_modified = last_modified
+        if request.if_none_match and not etag:
+            # Routes that set validators early were already counted by not_modified()
+            count_cache('http_conditional', 'hit' if _matches(response.get_etag()[0]) else 'miss')
+        if request.if_none_match and _matches(response.get_etag()[0]):
+            response.vary.add('Accept-Encoding')
+            response.status_code = 304
+            response.set_data(b'')
+            return response
+    _compress(response)
+    return response
+
+
+def init_app(app):
+    """Strong ETags, 304s and gzip/brotli compression for every response the app returns"""
+    app.after_request(_conditional_and_compress)
@@ -0,0 +1,78 @@
+# backend/app/core/localization.py
+from typing import Any, Dict, List, Optional
+
+from flask import request, after_this_request
+
+from app.core.translation import TranslationService
+
+SUPPORTED_LANGUAGES = tuple(TranslationService.TARGET_LANGUAGES)
+FALLBACK_LANGUAGE = 'en'
+
+# Text columns stored alongside a <field>_translations map and <field>_source_language, per table
+TRANSLATED_FIELDS = {
+    'internships': ('title', 'description'),
+    'freelance_jobs': ('title', 'description'),
+    'users': ('full_name', 'professional_summary'),
+}
+
+
+def _vary_on_language(response):
+    response.vary.add('Accept-Language')
+    return response
+
+
+def request_language() -> Optional[str]:
+    """
+    Language to project translated fields into: ?lang=, else the best Accept-Language match
+    (English when none of the client's languages is supported). None when the client asked
+    for neither, in which case full translation maps are returned.
+    """
+    lang = (request.args.get('lang') or '').split('-')[0].lower()
+    if lang in SUPPORTED_LANGUAGES:
+        return lang
+    # From here the header decides the representation, its absence included (full maps), so
+    # shared caches must key on it for every such response, 304s too
+    after_this_request(_vary_on_language)
+    if not request.accept_languages:
+        return None
+    return request.accept_languages.best_match(SUPPORTED_LANGUAGES) or FALLBACK_LANGUAGE
+
+
+def localized_columns(columns: str, table: str, lang: Optional[str]) -> str:
+    """
+    PostgREST select for `columns` (which must not include the translation maps) plus, per
+    translated field, only the `lang` and English entries as JSON path selects; the full maps
+    when lang is None.
+    """
+    fields = TRANSLATED_FIELDS[table]
+    if not lang:
+        extra = [f'{field}_translations' for field in fields]
+    else:
+        extra = [
+            f'{field}__{code}:{field}_translations->>{code}'
+            for field in fields for code in dict.fromkeys((lang, FALLBACK_LANGUAGE))
+        ]
+    return ','.join([columns, *extra])
+
+
+def localize(rows: List[Dict[str, Any]], table: str, lang: Optional[str]) -> List[Dict[str, Any]]:
+    """
+    Collapse the selected translations into the field itself, in order: the source text when it
+    is already in `lang`, the `lang` translation, English, then the source text.
+    `<field>_language` says which language was used.
+    """
+    if not lang:
+        return rows
+    for row in rows:
+        for field in TRANSLATED_FIELDS[table]:
+            translated = {code: row.pop(f'{field}__{code}', None) for code in dict.fromkeys((lang, FALLBACK_LANGUAGE))}
+            source_language = row.get(f'{field}_source_language')
+            for code in dict.fromkeys((lang, FALLBACK_LANGUAGE)):
+                if source_language == code and row.get(field):
+                    break
+                if translated.get(code):
+                    row[field] = translated[code]
+                    source_language = code
+                    break
+            row[f'{field}_language'] = source_language
+    return rows
@@ -0,0 +1,172 @@
+# backend/app/core/metrics.py
+import hmac
+import os
+import time
+
+from flask import Response, g, jsonify, request
+
+try:
+    import prometheus_client  # type: ignore
+    from prometheus_client import multiprocess  # type: ignore
+except ImportError:
+    prometheus_client = None  # Optional: without it nothing is recorded and /metrics answers 503
+
+# Under gunicorn every worker writes its samples to files in this directory and /metrics merges them
+MULTIPROC_DIR = os.getenv('PROMETHEUS_MULTIPROC_DIR')
+# When set, /metrics requires "Authorization: Bearer <METRICS_TOKEN>"
+METRICS_TOKEN = os.getenv('METRICS_TOKEN')
+# Without a token /metrics is refused unless this is off; on by default under gunicorn (multiprocess
+# mode), where the app faces real traffic, and off for the local dev server
+METRICS_REQUIRE_TOKEN = os.getenv('METRICS_REQUIRE_TOKEN', '1' if MULTIPROC_DIR else '0').lower() in ('1', 'true', 'yes')
+# Latency buckets in seconds, from cache-speed reads to slow translation calls
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# PostgREST builder methods that decide what kind of statement a query is
+QUERY_OPERATIONS = {'select', 'insert', 'update', 'upsert', 'delete'}
+
+if prometheus_client is not None:
+    REQUEST_LATENCY = prometheus_client.Histogram(
+        'jobbly_http_request_duration_seconds', 'Request latency by route',
+        ['method', 'route', 'status'], buckets=LATENCY_BUCKETS)
+    REQUESTS_IN_PROGRESS = prometheus_client.Gauge(
+        'jobbly_http_requests_in_progress', 'Requests being handled', ['method'], multiprocess_mode='livesum')
+    QUERY_LATENCY = prometheus_client.Histogram(
+        'jobbly_supabase_query_duration_seconds', 'Supabase (PostgREST) call latency by table and operation',
+        ['table', 'operation', 'outcome'], buckets=LATENCY_BUCKETS)
+    TRANSLATION_LATENCY = prometheus_client.Histogram(
+        'jobbly_translation_duration_seconds', 'Translation provider latency by language pair',
+        ['provider', 'source', 'target', 'outcome'], buckets=LATENCY_BUCKETS)
+    CACHE_REQUESTS = prometheus_client.Counter(
+        'jobbly_cache_requests_total', 'Cache lookups by cache and result (hit, miss, stale)', ['cache', 'result'])
+    ADMISSION_REJECTIONS = prometheus_client.Counter(
+        'jobbly_admission_rejections_total', 'Requests turned away by admission control, by endpoint class and reason',
+        ['endpoint_class', 'reason'])
+
+
+def observe_translation(provider: str, source: str, target: str, seconds: float, outcome: str = 'ok'):
+    if prometheus_client is not None:
+        TRANSLATION_LATENCY.labels(provider, source, target, outcome).observe(seconds)
+
+
+def count_cache(cache: str, result: str):
+    if prometheus_client is not None:
+        CACHE_REQUESTS.labels(cache, result).inc()
+
+
+def count_rejection(endpoint_class: str, reason: str):
+    if prometheus_client is not None:
+        ADMISSION_REJECTIONS.labels(endpoint_class, reason).inc()
+
+
+class _TimedQuery:
+    """Forwards a PostgREST builder chain and times its execute() by table and operation"""
+    __slots__ = ('_query', '_table', '_operation')
+
+    def __init__(self, query, table, operation):
+        self._query = query
+        self._table = table
+        self._operation = operation
+
+    def __getattr__(self, name):
+        attr = getattr(self._query, name)
+        if name == 'execute':
+            return self._execute
+        operation = name if name in QUERY_OPERATIONS else self._operation
+        if not callable(attr):
+            # e.g. `.not_`, a property returning the next builder
+            return _TimedQuery(attr, self._table, operation) if hasattr(attr, 'execute') else attr
+
+        def chained(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            return _TimedQuery(result, self._table, operation) if hasattr(result, 'execute') else result
+        return chained
+
+    def _execute(self):
+        started = time.perf_counter()
+        outcome = 'error'
+        try:
+            result = self._query.execute()
+            outcome = 'ok'
+            return result
+        finally:
+            QUERY_LATENCY.labels(self._table, self._operation, outcome).observe(time.perf_counter() - started)
+
+
+class _TimedClient:
+    """Supabase client whose table()/rpc() queries are timed; everything else is passed through"""
+
+    def __init__(self, client):
+        self._client = client
+
+    def table(self, name):
+        return _TimedQuery(self._client.table(name), name, 'select')
+
+    from_ = table
+
+    def rpc(self, fn, params=None, *args, **kwargs):
+        return _TimedQuery(self._client.rpc(fn, params, *args, **kwargs), fn, 'rpc')
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+def instrument_supabase(client):
+    """Wrap a Supabase client so its queries are recorded (returned unchanged without prometheus_client)"""
+    if prometheus_client is None:
+        return client
+    return _TimedClient(client)
+
+
+def _before_request():
+    g.metrics_started = time.perf_counter()
+    REQUESTS_IN_PROGRESS.labels(request.method).inc()
+
+
+def _after_request(response):
+    g.metrics_status = response.status_code
+    return response
+
+
+def _teardown_request(exc):
+    # Runs after streamed bodies finish, so exports are timed to their last byte
+    if 'metrics_started' not in g:
+        return
+    REQUESTS_IN_PROGRESS.labels(request.method).dec()
+    route = request.url_rule.rule if request.url_rule else 'unmatched'
+    status = g.get('metrics_status', 500)
+    REQUEST_LATENCY.labels(request.method, route, str(status)).observe(time.perf_counter() - g.metrics_started)
+
+
+def metrics_view():
+    """Prometheus text exposition of every metric above, merged across workers in multiprocess mode"""
+    if prometheus_client is None:
+        return jsonify({'error': 'Metrics unavailable', 'message': 'Install prometheus_client'}), 503
+    if METRICS_TOKEN:
+        if not hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {METRICS_TOKEN}'):
+            return jsonify({'error': 'Unauthorized'}), 401
+    elif METRICS_REQUIRE_TOKEN:
+        return jsonify({'error': 'Forbidden', 'message': 'Set METRICS_TOKEN to enable /metrics'}), 403
+    if MULTIPROC_DIR:
+        registry = prometheus_client.CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = prometheus_client.REGISTRY
+    return Response(prometheus_client.generate_latest(registry), headers={
+        'Content-Type': prometheus_client.CONTENT_TYPE_LATEST,
+        'Cache-Control': 'no-store',
+    })
+
+
+def mark_process_dead(pid: int):
+    """Drop a dead worker's live gauges (call from gunicorn's child_exit hook)"""
+    if prometheus_client is not None and MULTIPROC_DIR:
+        multiprocess.mark_process_dead(pid)
+
+
+def init_app(app):
+    """Request latency and in-flight metrics for every route, and the /metrics endpoint"""
+    app.add_url_rule('/metrics', 'metrics', metrics_view)
+    if prometheus_client is None:
+        return
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    app.teardown_request(_teardown_request)
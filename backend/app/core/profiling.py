@@ -0,0 +1,143 @@
+# backend/app/core/profiling.py
+import atexit
+import cProfile
+import hmac
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+
+from flask import g, request
+
+logger = logging.getLogger(__name__)
+
+# A request carrying "X-Profile-Token: <PROFILE_TOKEN>" is run under cProfile; unset disables the header
+PROFILE_TOKEN = os.getenv('PROFILE_TOKEN')
+# Share of requests whose stacks are sampled into the aggregated flame graph (0 disables sampling)
+PROFILE_SAMPLE_RATE = float(os.getenv('PROFILE_SAMPLE_RATE', '0'))
+PROFILE_INTERVAL = float(os.getenv('PROFILE_INTERVAL_MS', '5')) / 1000
+# How often the aggregated stacks are rewritten to disk
+PROFILE_FLUSH_SECONDS = float(os.getenv('PROFILE_FLUSH_SECONDS', '30'))
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(';', ':')
+
+
+class StackSampler:
+    """
+    Statistical profiler: one background thread samples the stacks of the request threads
+    registered with it every PROFILE_INTERVAL and counts them as folded stacks
+    ("route;frame;frame count" lines), the input format of flamegraph.pl and speedscope.
+    """
+
+    def __init__(self, profile_dir: str, interval: float = PROFILE_INTERVAL):
+        self.profile_dir = profile_dir
+        self.interval = interval
+        self.counts = Counter()
+        self._active = {}
+        self._lock = threading.Condition()
+        self._thread = None
+        self._flushed_at = time.monotonic()
+
+    def start(self, thread_id: int, root: str):
+        with self._lock:
+            self._active[thread_id] = root.replace(';', ':')
+            self._lock.notify()
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+                self._thread.start()
+
+    def stop(self, thread_id: int):
+        with self._lock:
+            self._active.pop(thread_id, None)
+        if time.monotonic() - self._flushed_at >= PROFILE_FLUSH_SECONDS:
+            self.flush()
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            with self._lock:
+                # Idle until a sampled request starts
+                self._lock.wait_for(lambda: self._active)
+                active = dict(self._active)
+            frames = sys._current_frames()
+            samples = []
+            for thread_id, root in active.items():
+                frame = frames.get(thread_id)
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_label(frame))
+                    frame = frame.f_back
+                samples.append(';'.join([root, *reversed(stack)]))
+            with self._lock:
+                self.counts.update(samples)
+
+    def flush(self):
+        """Rewrite the folded-stack file with everything sampled so far"""
+        with self._lock:
+            lines = [f"{stack} {count}\n" for stack, count in self.counts.items()]
+            self._flushed_at = time.monotonic()
+        if not lines:
+            return
+        # One file per worker process, so gunicorn workers never write the same file (resolved
+        # here because a preloaded app is created in the master, before the workers fork)
+        path = os.path.join(self.profile_dir, f'flamegraph-{os.getpid()}.folded')
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.writelines(lines)
+        os.replace(tmp_path, path)
+
+
+def init_app(app, log_dir: str):
+    """
+    Opt-in request profiling. Profiles go to <log_dir>/profiles: <request_id>.prof (pstats, e.g.
+    for snakeviz) for requests sent with the profile token, and flamegraph-<pid>.folded
+    aggregating the PROFILE_SAMPLE_RATE share of requests.
+    """
+    if not PROFILE_TOKEN and PROFILE_SAMPLE_RATE <= 0:
+        return
+    profile_dir = os.path.join(log_dir, 'profiles')
+    os.makedirs(profile_dir, exist_ok=True)
+    sampler = None
+    if PROFILE_SAMPLE_RATE > 0:
+        sampler = StackSampler(profile_dir)
+        atexit.register(sampler.flush)
+
+    @app.before_request
+    def _start_profiling():
+        if PROFILE_TOKEN and hmac.compare_digest(request.headers.get('X-Profile-Token', ''), PROFILE_TOKEN):
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError as e:
+                # Another profiler (or debugger) already owns the interpreter's profiling hook
+                logger.warning("Could not start profiler: %s", e)
+                return
+            g.profiler = profiler
+        elif sampler is not None and random.random() < PROFILE_SAMPLE_RATE:
+            g.profile_sampled = threading.get_ident()
+            sampler.start(g.profile_sampled, f"{request.method} {request.url_rule.rule if request.url_rule else 'unmatched'}")
+
+    @app.after_request
+    def _tag_profiled(response):
+        if 'profiler' in g:
+            response.headers['X-Profile-Id'] = g.request_id
+        return response
+
+    @app.teardown_request
+    def _stop_profiling(exc):
+        # Runs after streamed bodies finish, so the whole response is covered
+        profiler = g.pop('profiler', None)
+        if profiler is not None:
+            profiler.disable()
+            path = os.path.join(profile_dir, f'{g.request_id}.prof')
+            profiler.dump_stats(path)
+            logger.info("Profile for %s %s written to %s", request.method, request.path, path)
+        thread_id = g.pop('profile_sampled', None)
+        if thread_id is not None:
+            sampler.stop(thread_id)
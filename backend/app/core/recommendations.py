@@ -0,0 +1,628 @@
+# backend/app/core/recommendations.py
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.database import get_supabase_client
+from app.core.metrics import count_cache
+from app.core.embeddings import (
+    embedding_service, internship_text, talent_text, pivot_columns,
+    TRANSLATED_POSTING_FIELDS, TRANSLATED_TALENT_FIELDS
+)
+
+logger = logging.getLogger(__name__)
+
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../'))
+INDEX_DIR = os.getenv('RECOMMENDATION_INDEX_DIR', os.path.join(root_dir, 'data', 'recommendations'))
+
+PAGE_SIZE = 1000
+# Columns needed to embed a posting; kept narrow so index builds do not pull full rows
+# (translations are fetched for the pivot language only)
+POSTING_COLUMNS = {
+    'internships': ','.join(filter(None, [
+        'id,status,application_deadline,updated_at,title,description,required_skills,preferred_skills',
+        pivot_columns(TRANSLATED_POSTING_FIELDS)
+    ])),
+    'freelance_jobs': ','.join(filter(None, [
+        'id,status,application_deadline,updated_at,title,description,skills_required',
+        pivot_columns(TRANSLATED_POSTING_FIELDS)
+    ])),
+}
+TALENT_COLUMNS = ','.join(filter(None, [
+    'id,role,current_position,professional_summary,skills,job_preferences',
+    pivot_columns(TRANSLATED_TALENT_FIELDS)
+]))
+# Internship fields kept in each talent's cached recommendation list (enough to render a card)
+CACHED_POSTING_COLUMNS = ('id,title,company,company_logo_url,location,work_type,stipend_min,stipend_max,'
+                          'duration_months,required_skills,application_deadline,posted_at')
+
+HNSW_M = 32
+HNSW_EF_SEARCH = int(os.getenv('RECOMMENDATION_EF_SEARCH', '64'))
+# Vectors added since the last compaction are searched exactly; past this many, compact
+MAX_DELTA = int(os.getenv('RECOMMENDATION_MAX_DELTA', '5000'))
+# Compact once tombstones exceed this share of indexed vectors (and at least MIN_TOMBSTONES)
+TOMBSTONE_RATIO = float(os.getenv('RECOMMENDATION_TOMBSTONE_RATIO', '0.1'))
+MIN_TOMBSTONES = int(os.getenv('RECOMMENDATION_MIN_TOMBSTONES', '100'))
+# How often a worker pulls postings changed by other workers
+SYNC_INTERVAL = float(os.getenv('RECOMMENDATION_SYNC_INTERVAL', '30'))
+# Each sync re-reads this far behind its cursor: a transaction stamps updated_at before it commits,
+# so a slow write can become visible after later-stamped rows were already read
+SYNC_OVERLAP = float(os.getenv('RECOMMENDATION_SYNC_OVERLAP', '120'))
+# Cached per-talent lists: length, hard staleness bound, and the minimum age before new postings
+# alone mark a list stale (so a burst of postings does not refresh every talent repeatedly)
+CACHE_SIZE = int(os.getenv('RECOMMENDATION_CACHE_SIZE', '50'))
+CACHE_TTL = int(os.getenv('RECOMMENDATION_CACHE_TTL', '3600'))
+CACHE_MIN_AGE = int(os.getenv('RECOMMENDATION_CACHE_MIN_AGE', '60'))
+# Profile fields that feed talent_text; editing any of them refreshes the cached list
+RECOMMENDATION_PROFILE_FIELDS = frozenset({'skills', 'professional_summary', 'job_preferences', 'current_position'})
+
+
+def iter_open_postings(table: str, columns: str = None, page_size: int = PAGE_SIZE) -> Iterator[List[Dict[str, Any]]]:
+    """Yield pages of open postings using keyset pagination on id"""
+    client = get_supabase_client()
+    columns = columns or POSTING_COLUMNS[table]
+    last_id = None
+    while True:
+        q = client.table(table).select(columns).eq('status', 'open').order('id').limit(page_size)
+        if last_id:
+            q = q.gt('id', last_id)
+        rows = q.execute().data or []
+        if not rows:
+            return
+        yield rows
+        if len(rows) < page_size:
+            return
+        last_id = rows[-1]['id']
+
+
+def _timestamp(value) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _cursor_key(cursor: Tuple[str, str]) -> Tuple[float, str]:
+    return (_timestamp(cursor[0]) or 0.0, cursor[1])
+
+
+def is_indexable(row: Dict[str, Any], now: float = None) -> bool:
+    """Open and still accepting applications"""
+    if row.get('status', 'open') != 'open':
+        return False
+    deadline = _timestamp(row.get('application_deadline'))
+    return deadline is None or deadline > (now or time.time())
+
+
+class IndexSnapshot:
+    """
+    Immutable view of the index that readers search against. `ids` and `delta` are
+    append-only buffers shared with newer snapshots, so readers only look at the first
+    `size` ids and the first `size - base_size` delta rows.
+    """
+
+    __slots__ = ('version', 'base', 'base_size', 'ids', 'size', 'delta', 'tombstones')
+
+    def __init__(self, version, base, base_size, ids, size, delta, tombstones):
+        self.version = version
+        self.base = base
+        self.base_size = base_size
+        self.ids = ids
+        self.size = size
+        self.delta = delta
+        self.tombstones = tombstones
+
+    @property
+    def live(self) -> int:
+        return self.size - len(self.tombstones)
+
+
+class RecommendationIndex:
+    """
+    Approximate nearest-neighbour index over embeddings of the open postings in one table.
+
+    The compacted part is a FAISS HNSW (inner product) index that is never mutated after it is
+    published. New postings are appended to a delta buffer searched exactly; closed or expired
+    postings are tombstoned by position. Each change publishes a new IndexSnapshot with a higher
+    `version`, so a search always sees one consistent state. Once the delta or the tombstones
+    grow past their thresholds, a background compaction rebuilds the HNSW base.
+    """
+
+    def __init__(self, table: str = 'internships', embedder=None, index_dir: str = None):
+        self.table = table
+        self.embedder = embedder or embedding_service
+        self.index_dir = index_dir or INDEX_DIR
+        self._snapshot: Optional[IndexSnapshot] = None
+        self._positions: Dict[str, int] = {}
+        self._deadlines: Dict[str, float] = {}
+        self._sync_cursor: Optional[Tuple[str, str]] = None
+        # updated_at of postings applied within the overlap window, so re-reads skip re-embedding
+        self._applied: Dict[str, str] = {}
+        self._last_sync = 0.0
+        self._write_lock = threading.RLock()
+        self._build_lock = threading.Lock()
+        self._compacting = False
+        self._syncing = False
+        self._sync_lock = threading.Lock()
+        # When postings were last added or removed (compaction does not count)
+        self.changed_at = 0.0
+
+    # -- state ---------------------------------------------------------------------------
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version if self._snapshot else 0
+
+    @property
+    def ready(self) -> bool:
+        return self._snapshot is not None
+
+    def snapshot(self) -> IndexSnapshot:
+        self.ensure_ready()
+        return self._snapshot
+
+    def _new_base(self, vectors: np.ndarray):
+        import faiss
+        index = faiss.IndexHNSWFlat(self.embedder.dimension, HNSW_M, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efSearch = HNSW_EF_SEARCH
+        if len(vectors):
+            index.add(np.ascontiguousarray(vectors, dtype=np.float32))
+        return index
+
+    def _publish(self, base, base_size, ids, size, delta, tombstones):
+        self._snapshot = IndexSnapshot(self.version + 1, base, base_size, ids, size, delta, frozenset(tombstones))
+
+    # -- build / persist -----------------------------------------------------------------
+
+    def build(self, pages: Optional[Iterator[List[Dict[str, Any]]]] = None) -> int:
+        """(Re)build the index from all open postings, embedding one page at a time"""
+        started = time.time()
+        now = time.time()
+        base = self._new_base(np.zeros((0, self.embedder.dimension), dtype=np.float32))
+        ids: List[str] = []
+        deadlines: Dict[str, float] = {}
+        applied: Dict[str, str] = {}
+        cursor = None
+        for page in pages if pages is not None else iter_open_postings(self.table):
+            page = [r for r in page if is_indexable(r, now)]
+            if not page:
+                continue
+            base.add(self.embedder.encode_rows(page, internship_text))
+            for row in page:
+                ids.append(str(row['id']))
+                deadline = _timestamp(row.get('application_deadline'))
+                if deadline:
+                    deadlines[str(row['id'])] = deadline
+                if row.get('updated_at'):
+                    cursor = max(cursor or ('', ''), (str(row['updated_at']), str(row['id'])))
+                    applied[str(row['id'])] = str(row['updated_at'])
+        with self._write_lock:
+            self._positions = {posting_id: i for i, posting_id in enumerate(ids)}
+            self._deadlines = deadlines
+            self._sync_cursor = cursor
+            horizon = _cursor_key(cursor)[0] - SYNC_OVERLAP if cursor else 0
+            self._applied = {k: v for k, v in applied.items() if (_timestamp(v) or 0) >= horizon}
+            self._last_sync = time.time()
+            delta = np.zeros((MAX_DELTA, self.embedder.dimension), dtype=np.float32)
+            self._publish(base, len(ids), ids, len(ids), delta, ())
+        logger.info(f"Built {self.table} recommendation index: {len(ids)} vectors in {time.time() - started:.1f}s")
+        return len(ids)
+
+    @property
+    def _paths(self) -> Tuple[str, str]:
+        base = os.path.join(self.index_dir, self.table)
+        return base + '.faiss', base + '.meta.json'
+
+    def save(self):
+        """Persist a compacted copy of the current state"""
+        import faiss
+        with self._write_lock:
+            snap = self._snapshot
+            live = [p for p in range(snap.size) if p not in snap.tombstones]
+            if snap.size == snap.base_size and not snap.tombstones:
+                base = snap.base
+            else:
+                base = self._new_base(self._vectors(snap, live))
+            meta = {
+                'ids': [snap.ids[p] for p in live],
+                'deadlines': self._deadlines,
+                'sync_cursor': self._sync_cursor,
+            }
+        index_path, meta_path = self._paths
+        os.makedirs(self.index_dir, exist_ok=True)
+        faiss.write_index(base, index_path + '.tmp')
+        with open(meta_path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        # Rename last so a concurrent loader never sees a half-written pair
+        os.replace(index_path + '.tmp', index_path)
+        os.replace(meta_path + '.tmp', meta_path)
+
+    def load(self) -> bool:
+        import faiss
+        index_path, meta_path = self._paths
+        if not (os.path.exists(index_path) and os.path.exists(meta_path)):
+            return False
+        # FAISS reads an HNSW index into process memory (IO_FLAG_MMAP is ignored for it); under gunicorn
+        # --preload the master loads it during warm-up and workers share it copy-on-write until they compact
+        base = faiss.read_index(index_path)
+        base.hnsw.efSearch = HNSW_EF_SEARCH
+        with open(meta_path, encoding='utf-8') as f:
+            meta = json.load(f)
+        ids = meta['ids']
+        with self._write_lock:
+            self._positions = {posting_id: i for i, posting_id in enumerate(ids)}
+            self._deadlines = meta.get('deadlines') or {}
+            self._sync_cursor = tuple(meta['sync_cursor']) if meta.get('sync_cursor') else None
+            delta = np.zeros((MAX_DELTA, self.embedder.dimension), dtype=np.float32)
+            self._publish(base, len(ids), ids, len(ids), delta, ())
+        # The file may predate recent postings; catch up from the database
+        self.sync(force=True)
+        return True
+
+    def ensure_ready(self):
+        """Load the persisted index, or build and persist it on first use"""
+        if self._snapshot is not None:
+            return
+        with self._build_lock:
+            if self._snapshot is not None:
+                return
+            if not self.load():
+                self.build()
+                self.save()
+
+    # -- incremental maintenance ---------------------------------------------------------
+
+    def upsert(self, rows: List[Dict[str, Any]]):
+        """Index new or edited postings; rows that are no longer open are tombstoned instead"""
+        if not rows or not self.ready:
+            return
+        # The last version of a posting wins if it appears more than once
+        rows = list({str(r['id']): r for r in rows}.values())
+        now = time.time()
+        live = [r for r in rows if is_indexable(r, now)]
+        dead = [str(r['id']) for r in rows if not is_indexable(r, now)]
+        vectors = self.embedder.encode_rows(live, internship_text) if live else None
+        with self._write_lock:
+            snap = self._snapshot
+            ids, delta, size = snap.ids, snap.delta, snap.size
+            tombstones = set(snap.tombstones)
+            for posting_id in dead + [str(r['id']) for r in live]:
+                old = self._positions.pop(posting_id, None)
+                if old is not None:
+                    tombstones.add(old)
+                self._deadlines.pop(posting_id, None)
+            if live:
+                needed = size - snap.base_size + len(live)
+                if needed > len(delta):
+                    # Readers keep the old buffer; newer snapshots use the grown copy
+                    grown = np.zeros((max(needed, 2 * len(delta)), delta.shape[1]), dtype=np.float32)
+                    grown[:size - snap.base_size] = delta[:size - snap.base_size]
+                    delta = grown
+                delta[size - snap.base_size:needed] = vectors
+                for row in live:
+                    posting_id = str(row['id'])
+                    ids.append(posting_id)
+                    self._positions[posting_id] = size
+                    deadline = _timestamp(row.get('application_deadline'))
+                    if deadline:
+                        self._deadlines[posting_id] = deadline
+                    size += 1
+            self._publish(snap.base, snap.base_size, ids, size, delta, tombstones)
+            self.changed_at = time.time()
+        self._maybe_compact()
+
+    def remove(self, posting_ids: List[str]):
+        """Tombstone postings (closed, paused, deleted)"""
+        if not self.ready:
+            return
+        with self._write_lock:
+            snap = self._snapshot
+            tombstones = set(snap.tombstones)
+            for posting_id in map(str, posting_ids):
+                old = self._positions.pop(posting_id, None)
+                if old is not None:
+                    tombstones.add(old)
+                self._deadlines.pop(posting_id, None)
+            if len(tombstones) != len(snap.tombstones):
+                self._publish(snap.base, snap.base_size, snap.ids, snap.size, snap.delta, tombstones)
+                self.changed_at = time.time()
+        self._maybe_compact()
+
+    def expire(self, now: float = None):
+        """Tombstone postings whose application_deadline has passed"""
+        now = now or time.time()
+        expired = [posting_id for posting_id, deadline in list(self._deadlines.items()) if deadline <= now]
+        if expired:
+            self.remove(expired)
+
+    def sync(self, force: bool = False):
+        """
+        Apply postings changed (by any worker) since the last sync, keyset-paged on (updated_at, id)
+        from SYNC_OVERLAP before the cursor; rows already applied at the same updated_at are skipped.
+        """
+        if self._claim_sync(force):
+            self._sync()
+
+    def _claim_sync(self, force: bool = False) -> bool:
+        """Mark a sync as running if one is due and none is; the caller must then run _sync()"""
+        with self._sync_lock:
+            if not self.ready or self._syncing or (not force and time.time() - self._last_sync < SYNC_INTERVAL):
+                return False
+            self._syncing = True
+            return True
+
+    def _sync(self):
+        try:
+            self._last_sync = time.time()
+            client = get_supabase_client()
+            since = None
+            if self._sync_cursor and _timestamp(self._sync_cursor[0]):
+                since = _timestamp(self._sync_cursor[0]) - SYNC_OVERLAP
+            page_cursor = None
+            while True:
+                q = client.table(self.table).select(POSTING_COLUMNS[self.table]).order('updated_at').order('id').limit(PAGE_SIZE)
+                if page_cursor:
+                    updated_at, last_id = page_cursor
+                    q = q.or_(f'updated_at.gt."{updated_at}",and(updated_at.eq."{updated_at}",id.gt.{last_id})')
+                elif since is not None:
+                    q = q.gte('updated_at', datetime.fromtimestamp(since, timezone.utc).isoformat())
+                rows = q.execute().data or []
+                if not rows:
+                    break
+                fresh = [r for r in rows if self._applied.get(str(r['id'])) != str(r.get('updated_at'))]
+                self.upsert(fresh)
+                for row in fresh:
+                    if row.get('updated_at'):
+                        self._applied[str(row['id'])] = str(row['updated_at'])
+                if rows[-1].get('updated_at'):
+                    page_cursor = (str(rows[-1]['updated_at']), str(rows[-1]['id']))
+                    # Rows in the overlap lie behind the cursor; it only moves forward
+                    if self._sync_cursor is None or _cursor_key(page_cursor) > _cursor_key(self._sync_cursor):
+                        self._sync_cursor = page_cursor
+                if len(rows) < PAGE_SIZE:
+                    break
+            horizon = (_timestamp(self._sync_cursor[0]) or 0) - SYNC_OVERLAP if self._sync_cursor else 0
+            self._applied = {k: v for k, v in self._applied.items() if (_timestamp(v) or 0) >= horizon}
+            self.expire()
+        except Exception as e:
+            logger.error(f"Recommendation index sync failed for {self.table}: {str(e)}")
+        finally:
+            self._syncing = False
+
+    def _maybe_compact(self):
+        snap = self._snapshot
+        too_many_tombstones = len(snap.tombstones) >= max(MIN_TOMBSTONES, TOMBSTONE_RATIO * snap.size)
+        if (too_many_tombstones or snap.size - snap.base_size >= MAX_DELTA) and not self._compacting:
+            self._compacting = True
+            threading.Thread(target=self.compact, name=f'compact-{self.table}', daemon=True).start()
+
+    def _vectors(self, snap: IndexSnapshot, positions: List[int]) -> np.ndarray:
+        out = np.zeros((len(positions), self.embedder.dimension), dtype=np.float32)
+        for row, position in enumerate(positions):
+            if position < snap.base_size:
+                out[row] = snap.base.reconstruct(position)
+            else:
+                out[row] = snap.delta[position - snap.base_size]
+        return out
+
+    def compact(self):
+        """Rebuild the HNSW base from live vectors, then replay changes made meanwhile"""
+        try:
+            started = time.time()
+            snap = self._snapshot
+            live = [p for p in range(snap.size) if p not in snap.tombstones]
+            base = self._new_base(self._vectors(snap, live))
+            with self._write_lock:
+                current = self._snapshot
+                remap = {old: new for new, old in enumerate(live)}
+                ids = [snap.ids[p] for p in live]
+                tombstones = {remap[p] for p in current.tombstones if p in remap}
+                # Postings appended while the base was being rebuilt become the new delta
+                appended = [p for p in range(snap.size, current.size) if p not in current.tombstones]
+                delta = np.zeros((max(MAX_DELTA, len(appended)), self.embedder.dimension), dtype=np.float32)
+                if appended:
+                    delta[:len(appended)] = self._vectors(current, appended)
+                ids.extend(current.ids[p] for p in appended)
+                self._positions = {posting_id: i for i, posting_id in enumerate(ids) if i not in tombstones}
+                self._publish(base, len(live), ids, len(ids), delta, tombstones)
+            logger.info(f"Compacted {self.table} recommendation index to {len(live)} vectors in {time.time() - started:.1f}s")
+        except Exception as e:
+            logger.error(f"Recommendation index compaction failed for {self.table}: {str(e)}")
+        finally:
+            self._compacting = False
+        # Changes made while rebuilding may already warrant another pass
+        self._maybe_compact()
+
+    # -- search --------------------------------------------------------------------------
+
+    def search(self, vector: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        """Return up to k (posting_id, cosine_similarity) pairs, best first"""
+        snap = self.snapshot()
+        if time.time() - self._last_sync >= SYNC_INTERVAL and self._claim_sync():
+            _maintenance_executor.submit(self._sync)
+        if snap.live <= 0:
+            return []
+        query = np.ascontiguousarray(vector, dtype=np.float32).reshape(1, -1)
+        now = time.time()
+        deadlines = self._deadlines
+        candidates: List[Tuple[float, int]] = []
+        if snap.base_size:
+            fetch = min(snap.base_size, k + len(snap.tombstones))
+            scores, positions = snap.base.search(query, fetch)
+            candidates.extend((float(s), int(p)) for s, p in zip(scores[0], positions[0]) if p >= 0)
+        delta_size = snap.size - snap.base_size
+        if delta_size:
+            scores = snap.delta[:delta_size] @ query[0]
+            candidates.extend((float(s), snap.base_size + i) for i, s in enumerate(scores))
+        candidates.sort(reverse=True)
+        results = []
+        for score, position in candidates:
+            if position in snap.tombstones:
+                continue
+            posting_id = snap.ids[position]
+            deadline = deadlines.get(posting_id)
+            if deadline is not None and deadline <= now:
+                continue
+            results.append((posting_id, score))
+            if len(results) >= k:
+                break
+        return results
+
+
+_maintenance_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='recommendation-index')
+
+
+def on_postings_changed(table: str, rows: List[Dict[str, Any]]):
+    """Queue incremental index maintenance after postings are created or updated"""
+    index = posting_indexes.get(table)
+    if index is None or not index.ready or not rows:
+        return
+    _maintenance_executor.submit(index.upsert, rows)
+
+
+class RecommendationService:
+    """
+    Top-k open internships for a talent by embedding similarity.
+
+    Dashboard reads go through `cached_for_talent`, a single key lookup on talent_recommendations.
+    A cached list is stale after CACHE_TTL, or once postings changed after it was computed (and it is
+    at least CACHE_MIN_AGE old); stale lists are still served while a background refresh runs.
+    """
+
+    def __init__(self, index: RecommendationIndex = None):
+        self.index = index or RecommendationIndex('internships')
+        self._client = None
+        self._refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='recommendation-cache')
+        self._pending = set()
+        self._pending_lock = threading.Lock()
+        self._postings_changed_at = 0.0
+        self._postings_checked_at = 0.0
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = get_supabase_client()
+        return self._client
+
+    def recommend_for_talent(self, talent_id: str, k: int = 10, columns: str = '*') -> List[Dict[str, Any]]:
+        res = self.client.table('users').select(TALENT_COLUMNS).eq('id', talent_id).limit(1).execute()
+        talent = (res.data or [None])[0]
+        if not talent:
+            return []
+        vector = self.index.embedder.encode([talent_text(talent)])[0]
+        # Over-fetch a little in case a posting closed after its last index update
+        hits = self.index.search(vector, k + 5)
+        if not hits:
+            return []
+        scores = dict(hits)
+        rows = self.client.table('internships').select(columns).in_('id', list(scores)).eq('status', 'open').execute().data or []
+        for row in rows:
+            row['match_score'] = round(scores.get(str(row['id']), 0.0), 4)
+        rows.sort(key=lambda r: r['match_score'], reverse=True)
+        return rows[:k]
+
+    def refresh_talent(self, talent_id: str) -> List[Dict[str, Any]]:
+        """Recompute and store a talent's cached recommendation list"""
+        items = self.recommend_for_talent(talent_id, CACHE_SIZE, CACHED_POSTING_COLUMNS)
+        self.client.table('talent_recommendations').upsert({
+            'talent_id': talent_id,
+            'items': items,
+            'computed_at': datetime.now(timezone.utc).isoformat()
+        }).execute()
+        return items
+
+    def _refresh_in_background(self, talent_id: str):
+        try:
+            self.refresh_talent(talent_id)
+        except Exception as e:
+            logger.error(f"Failed to refresh recommendations for {talent_id}: {str(e)}")
+        finally:
+            with self._pending_lock:
+                self._pending.discard(talent_id)
+
+    def schedule_refresh(self, talent_id: str):
+        """Queue a background refresh; repeated requests for a talent already queued are dropped"""
+        with self._pending_lock:
+            if talent_id in self._pending:
+                return
+            self._pending.add(talent_id)
+        self._refresh_executor.submit(self._refresh_in_background, talent_id)
+
+    def postings_changed_at(self) -> float:
+        """
+        When any worker last wrote an internship (max updated_at), re-read at most every SYNC_INTERVAL.
+        The index's own changed_at only moves in workers that search, so cache-only workers need this.
+        """
+        now = time.time()
+        if now - self._postings_checked_at >= SYNC_INTERVAL:
+            self._postings_checked_at = now
+            try:
+                res = self.client.table('internships').select('updated_at').order('updated_at', desc=True).limit(1).execute()
+                self._postings_changed_at = _timestamp((res.data or [{}])[0].get('updated_at')) or 0.0
+            except Exception as e:
+                logger.error(f"Failed to read latest internship change: {str(e)}")
+        return max(self._postings_changed_at, self.index.changed_at)
+
+    def is_stale(self, computed_at, now: float = None) -> bool:
+        computed = _timestamp(computed_at)
+        if computed is None:
+            return True
+        age = (now or time.time()) - computed
+        return age >= CACHE_TTL or (age >= CACHE_MIN_AGE and self.postings_changed_at() > computed)
+
+    def cached_for_talent(self, talent_id: str, k: int = 10) -> Dict[str, Any]:
+        """A talent's precomputed recommendations, computed inline only on first use"""
+        res = self.client.table('talent_recommendations').select('items,computed_at').eq('talent_id', talent_id).limit(1).execute()
+        cached = (res.data or [None])[0]
+        if cached is None:
+            count_cache('talent_recommendations', 'miss')
+            items = self.refresh_talent(talent_id)
+            return {'items': items[:k], 'computed_at': datetime.now(timezone.utc).isoformat(), 'stale': False}
+        stale = self.is_stale(cached['computed_at'])
+        count_cache('talent_recommendations', 'stale' if stale else 'hit')
+        if stale:
+            self.schedule_refresh(talent_id)
+        return {'items': (cached['items'] or [])[:k], 'computed_at': cached['computed_at'], 'stale': stale}
+
+
+def on_talent_profile_changed(talent_id: str, changed_fields):
+    """Refresh a talent's cached recommendations when the fields they are computed from change"""
+    if RECOMMENDATION_PROFILE_FIELDS.intersection(changed_fields):
+        recommendation_service.schedule_refresh(talent_id)
+
+
+def reinit_after_fork():
+    """
+    Give a forked worker fresh locks, flags and executors: threads started in the parent (sync,
+    compaction, refreshes) do not exist in the child and may have left locks held.
+    """
+    global _maintenance_executor
+    _maintenance_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='recommendation-index')
+    for index in posting_indexes.values():
+        index._write_lock = threading.RLock()
+        index._build_lock = threading.Lock()
+        index._compacting = False
+        index._syncing = False
+        index._sync_lock = threading.Lock()
+    recommendation_service._refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='recommendation-cache')
+    recommendation_service._pending = set()
+    recommendation_service._pending_lock = threading.Lock()
+
+
+# Global instances
+internship_index = RecommendationIndex('internships')
+freelance_job_index = RecommendationIndex('freelance_jobs')
+posting_indexes = {'internships': internship_index, 'freelance_jobs': freelance_job_index}
+recommendation_service = RecommendationService(internship_index)
@@ -0,0 +1,245 @@
+# backend/app/core/resume_parser.py
+import hashlib
+import io
+import logging
+import multiprocessing
+import os
+import re
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+
+from app.core.skill_matching import SKILL_ALIASES, normalize_skill, skill_vocabulary, skill_ranking_service
+
+logger = logging.getLogger(__name__)
+
+SPACY_MODEL = os.getenv('RESUME_SPACY_MODEL', 'en_core_web_sm')
+# Parser processes per API worker process: every gunicorn worker (WEB_CONCURRENCY of them) has its
+# own pool, each process loading the spaCy model, so by default they split the cores between them
+RESUME_WORKERS = int(os.getenv('RESUME_WORKERS', str(max(1, (os.cpu_count() or 1) // int(os.getenv('WEB_CONCURRENCY', '1'))))))
+RESUME_BATCH_SIZE = int(os.getenv('RESUME_BATCH_SIZE', '16'))
+MAX_RESUME_CHARS = int(os.getenv('MAX_RESUME_CHARS', '100000'))
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx', '.txt', '.md', '.rtf')
+
+_EMAIL_RE = re.compile(r'[\w.+-]+@[\w-]+(?:\.[\w-]+)+')
+_PHONE_RE = re.compile(r'(?:\+?\d[\d\s().-]{8,}\d)')
+_DEGREE_RE = re.compile(
+    r'\b(ph\.?\s?d|doctorate|m\.?\s?tech|m\.?\s?e\b|m\.?\s?sc|mca|mba|master\'?s?|'
+    r'b\.?\s?tech|b\.?\s?e\b|b\.?\s?sc|bca|b\.?\s?com|bachelor\'?s?|diploma|'
+    r'high school|higher secondary|hsc|ssc)\b',
+    re.IGNORECASE
+)
+_DATE_RANGE_RE = re.compile(
+    r'\b((?:19|20)\d{2})\s*(?:-|–|—|to)\s*((?:19|20)\d{2}|present|current|now|date)\b',
+    re.IGNORECASE
+)
+_YEARS_RE = re.compile(r'\b(\d{1,2})\+?\s*(?:years?|yrs?)\b(?:\s+of)?\s+(?:\w+\s+)?experience', re.IGNORECASE)
+
+# Degree keyword -> internships.education_level
+EDUCATION_LEVELS = [
+    ('masters', re.compile(r'ph\.?\s?d|doctorate|m\.?\s?tech|m\.?\s?e\b|m\.?\s?sc|mca|mba|master', re.IGNORECASE)),
+    ('bachelors', re.compile(r'b\.?\s?tech|b\.?\s?e\b|b\.?\s?sc|bca|b\.?\s?com|bachelor', re.IGNORECASE)),
+    ('diploma', re.compile(r'diploma', re.IGNORECASE)),
+    ('high-school', re.compile(r'high school|higher secondary|hsc|ssc', re.IGNORECASE)),
+]
+
+
+class UnsupportedResumeError(ValueError):
+    """The upload cannot be turned into text (format unknown, or its parser is not installed)"""
+
+
+def extract_text(filename: str, data: bytes) -> str:
+    """Plain text from an uploaded PDF, DOCX or text file"""
+    ext = os.path.splitext((filename or '').lower())[1]
+    if ext == '.pdf':
+        try:
+            from pypdf import PdfReader  # type: ignore
+        except ImportError:
+            raise UnsupportedResumeError('PDF parsing requires the pypdf package')
+        reader = PdfReader(io.BytesIO(data))
+        return '\n'.join(page.extract_text() or '' for page in reader.pages)
+    if ext == '.docx':
+        try:
+            import docx  # type: ignore  # python-docx
+        except ImportError:
+            raise UnsupportedResumeError('DOCX parsing requires the python-docx package')
+        document = docx.Document(io.BytesIO(data))
+        return '\n'.join(p.text for p in document.paragraphs)
+    if ext in SUPPORTED_EXTENSIONS or not ext:
+        return data.decode('utf-8', errors='replace')
+    raise UnsupportedResumeError(f"Unsupported resume format: {ext}")
+
+
+# --- worker process side ---------------------------------------------------------------------
+
+_nlp = None
+_matchers: Dict[str, Any] = {}
+
+
+def _load_nlp():
+    global _nlp
+    if _nlp is None:
+        import spacy
+        try:
+            _nlp = spacy.load(SPACY_MODEL, disable=['lemmatizer', 'textcat'])
+        except OSError:
+            # Model package not installed: tokenization and phrase matching still work
+            logger.warning(f"spaCy model {SPACY_MODEL} not installed, falling back to a blank English pipeline")
+            _nlp = spacy.blank('en')
+    return _nlp
+
+
+def _matcher(terms_key: str, terms: Sequence[str]):
+    matcher = _matchers.get(terms_key)
+    if matcher is None:
+        from spacy.matcher import PhraseMatcher
+        nlp = _load_nlp()
+        matcher = PhraseMatcher(nlp.vocab, attr='LOWER')
+        matcher.add('SKILL', list(nlp.tokenizer.pipe(terms)))
+        _matchers.clear()
+        _matchers[terms_key] = matcher
+    return matcher
+
+
+def _years_of_experience(text: str, experience: List[str]) -> int:
+    """Largest of any stated 'N years of experience' and the calendar years covered by job entries"""
+    stated = [int(m.group(1)) for m in _YEARS_RE.finditer(text)]
+    spans = []
+    for m in (m for line in experience for m in _DATE_RANGE_RE.finditer(line)):
+        start = int(m.group(1))
+        end = int(m.group(2)) if m.group(2).isdigit() else None
+        spans.append((start, end))
+    if spans:
+        from datetime import date
+        this_year = date.today().year
+        years = set()
+        for start, end in spans:
+            years.update(range(start, (end or this_year)))
+        stated.append(len(years))
+    return max(stated) if stated else 0
+
+
+def _parse_doc(doc, text: str, matcher) -> Dict[str, Any]:
+    skills = []
+    seen = set()
+    for _, start, end in matcher(doc):
+        skill = normalize_skill(doc[start:end].text)
+        if skill not in seen:
+            seen.add(skill)
+            skills.append(skill)
+
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    name = next((ent.text for ent in doc.ents if ent.label_ == 'PERSON'), None) if doc.has_annotation('ENT_IOB') else None
+    if not name:
+        name = next((line for line in lines[:5] if not _EMAIL_RE.search(line) and len(line.split()) <= 5), '')
+
+    education = [line[:200] for line in lines if _DEGREE_RE.search(line)]
+    education_level = next((level for level, pattern in EDUCATION_LEVELS if any(pattern.search(e) for e in education)), None)
+    experience = [line[:200] for line in lines if _DATE_RANGE_RE.search(line) and not _DEGREE_RE.search(line)]
+    email = _EMAIL_RE.search(text)
+    # Date ranges ("2019 - 2021") also look like phone numbers; require 10+ digits
+    phone = next((m.group(0).strip() for m in _PHONE_RE.finditer(text) if sum(c.isdigit() for c in m.group(0)) >= 10), '')
+
+    return {
+        'name': name,
+        'email': email.group(0) if email else '',
+        'phone': phone,
+        'skills': skills,
+        'education': education,
+        'education_level': education_level,
+        'experience': experience,
+        'years_of_experience': _years_of_experience(text, experience),
+    }
+
+
+def _parse_chunk(texts: List[str], terms_key: str, terms: Sequence[str]) -> List[Dict[str, Any]]:
+    """Run in a worker process: parse a chunk of resumes with one batched nlp.pipe pass"""
+    nlp = _load_nlp()
+    matcher = _matcher(terms_key, terms)
+    return [_parse_doc(doc, text, matcher) for doc, text in zip(nlp.pipe(texts, batch_size=RESUME_BATCH_SIZE), texts)]
+
+
+# --- web process side ------------------------------------------------------------------------
+
+class ResumeParsingService:
+    """
+    Parses resumes in a pool of worker processes (RESUME_WORKERS, by default the cores split
+    across the WEB_CONCURRENCY API workers). A batch is split into one chunk per worker and each
+    chunk goes through spaCy's nlp.pipe, so throughput grows with the number of cores. Skills are matched against the platform
+    vocabulary (skills seen on postings) plus known aliases.
+    """
+
+    def __init__(self, workers: int = None):
+        self.workers = max(1, workers or RESUME_WORKERS)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    # spawn: forking a threaded web worker is unsafe
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context('spawn')
+                    )
+        return self._pool
+
+    def skill_terms(self) -> List[str]:
+        if not len(skill_vocabulary):
+            for table in ('internships', 'freelance_jobs'):
+                try:
+                    skill_ranking_service.index_for(table)
+                except Exception as e:
+                    logger.warning(f"Could not load {table} skills for resume matching: {str(e)}")
+        return sorted(set(skill_vocabulary.names) | set(SKILL_ALIASES) | set(SKILL_ALIASES.values()))
+
+    def parse(self, texts: List[str]) -> List[Dict[str, Any]]:
+        texts = [(t or '')[:MAX_RESUME_CHARS] for t in texts]
+        if not texts:
+            return []
+        terms = self.skill_terms()
+        terms_key = hashlib.blake2b('\n'.join(terms).encode('utf-8'), digest_size=8).hexdigest()
+        size = -(-len(texts) // min(self.workers, len(texts)))
+        futures = [
+            self.pool.submit(_parse_chunk, texts[i:i + size], terms_key, terms)
+            for i in range(0, len(texts), size)
+        ]
+        return [parsed for future in futures for parsed in future.result()]
+
+    def suggest_skills(self, skills: List[str], limit: int = 5) -> List[str]:
+        """Skills most often missing from the open internships that best match `skills`"""
+        if not skills:
+            return []
+        try:
+            ranked = skill_ranking_service.rank_postings(skills, 'internships', k=20)
+        except Exception as e:
+            logger.warning(f"Could not rank postings for skill suggestions: {str(e)}")
+            return []
+        counts = Counter()
+        for posting in ranked:
+            counts.update(posting.get('missing_required_skills', []))
+            counts.update({s: 0.5 for s in posting.get('missing_preferred_skills', [])})
+        have = {normalize_skill(s) for s in skills}
+        return [skill for skill, _ in counts.most_common() if skill not in have][:limit]
+
+
+def merge_profile_update(user: Dict[str, Any], parsed: Dict[str, Any]) -> Dict[str, Any]:
+    """UserUpdate fields from a parsed resume: new skills are appended, empty fields filled in"""
+    update = {}
+    existing = user.get('skills') or []
+    have = {normalize_skill(s) for s in existing}
+    new_skills = [s for s in parsed['skills'] if s not in have]
+    if new_skills:
+        update['skills'] = existing + new_skills
+    if not user.get('years_of_experience') and parsed.get('years_of_experience'):
+        update['years_of_experience'] = parsed['years_of_experience']
+    if not user.get('education') and parsed.get('education'):
+        update['education'] = {'level': parsed.get('education_level'), 'details': parsed['education']}
+    return update
+
+
+# Global instance
+resume_parsing_service = ResumeParsingService()
@@ -1,9 +1,42 @@
 # backend/app/core/services.py
 from typing import List, Optional, Dict, Any
 from app.core.database import get_supabase_client
+from app.core.recommendations import on_postings_changed, on_talent_profile_changed
 from app.models.user import UserCreate, UserUpdate, UserResponse
 import uuid
 
+# Columns returned by read endpoints: everything except secrets and the *_translations maps,
+# which app.core.localization selects per request language
+PROFILE_COLUMNS = ('id,auth_id,role,full_name,email,phone,location,professional_summary,experience_level,'
+                   'current_position,years_of_experience,hourly_rate,availability,skills,preferred_work_type,'
+                   'education,certifications,linkedin_url,github_url,portfolio_website,preferred_language,'
+                   'profile_picture_url,created_at,updated_at,company_name,company_website,company_size,'
+                   'company_industry,company_logo_url,company_description,recruiter_position,verified_recruiter,'
+                   'resume_url,cover_letter_template,job_preferences,notification_preferences,'
+                   'profile_completion_percentage,full_name_source_language,professional_summary_source_language')
+POSTING_COLUMNS = {
+    'internships': ('id,recruiter_id,title,company,company_logo_url,description,responsibilities,learning_outcomes,'
+                    'location,work_type,stipend_min,stipend_max,duration_months,hours_per_week,required_skills,'
+                    'preferred_skills,education_level,experience_required,application_deadline,start_date,'
+                    'positions_available,application_process,company_website,company_size,industry,status,'
+                    'posted_at,updated_at,title_source_language,description_source_language'),
+    'freelance_jobs': ('id,recruiter_id,title,client_company,description,project_scope,deliverables,budget_type,'
+                       'budget_min,budget_max,estimated_hours,deadline,project_duration,skills_required,'
+                       'experience_level,portfolio_required,location,work_type,communication_preference,category,'
+                       'subcategory,application_deadline,application_process,client_info,project_examples,'
+                       'special_requirements,status,posted_at,updated_at,title_source_language,'
+                       'description_source_language'),
+}
+# Card fields for list pages
+POSTING_LIST_COLUMNS = {
+    'internships': ('id,title,company,company_logo_url,description,location,work_type,stipend_min,stipend_max,'
+                    'duration_months,hours_per_week,required_skills,preferred_skills,experience_required,'
+                    'application_deadline,posted_at,title_source_language,description_source_language'),
+    'freelance_jobs': ('id,title,client_company,description,project_scope,budget_type,budget_min,budget_max,'
+                       'skills_required,experience_level,location,work_type,category,subcategory,deadline,'
+                       'application_deadline,posted_at,title_source_language,description_source_language'),
+}
+
 class UserService:
     """Service layer for user operations"""
     
@@ -40,9 +73,9 @@ class UserService:
         res = self.client.table('users').insert(user_dict).execute()
         return (res.data or [{}])[0]
     
-    def get_user_by_id(self, user_id: str) -> Optional[Dict[str, Any]]:
+    def get_user_by_id(self, user_id: str, columns: str = '*') -> Optional[Dict[str, Any]]:
         """Get user by ID"""
-        res = self.client.table('users').select('*').eq('id', user_id).limit(1).execute()
+        res = self.client.table('users').select(columns).eq('id', user_id).limit(1).execute()
         return (res.data or [None])[0]
     
     def get_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
@@ -67,15 +100,29 @@ class UserService:
             update_dict['professional_summary_translations'] = translations
             
         res = self.client.table('users').update(update_dict).eq('id', user_id).execute()
-        return (res.data or [None])[0]
+        user = (res.data or [None])[0]
+        if user and user.get('role') == 'talent':
+            on_talent_profile_changed(user_id, update_dict)
+        return user
     
     def get_talents(self, 
                    skills: Optional[List[str]] = None,
                    location: Optional[str] = None,
                    experience_level: Optional[str] = None,
-                   availability: Optional[str] = None) -> List[Dict[str, Any]]:
+                   availability: Optional[str] = None,
+                   columns: str = '*') -> List[Dict[str, Any]]:
         """Get talents with optional filters"""
-        q = self.client.table('users').select('*').eq('role', 'talent')
+        res = self.talents_query(skills, location, experience_level, availability, columns).execute()
+        return res.data or []
+
+    def talents_query(self,
+                      skills: Optional[List[str]] = None,
+                      location: Optional[str] = None,
+                      experience_level: Optional[str] = None,
+                      availability: Optional[str] = None,
+                      columns: str = '*'):
+        """Unexecuted talent query with the get_talents filters, for callers that page it themselves"""
+        q = self.client.table('users').select(columns).eq('role', 'talent')
         if skills:
             q = q.cs('skills', skills)  # contains
         if location:
@@ -84,8 +131,7 @@ class UserService:
             q = q.eq('experience_level', experience_level)
         if availability:
             q = q.eq('availability', availability)
-        res = q.execute()
-        return res.data or []
+        return q
     
     def delete_user(self, user_id: str) -> bool:
         """Delete a user (admin only)"""
@@ -107,24 +153,39 @@ class InternshipService:
     def create_internship(self, internship_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new internship posting"""
         res = self.client.table('internships').insert(internship_data).execute()
+        on_postings_changed('internships', res.data or [])
         return (res.data or [{}])[0]
+
+    def update_internship(self, internship_id: str, internship_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Update an internship; closing or reopening it updates the recommendation index"""
+        res = self.client.table('internships').update(internship_data).eq('id', internship_id).execute()
+        on_postings_changed('internships', res.data or [])
+        return (res.data or [None])[0]
     
     def get_internships(self, 
                        status: str = 'open',
                        skills: Optional[List[str]] = None,
-                       location: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get internships with filters"""
-        q = self.client.table('internships').select('*').eq('status', status).order('posted_at', desc=True)
+                       location: Optional[str] = None,
+                       work_type: Optional[str] = None,
+                       limit: Optional[int] = None,
+                       offset: int = 0,
+                       columns: str = '*') -> List[Dict[str, Any]]:
+        """Get internships with filters, newest first; `limit`/`offset` select one page"""
+        q = self.client.table('internships').select(columns).eq('status', status).order('posted_at', desc=True).order('id', desc=True)
         if skills:
             q = q.cs('required_skills', skills)
         if location:
             q = q.ilike('location', f"%{location}%")
+        if work_type:
+            q = q.eq('work_type', work_type)
+        if limit is not None:
+            q = q.range(offset, offset + limit - 1)
         res = q.execute()
         return res.data or []
     
-    def get_internship_by_id(self, internship_id: str) -> Optional[Dict[str, Any]]:
+    def get_internship_by_id(self, internship_id: str, columns: str = '*') -> Optional[Dict[str, Any]]:
         """Get internship by ID"""
-        res = self.client.table('internships').select('*').eq('id', internship_id).limit(1).execute()
+        res = self.client.table('internships').select(columns).eq('id', internship_id).limit(1).execute()
         return (res.data or [None])[0]
 
 class FreelanceJobService:
@@ -142,25 +203,108 @@ class FreelanceJobService:
     def create_freelance_job(self, job_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new freelance job posting"""
         res = self.client.table('freelance_jobs').insert(job_data).execute()
+        on_postings_changed('freelance_jobs', res.data or [])
         return (res.data or [{}])[0]
+
+    def update_freelance_job(self, job_id: str, job_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Update a freelance job; closing or reopening it updates the recommendation index"""
+        res = self.client.table('freelance_jobs').update(job_data).eq('id', job_id).execute()
+        on_postings_changed('freelance_jobs', res.data or [])
+        return (res.data or [None])[0]
     
     def get_freelance_jobs(self,
                           status: str = 'open',
                           category: Optional[str] = None,
                           budget_min: Optional[float] = None,
-                          budget_max: Optional[float] = None) -> List[Dict[str, Any]]:
-        """Get freelance jobs with filters"""
-        q = self.client.table('freelance_jobs').select('*').eq('status', status).order('posted_at', desc=True)
+                          budget_max: Optional[float] = None,
+                          skills: Optional[List[str]] = None,
+                          work_type: Optional[str] = None,
+                          limit: Optional[int] = None,
+                          offset: int = 0,
+                          columns: str = '*') -> List[Dict[str, Any]]:
+        """Get freelance jobs with filters, newest first; `limit`/`offset` select one page"""
+        q = self.client.table('freelance_jobs').select(columns).eq('status', status).order('posted_at', desc=True).order('id', desc=True)
         if category:
             q = q.eq('category', category)
         if budget_min is not None:
             q = q.gte('budget_min', budget_min)
         if budget_max is not None:
             q = q.lte('budget_max', budget_max)
+        if skills:
+            q = q.cs('skills_required', skills)
+        if work_type:
+            q = q.eq('work_type', work_type)
+        if limit is not None:
+            q = q.range(offset, offset + limit - 1)
         res = q.execute()
         return res.data or []
 
+    def get_freelance_job_by_id(self, job_id: str, columns: str = '*') -> Optional[Dict[str, Any]]:
+        """Get freelance job by ID"""
+        res = self.client.table('freelance_jobs').select(columns).eq('id', job_id).limit(1).execute()
+        return (res.data or [None])[0]
+
+class ApplicationService:
+    """Service layer for application operations"""
+    
+    def __init__(self):
+        self._client = None
+    
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = get_supabase_client()
+        return self._client
+    
+    def bulk_update_status(self,
+                           recruiter_id: str,
+                           status: str,
+                           application_ids: Optional[List[str]] = None,
+                           internship_id: Optional[str] = None,
+                           job_id: Optional[str] = None,
+                           current_status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Move applications to `status` in one set-based statement, limited to postings owned by
+        `recruiter_id`. Returns the updated rows as {id, previous_status, status}.
+        """
+        res = self.client.rpc('bulk_update_application_status', {
+            'p_recruiter_id': recruiter_id,
+            'p_status': status,
+            'p_application_ids': application_ids,
+            'p_internship_id': internship_id,
+            'p_job_id': job_id,
+            'p_current_status': current_status
+        }).execute()
+        return res.data or []
+
+    def applications_query(self,
+                           talent_id: Optional[str] = None,
+                           internship_id: Optional[str] = None,
+                           job_id: Optional[str] = None,
+                           status: Optional[str] = None,
+                           columns: str = '*'):
+        """Unexecuted applications query for one talent or one posting, for callers that page it themselves"""
+        q = self.client.table('applications').select(columns)
+        if talent_id:
+            q = q.eq('talent_id', talent_id)
+        if internship_id:
+            q = q.eq('internship_id', internship_id)
+        if job_id:
+            q = q.eq('job_id', job_id)
+        if status:
+            q = q.eq('status', status)
+        return q
+
+    def recruiter_posting_ids(self, recruiter_id: str) -> Dict[str, List[str]]:
+        """Ids of every internship and freelance job posted by a recruiter"""
+        return {
+            table: [row['id'] for row in (self.client.table(table).select('id')
+                                          .eq('recruiter_id', recruiter_id).order('id').execute().data or [])]
+            for table in ('internships', 'freelance_jobs')
+        }
+
 # Service instances
 user_service = UserService()
 internship_service = InternshipService()
-freelance_job_service = FreelanceJobService()
\ No newline at end of file
+freelance_job_service = FreelanceJobService()
+application_service = ApplicationService()
\ No newline at end of file
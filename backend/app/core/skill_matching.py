@@ -0,0 +1,269 @@
+# backend/app/core/skill_matching.py
+import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Sequence
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from scipy import sparse
+
+logger = logging.getLogger(__name__)
+
+# Spelling variants that should share one vocabulary id
+SKILL_ALIASES = {
+    'js': 'javascript',
+    'ts': 'typescript',
+    'reactjs': 'react',
+    'react.js': 'react',
+    'node': 'nodejs',
+    'node.js': 'nodejs',
+    'vue.js': 'vue',
+    'vuejs': 'vue',
+    'py': 'python',
+    'ml': 'machine learning',
+    'ai': 'artificial intelligence',
+    'nlp': 'natural language processing',
+    'postgres': 'postgresql',
+    'golang': 'go',
+    'c sharp': 'c#',
+    'ms excel': 'excel',
+}
+
+REQUIRED_WEIGHT = float(os.getenv('SKILL_REQUIRED_WEIGHT', '1.0'))
+PREFERRED_WEIGHT = float(os.getenv('SKILL_PREFERRED_WEIGHT', '0.5'))
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_skill(skill: str) -> str:
+    """Canonical form used as the vocabulary key ('  React.JS ' -> 'react')"""
+    key = _WHITESPACE_RE.sub(' ', (skill or '').strip().lower())
+    return SKILL_ALIASES.get(key, key)
+
+
+class SkillVocabulary:
+    """Shared mapping from normalized skill names to dense integer ids"""
+
+    def __init__(self, skills: Iterable[str] = ()):
+        self._ids: Dict[str, int] = {}
+        self.names: List[str] = []
+        self._lock = threading.Lock()
+        self.add(skills)
+
+    def __len__(self):
+        return len(self.names)
+
+    def add(self, skills: Iterable[str]) -> List[int]:
+        ids = []
+        for skill in skills or ():
+            key = normalize_skill(skill)
+            if not key:
+                continue
+            skill_id = self._ids.get(key)
+            if skill_id is None:
+                with self._lock:
+                    skill_id = self._ids.get(key)
+                    if skill_id is None:
+                        skill_id = len(self.names)
+                        self.names.append(key)
+                        self._ids[key] = skill_id
+            ids.append(skill_id)
+        return ids
+
+    def lookup(self, skills: Iterable[str]) -> List[int]:
+        """Ids of known skills; unknown skills are dropped"""
+        ids = (self._ids.get(normalize_skill(s)) for s in skills or ())
+        return sorted({i for i in ids if i is not None})
+
+
+def _csr(rows: Sequence[Sequence[int]], n_cols: int) -> 'sparse.csr_matrix':
+    from scipy import sparse
+
+    indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum([len(r) for r in rows])
+    indices = np.fromiter((i for r in rows for i in r), dtype=np.int32, count=int(indptr[-1]))
+    data = np.ones(len(indices), dtype=np.float32)
+    return sparse.csr_matrix((data, indices, indptr), shape=(len(rows), n_cols))
+
+
+class SkillIndex:
+    """
+    Rows (postings or talents) stored as sparse skill vectors over a shared vocabulary.
+    `fields` maps a row column (e.g. 'required_skills') to its weight; every row's skills in
+    those columns become one weighted CSR row so a whole population scores in a single
+    sparse matrix-vector product.
+    """
+
+    def __init__(self, vocabulary: SkillVocabulary, fields: Dict[str, float]):
+        self.vocabulary = vocabulary
+        self.fields = fields
+        self.ids: List[str] = []
+        self.n_cols = 0
+        self.field_matrices: Dict[str, 'sparse.csr_matrix'] = {}
+        # scipy is imported when the first index is built, not at app start
+        self.weighted = _csr([], 0)
+        self.row_weight = np.zeros(0, dtype=np.float32)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def fit(self, rows: List[Dict[str, Any]]) -> 'SkillIndex':
+        per_field = {
+            field: [sorted(set(self.vocabulary.add(r.get(field) or []))) for r in rows]
+            for field in self.fields
+        }
+        self.n_cols = len(self.vocabulary)
+        self.ids = [str(r['id']) for r in rows]
+        self.field_matrices = {field: _csr(ids, self.n_cols) for field, ids in per_field.items()}
+        # A skill listed under several fields (required and preferred) counts once, at its highest weight
+        weighted = None
+        for field, weight in self.fields.items():
+            part = self.field_matrices[field] * weight
+            weighted = part if weighted is None else weighted.maximum(part)
+        self.weighted = weighted.tocsr()
+        self.row_weight = np.asarray(self.weighted.sum(axis=1), dtype=np.float32).ravel()
+        return self
+
+    def query_vector(self, skills: Iterable[str]) -> np.ndarray:
+        """Dense 0/1 indicator over the fitted vocabulary"""
+        vector = np.zeros(self.n_cols, dtype=np.float32)
+        ids = [i for i in self.vocabulary.lookup(skills) if i < self.n_cols]
+        vector[ids] = 1.0
+        return vector
+
+    def weighted_query(self, skills_by_weight: Sequence) -> np.ndarray:
+        """Dense query over the fitted vocabulary from [(skills, weight), ...], keeping the max weight per skill"""
+        vector = np.zeros(self.n_cols, dtype=np.float32)
+        for skills, weight in skills_by_weight:
+            ids = [i for i in self.vocabulary.lookup(skills) if i < self.n_cols]
+            vector[ids] = np.maximum(vector[ids], weight)
+        return vector
+
+    def coverage_of_rows(self, skills: Iterable[str]) -> np.ndarray:
+        """Share of each row's weighted skills that `skills` covers (posting ranking for a talent)"""
+        matched = self.weighted @ self.query_vector(skills)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(self.row_weight > 0, matched / self.row_weight, 0.0).astype(np.float32)
+
+    def coverage_of_query(self, weights: np.ndarray) -> np.ndarray:
+        """Share of a weighted query (see weighted_query) each row covers (talent ranking for a posting)"""
+        total = float(weights.sum())
+        if total <= 0 or not self.ids:
+            return np.zeros(len(self.ids), dtype=np.float32)
+        present = self.weighted.copy()
+        present.data[:] = 1.0
+        return np.asarray(present @ weights, dtype=np.float32).ravel() / total
+
+    def explain(self, position: int, skills: Iterable[str]) -> Dict[str, List[str]]:
+        """Which of a row's skills matched and which are missing, per field"""
+        have = set(self.query_vector(skills).nonzero()[0])
+        names = self.vocabulary.names
+        explanation = {}
+        for field, matrix in self.field_matrices.items():
+            row_ids = matrix.indices[matrix.indptr[position]:matrix.indptr[position + 1]]
+            explanation[f'matched_{field}'] = [names[i] for i in row_ids if i in have]
+            explanation[f'missing_{field}'] = [names[i] for i in row_ids if i not in have]
+        return explanation
+
+    def top(self, scores: np.ndarray, k: int, offset: int = 0, min_score: float = 0.0) -> List[int]:
+        """Positions of the best `k` scores after `offset`, best first"""
+        n = offset + k
+        candidates = np.flatnonzero(scores > min_score)
+        if len(candidates) > n:
+            part = np.argpartition(-scores[candidates], n - 1)[:n]
+            candidates = candidates[part]
+        order = candidates[np.argsort(-scores[candidates], kind='stable')]
+        return order[offset:n].tolist()
+
+
+POSTING_SKILL_FIELDS = {
+    'internships': {'required_skills': REQUIRED_WEIGHT, 'preferred_skills': PREFERRED_WEIGHT},
+    'freelance_jobs': {'skills_required': REQUIRED_WEIGHT},
+}
+
+
+class SkillRankingService:
+    """
+    Ranks open postings by weighted skill overlap. The fitted index is refreshed on a TTL by one
+    background thread; requests keep using the previous index until the refit is swapped in.
+    """
+
+    def __init__(self, vocabulary: SkillVocabulary = None, ttl_seconds: int = None):
+        self.vocabulary = vocabulary if vocabulary is not None else SkillVocabulary()
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else int(os.getenv('SKILL_INDEX_TTL', '300'))
+        self._indexes: Dict[str, SkillIndex] = {}
+        self._fitted_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._refitting = set()
+        self._refit_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='skill-index')
+
+    def reinit_after_fork(self):
+        """Fresh lock and executor in a forked worker; the parent's refit thread does not exist here"""
+        self._lock = threading.Lock()
+        self._refitting = set()
+        self._refit_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='skill-index')
+
+    def _load_rows(self, table: str) -> List[Dict[str, Any]]:
+        from app.core.recommendations import iter_open_postings
+        columns = 'id,' + ','.join(POSTING_SKILL_FIELDS[table])
+        rows = []
+        for page in iter_open_postings(table, columns):
+            rows.extend(page)
+        return rows
+
+    def _fit(self, table: str) -> SkillIndex:
+        started = time.time()
+        index = SkillIndex(self.vocabulary, POSTING_SKILL_FIELDS[table]).fit(self._load_rows(table))
+        self._indexes[table], self._fitted_at[table] = index, time.time()
+        logger.info(f"Fitted {table} skill index: {len(index)} rows in {time.time() - started:.2f}s")
+        return index
+
+    def _refit(self, table: str):
+        try:
+            self._fit(table)
+        except Exception as e:
+            logger.error(f"Refitting {table} skill index failed: {str(e)}")
+        finally:
+            with self._lock:
+                self._refitting.discard(table)
+
+    def index_for(self, table: str) -> SkillIndex:
+        index = self._indexes.get(table)
+        if index is not None:
+            if time.time() - self._fitted_at[table] >= self.ttl_seconds:
+                with self._lock:
+                    if table not in self._refitting:
+                        self._refitting.add(table)
+                        self._refit_executor.submit(self._refit, table)
+            return index
+        # Only the first fit blocks (normally done by the warm-up before serving)
+        with self._lock:
+            index = self._indexes.get(table)
+            if index is None:
+                index = self._fit(table)
+        return index
+
+    def rank_postings(self, skills: List[str], table: str = 'internships', k: int = 20, offset: int = 0) -> List[Dict[str, Any]]:
+        """Ranked posting ids with scores and per-field match explanations"""
+        index = self.index_for(table)
+        if not len(index):
+            return []
+        scores = index.coverage_of_rows(skills)
+        results = []
+        for position in index.top(scores, k, offset):
+            results.append({
+                'id': index.ids[position],
+                'score': round(float(scores[position]), 4),
+                **index.explain(position, skills)
+            })
+        return results
+
+
+# Global instances
+skill_vocabulary = SkillVocabulary()
+skill_ranking_service = SkillRankingService(skill_vocabulary)
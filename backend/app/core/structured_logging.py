@@ -0,0 +1,188 @@
+# backend/app/core/structured_logging.py
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+from flask import g, has_request_context
+
+# Messages (and exception text) longer than this are cut before they are queued
+LOG_MAX_MESSAGE_CHARS = int(os.getenv('LOG_MAX_MESSAGE_CHARS', '2000'))
+# Records waiting for the writer thread; beyond this new records are dropped, never waited on
+LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', '10000'))
+# Share of high-volume INFO/DEBUG lines (e.g. per-request access lines) that are kept
+LOG_SAMPLE_RATE = float(os.getenv('LOG_SAMPLE_RATE', '1.0'))
+LOG_FORMAT = os.getenv('LOG_FORMAT', 'json').lower()
+
+# LogRecord attributes that are not caller-supplied `extra` fields
+_RECORD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime', 'request_id', 'sample_rate'}
+
+_listener = None
+
+
+def _truncate(text: str, keep_tail: bool = False) -> str:
+    if not text or len(text) <= LOG_MAX_MESSAGE_CHARS:
+        return text
+    cut = len(text) - LOG_MAX_MESSAGE_CHARS
+    if keep_tail:
+        # The end of a traceback names the failing line and the exception
+        return f"[{cut} chars truncated] ...{text[-LOG_MAX_MESSAGE_CHARS:]}"
+    return f"{text[:LOG_MAX_MESSAGE_CHARS]}... [{cut} chars truncated]"
+
+
+class RequestIdFilter(logging.Filter):
+    def filter(self, record):
+        try:
+            if has_request_context():
+                record.request_id = getattr(g, 'request_id', '-')
+            else:
+                record.request_id = '-'
+        except Exception:
+            record.request_id = '-'
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Keep a `sample_rate` share of records that carry one (extra={'sample_rate': ...}); warnings and up always pass"""
+    def filter(self, record):
+        rate = getattr(record, 'sample_rate', None)
+        if rate is None or rate >= 1 or record.levelno >= logging.WARNING:
+            return True
+        return random.random() < rate
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, request id, message and any `extra` fields"""
+    def format(self, record):
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'request_id': getattr(record, 'request_id', '-'),
+            'message': record.getMessage(),
+        }
+        entry.update({k: v for k, v in vars(record).items() if k not in _RECORD_ATTRS})
+        if record.exc_text:
+            entry['exc'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class RecordQueueHandler(QueueHandler):
+    """
+    Hands records to the writer thread. Only the message is rendered here (and capped); JSON
+    encoding and file/console I/O happen in the QueueListener. A full queue drops the record.
+    """
+    dropped = 0
+
+    def prepare(self, record):
+        message = _truncate(record.getMessage())
+        exc_text = _truncate(logging.Formatter().formatException(record.exc_info), keep_tail=True) if record.exc_info else record.exc_text
+        record = logging.makeLogRecord(vars(record))
+        record.msg = message
+        record.args = None
+        record.exc_info = None
+        record.exc_text = exc_text
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            RecordQueueHandler.dropped += 1
+
+
+def _formatter():
+    if LOG_FORMAT == 'text':
+        return logging.Formatter('%(asctime)s %(levelname)s %(name)s [%(request_id)s] %(message)s')
+    return JsonFormatter()
+
+
+def configure_logging(log_dir: str, level: str = 'INFO'):
+    """
+    Route the root logger through a bounded queue to a rotating file and the console, written by
+    a background QueueListener so request threads never block on log I/O. Safe to call again.
+    """
+    global _listener
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+    # Avoid duplicate handlers on reload
+    if any(isinstance(h, RecordQueueHandler) for h in root_logger.handlers):
+        return
+
+    file_handler = RotatingFileHandler(
+        os.path.join(log_dir, 'server.log'), maxBytes=5 * 1024 * 1024, backupCount=3, encoding='utf-8'
+    )
+    console_handler = logging.StreamHandler()
+    for handler in (file_handler, console_handler):
+        handler.setFormatter(_formatter())
+
+    queue_handler = RecordQueueHandler(queue.Queue(LOG_QUEUE_SIZE))
+    queue_handler.addFilter(RequestIdFilter())
+    queue_handler.addFilter(SamplingFilter())
+    root_logger.addHandler(queue_handler)
+
+    _listener = QueueListener(queue_handler.queue, file_handler, console_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+
+
+def stop_logging():
+    """Flush queued records and stop the writer thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def _pause_for_fork():
+    # A writer thread caught mid-write would leave the stream locks held in the child forever
+    if _listener is not None and _listener._thread is not None:
+        try:
+            _listener.stop()
+        except queue.Full:
+            pass
+
+
+def _resume_after_fork():
+    if _listener is not None and _listener._thread is None:
+        _listener.start()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(before=_pause_for_fork, after_in_parent=_resume_after_fork)
+
+
+def _worker_file_handler(handler: RotatingFileHandler) -> RotatingFileHandler:
+    """
+    The same rotating file settings on server-<pid>.log: a file shared with the master and other
+    workers would be rotated by each process on its own, leaving the others writing to a renamed file
+    """
+    base, ext = os.path.splitext(handler.baseFilename)
+    worker_handler = RotatingFileHandler(
+        f'{base}-{os.getpid()}{ext}', maxBytes=handler.maxBytes, backupCount=handler.backupCount, encoding=handler.encoding
+    )
+    worker_handler.setFormatter(handler.formatter)
+    worker_handler.setLevel(handler.level)
+    # Only this process's copy of the descriptor; the master keeps writing its own file
+    handler.close()
+    return worker_handler
+
+
+def restart_after_fork():
+    """
+    Give a forked worker its own queue and writer thread (the parent's listener thread is not
+    inherited) and its own log file
+    """
+    global _listener
+    if _listener is None:
+        return
+    handlers = [_worker_file_handler(h) if isinstance(h, RotatingFileHandler) else h for h in _listener.handlers]
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, RecordQueueHandler):
+            handler.queue = queue.Queue(LOG_QUEUE_SIZE)
+            _listener = QueueListener(handler.queue, *handlers, respect_handler_level=True)
+            _listener.start()
@@ -2,17 +2,26 @@
 import os
 import logging
 from typing import Dict, List, Optional, Tuple
-from langdetect import detect, DetectorFactory
-from langdetect.lang_detect_exception import LangDetectException
 from functools import lru_cache
 import time
-from deep_translator import GoogleTranslator
-
-# Set seed for consistent language detection
-DetectorFactory.seed = 0
+from app.core.structured_logging import LOG_SAMPLE_RATE
+from app.core.metrics import observe_translation
+from app.core.async_translation import async_translation_service, run_sync
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=None)
+def _langdetect():
+    """langdetect's detect() and exception type, imported on first use"""
+    from langdetect import detect, DetectorFactory
+    from langdetect.lang_detect_exception import LangDetectException
+
+    # Set seed for consistent language detection
+    DetectorFactory.seed = 0
+    return detect, LangDetectException
+
+
 class TranslationService:
     """Service for handling multilingual content translation"""
     
@@ -29,17 +38,39 @@ class TranslationService:
     def __init__(self):
         self.deepl_auth_key = os.getenv('DEEPL_AUTH_KEY')
         self.google_api_key = os.getenv('GOOGLE_TRANSLATE_API_KEY')
+        self.primary_service = 'google'
+        # Providers are imported and built on first use (or by warm_up), not at import
+        self._google_translator = None
+        self._deepl_translator = None
+        self._deepl_loaded = False
 
+    @property
+    def google_translator(self):
         # Use deep-translator Google's web translate to avoid httpx conflicts
-        self.google_translator = GoogleTranslator
-        self.primary_service = 'google'
+        if self._google_translator is None:
+            from deep_translator import GoogleTranslator
+            self._google_translator = GoogleTranslator
+        return self._google_translator
 
+    @property
+    def deepl_translator(self):
         # Optional DeepL if provided
-        try:
-            import deepl
-            self.deepl_translator = deepl.Translator(self.deepl_auth_key) if self.deepl_auth_key else None
-        except Exception:
-            self.deepl_translator = None
+        if not self._deepl_loaded:
+            try:
+                import deepl
+                self._deepl_translator = deepl.Translator(self.deepl_auth_key) if self.deepl_auth_key else None
+            except Exception:
+                self._deepl_translator = None
+            self._deepl_loaded = True
+        return self._deepl_translator
+
+    def warm_up(self):
+        """Load the language detector's profiles and the translation providers ahead of the first request"""
+        from langdetect.detector_factory import init_factory
+
+        _langdetect()
+        init_factory()
+        self.google_translator, self.deepl_translator  # import and build the providers now
     
     def detect_language(self, text: str) -> str:
         """
@@ -49,6 +80,7 @@ class TranslationService:
         if not text or len(text.strip()) < 3:
             return 'en'  # Default to English for short text
         
+        detect, LangDetectException = _langdetect()
         try:
             # First try enhanced Indian language detection
             from app.core.indian_languages import detect_indian_language
@@ -56,7 +88,7 @@ class TranslationService:
             
             # If Indian language detected with high confidence, use it
             if indian_detected != 'en':
-                logger.info(f"Indian language detected: {indian_detected} for text: {text[:30]}...")
+                logger.debug("Indian language detected: %s (%d chars)", indian_detected, len(text))
                 return indian_detected
             
             # Fallback to langdetect for non-Indian languages
@@ -73,14 +105,14 @@ class TranslationService:
             }
             
             mapped_lang = lang_mapping.get(detected, detected)
-            logger.info(f"Langdetect result: {detected} -> mapped to: {mapped_lang}")
+            logger.debug("Langdetect result: %s -> mapped to: %s", detected, mapped_lang)
             return mapped_lang
                 
         except LangDetectException:
-            logger.warning(f"Could not detect language for text: {text[:50]}...")
+            logger.warning("Could not detect language for text: %.50s...", text)
             return 'en'  # Default to English
         except Exception as e:
-            logger.error(f"Language detection error: {str(e)}")
+            logger.error("Language detection error: %s", e)
             return 'en'  # Default to English
     
     def translate_text(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
@@ -95,13 +127,18 @@ class TranslationService:
             logger.error("No translator available")
             return text
         
+        started = time.perf_counter()
+        provider = 'google'
         try:
             # Use Google Translate for Indian languages (better support)
             if self.primary_service == 'google' and self.google_translator:
                 # Create a new translator instance for each translation
                 translator = self.google_translator(source=source_lang, target=target_lang)
                 translated = translator.translate(text)
-                logger.info(f"Google Translate: {source_lang} -> {target_lang}: '{text}' -> '{translated}'")
+                observe_translation(provider, source_lang, target_lang, time.perf_counter() - started)
+                # One line per language per text, so it is sampled and carries sizes rather than the texts
+                logger.debug("Google Translate: %s -> %s (%d -> %d chars)", source_lang, target_lang,
+                             len(text), len(translated or ''), extra={'sample_rate': LOG_SAMPLE_RATE})
                 return translated
             
             # Fallback to DeepL for English and supported languages
@@ -117,21 +154,26 @@ class TranslationService:
                 deepl_target = deepl_lang_mapping.get(target_lang)
                 
                 if deepl_source and deepl_target:
+                    provider = 'deepl'
                     result = self.deepl_translator.translate_text(
                         text, 
                         source_lang=deepl_source,
                         target_lang=deepl_target
                     )
+                    observe_translation(provider, source_lang, target_lang, time.perf_counter() - started)
                     return result.text
                 else:
                     if self.google_translator:
                         translator = self.google_translator(source=source_lang, target=target_lang)
-                        return translator.translate(text)
+                        translated = translator.translate(text)
+                        observe_translation(provider, source_lang, target_lang, time.perf_counter() - started)
+                        return translated
             
             return text  # Return original if no translation possible
             
         except Exception as e:
-            logger.error(f"Translation failed from {source_lang} to {target_lang}: {str(e)}")
+            observe_translation(provider, source_lang, target_lang, time.perf_counter() - started, 'error')
+            logger.error("Translation failed from %s to %s: %s", source_lang, target_lang, e)
             return text  # Return original on failure
     
     def translate_to_all_languages(self, text: str, source_lang: Optional[str] = None) -> Dict[str, str]:
@@ -146,21 +188,9 @@ class TranslationService:
         if not source_lang:
             source_lang = self.detect_language(text)
         
-        translations = {}
-        
-        # Always include the original text in its detected language
-        translations[source_lang] = text
-        
-        # Translate to other target languages
-        for target_lang in self.TARGET_LANGUAGES.keys():
-            if target_lang != source_lang:
-                translated = self.translate_text(text, source_lang, target_lang)
-                if translated:
-                    translations[target_lang] = translated
-                    # Small delay to avoid rate limiting
-                    time.sleep(0.1)
-        
-        return translations
+        # All target languages are requested concurrently on the shared translation loop; the
+        # original text is always included in its detected language
+        return run_sync(async_translation_service.translate_to_languages(text, source_lang, self.TARGET_LANGUAGES))
     
     def get_translated_content(self, translations: Dict[str, str], preferred_lang: str = 'en') -> str:
         """
@@ -196,6 +226,6 @@ def detect_and_translate(text: str, content_type: str = None) -> Tuple[str, Dict
     source_lang = translation_service.detect_language(text)
     translations = translation_service.translate_to_all_languages(text, source_lang)
     
-    logger.info(f"Translated {content_type or 'content'} from {source_lang} to {len(translations)} languages")
+    logger.info("Translated %s from %s to %d languages", content_type or 'content', source_lang, len(translations))
     
     return source_lang, translations
\ No newline at end of file
@@ -0,0 +1,177 @@
+# backend/app/core/vector_store.py
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # Windows: writers are only serialized within one process
+
+DTYPES = ('float32', 'float16', 'int8')
+# int8 is a quarter of the float32 size and scans about as fast; float16 keeps exact ranking
+# but numpy widens it slowly. See backend/benchmark_vector_store.py.
+DEFAULT_DTYPE = os.getenv('VECTOR_STORE_DTYPE', 'int8')
+# Rows scored per chunk, so int8/float16 rows are widened a cache-sized slice at a time
+CHUNK_ROWS = 4096
+
+_thread_lock = threading.RLock()
+
+
+@contextmanager
+def _locked(path: str, exclusive: bool):
+    """
+    Lock on `<path>.lock` across threads and processes: exclusive while a writer publishes a store
+    and removes old data files, shared while a reader opens one
+    """
+    with _thread_lock if exclusive else nullcontext(), open(path + '.lock', 'a') as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        yield
+
+
+def quantize(vectors: np.ndarray, dtype: str):
+    """Return (stored matrix, per-dimension scale or None) for `dtype`"""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if dtype == 'float32':
+        return vectors, None
+    if dtype == 'float16':
+        return vectors.astype(np.float16), None
+    if dtype == 'int8':
+        # Symmetric per-dimension scaling: value ~= int8 * scale
+        scale = np.abs(vectors).max(axis=0) / 127.0 if len(vectors) else np.ones(vectors.shape[1], dtype=np.float32)
+        scale[scale == 0] = 1.0
+        return np.clip(np.rint(vectors / scale), -127, 127).astype(np.int8), scale.astype(np.float32)
+    raise ValueError(f"Unsupported vector store dtype: {dtype}")
+
+
+class VectorStore:
+    """
+    Read-only matrix of embeddings on disk, opened with np.memmap so every worker process on a
+    host shares one page-cached copy. Rows are stored as float32, float16 or int8 (with a
+    per-dimension scale); `<path>.json` holds the dtype, shape, scale and row ids.
+
+    Written once with `VectorStore.write` and reopened by readers; a store is never modified in
+    place. Each write puts its rows in a new uniquely named data file and then renames a meta
+    file naming it over `<path>.json`, so concurrent writers never share a file and a reader
+    always pairs a meta file with its own data.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        # Shared lock: no writer can remove the data file between reading the meta and mapping it
+        with _locked(path, exclusive=False):
+            with open(path + '.json', encoding='utf-8') as f:
+                self._load(json.load(f))
+
+    def _load(self, meta: Dict):
+        # Stores written before data files were versioned use <path>.vec
+        self.data_path = os.path.join(os.path.dirname(self.path), meta['data']) if meta.get('data') else self.path + '.vec'
+        self.dtype = meta['dtype']
+        self.dimension = int(meta['dimension'])
+        self.ids: List[str] = meta['ids']
+        self.keys: Optional[List[str]] = meta.get('keys')
+        self.scale = np.asarray(meta['scale'], dtype=np.float32) if meta.get('scale') is not None else None
+        self.rows: Dict[str, int] = {row_id: i for i, row_id in enumerate(self.ids)}
+        if self.ids:
+            self.matrix = np.memmap(self.data_path, dtype=np.dtype(self.dtype), mode='r',
+                                    shape=(len(self.ids), self.dimension))
+        else:
+            self.matrix = np.zeros((0, self.dimension), dtype=np.dtype(self.dtype))
+
+    def __len__(self):
+        return len(self.ids)
+
+    @classmethod
+    def write(cls, path: str, ids: Sequence[str], vectors: np.ndarray, dtype: str = None,
+              keys: Sequence[str] = None) -> 'VectorStore':
+        """
+        Write a store and return it opened. `keys` is an optional per-row fingerprint (e.g. a hash
+        of the embedded text) readers use to tell whether a row is still current.
+        """
+        dtype = dtype or DEFAULT_DTYPE
+        stored, scale = quantize(vectors, dtype)
+        directory = os.path.dirname(path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        base = os.path.basename(path)
+        fd, data_path = tempfile.mkstemp(prefix=base + '.', suffix='.vec', dir=directory)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(np.ascontiguousarray(stored).tobytes())
+        meta = {
+            'data': os.path.basename(data_path),
+            'dtype': dtype,
+            'dimension': int(stored.shape[1]),
+            'ids': [str(i) for i in ids],
+            'keys': list(keys) if keys is not None else None,
+            'scale': scale.tolist() if scale is not None else None,
+        }
+        fd, meta_path = tempfile.mkstemp(prefix=base + '.', suffix='.json.tmp', dir=directory)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        with _locked(path, exclusive=True):
+            previous = cls._data_file(path)
+            # The single atomic step that publishes the new store
+            os.replace(meta_path, path + '.json')
+            # Only the data this write superseded goes (other writers' files may not be published
+            # yet); memmaps already open keep the unlinked file until closed
+            if previous and previous != data_path and os.path.exists(previous):
+                os.remove(previous)
+            # Map this write's own data before a later writer can supersede and remove it
+            store = cls.__new__(cls)
+            store.path = path
+            store._load(meta)
+        return store
+
+    @staticmethod
+    def _data_file(path: str) -> Optional[str]:
+        """The data file the published meta names, if any"""
+        try:
+            with open(path + '.json', encoding='utf-8') as f:
+                data = json.load(f).get('data')
+        except (FileNotFoundError, ValueError):
+            return None
+        return os.path.join(os.path.dirname(path), data) if data else path + '.vec'
+
+    @classmethod
+    def open(cls, path: str) -> Optional['VectorStore']:
+        """The store at `path`, or None when it has not been written yet"""
+        if not os.path.exists(path + '.json'):
+            return None
+        return cls(path)
+
+    def get(self, positions: Iterable[int]) -> np.ndarray:
+        """Dequantized float32 rows"""
+        rows = np.asarray(self.matrix[np.asarray(list(positions), dtype=np.int64)], dtype=np.float32)
+        return rows * self.scale if self.scale is not None else rows
+
+    def scores(self, query: np.ndarray) -> np.ndarray:
+        """Inner product of `query` with every row"""
+        query = np.asarray(query, dtype=np.float32)
+        if self.scale is not None:
+            # (q * scale) . int8_row == q . (int8_row * scale), without dequantizing the matrix
+            query = query * self.scale
+        out = np.empty(len(self.ids), dtype=np.float32)
+        buffer = np.empty((min(CHUNK_ROWS, len(self.ids)), self.dimension), dtype=np.float32)
+        for start in range(0, len(self.ids), CHUNK_ROWS):
+            chunk = self.matrix[start:start + CHUNK_ROWS]
+            if chunk.dtype != np.float32:
+                widened = buffer[:len(chunk)]
+                widened[...] = chunk
+                chunk = widened
+            out[start:start + len(chunk)] = chunk @ query
+        return out
+
+    def search(self, query: np.ndarray, k: int) -> List[tuple]:
+        """Exact top-k (id, score) pairs, best first"""
+        scores = self.scores(query)
+        k = min(k, len(scores))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind='stable')]
+        return [(self.ids[i], float(scores[i])) for i in top]
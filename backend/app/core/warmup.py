@@ -0,0 +1,85 @@
+# backend/app/core/warmup.py
+import gc
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+# Load read-only assets before serving (set by gunicorn.conf.py; off for `python wsgi.py`)
+WARM_UP = os.getenv('WARM_UP', '0').lower() in ('1', 'true', 'yes')
+
+
+def _translation():
+    from app.core.translation import translation_service
+    translation_service.warm_up()
+
+
+def _embedding_model():
+    from app.core.embeddings import embedding_service
+    # Loads the sentence-transformers weights (no-op for EMBEDDING_BACKEND=hashing); no inference
+    # runs here, so torch does not start its thread pools in the parent
+    embedding_service.model
+
+
+def _recommendation_indexes():
+    from app.core.recommendations import posting_indexes
+    for index in posting_indexes.values():
+        index.ensure_ready()
+
+
+def _skill_indexes():
+    from app.core.skill_matching import POSTING_SKILL_FIELDS, skill_ranking_service
+    for table in POSTING_SKILL_FIELDS:
+        skill_ranking_service.index_for(table)
+
+
+def _talent_pool():
+    from app.core.candidate_ranking import candidate_ranking_service
+    candidate_ranking_service.pool()
+
+
+# In order; a failing step is logged and skipped so a database outage never blocks startup
+WARM_UP_STEPS = [
+    ('translation', _translation),
+    ('embedding model', _embedding_model),
+    ('recommendation indexes', _recommendation_indexes),
+    ('skill indexes', _skill_indexes),
+    ('talent pool', _talent_pool),
+]
+
+
+def warm_up():
+    """
+    Load detector tables, models and indexes now instead of on the first request. Under gunicorn
+    --preload this runs once in the master, and forked workers share the pages copy-on-write.
+    """
+    started = time.time()
+    for name, step in WARM_UP_STEPS:
+        step_started = time.time()
+        try:
+            step()
+            logger.info("Warmed up %s in %.2fs", name, time.time() - step_started)
+        except Exception as e:
+            logger.warning("Warm-up of %s failed: %s", name, e)
+    # Move everything loaded so far out of the collector's reach: a GC pass in a worker would
+    # otherwise write to these objects' headers and un-share their pages
+    gc.freeze()
+    logger.info("Warm-up finished in %.2fs", time.time() - started)
+
+
+def after_fork():
+    """Re-create fork-unsafe state in a new worker: HTTP clients, pools, locks and background threads"""
+    from app.core import database
+    from app.core.candidate_ranking import candidate_ranking_service
+    from app.core.recommendations import reinit_after_fork
+    from app.core.skill_matching import skill_ranking_service
+    from app.core.structured_logging import restart_after_fork
+
+    restart_after_fork()
+    # The parent's Supabase client holds an HTTP connection pool whose sockets the child must not share
+    database._supabase_client = None
+    reinit_after_fork()
+    skill_ranking_service.reinit_after_fork()
+    candidate_ranking_service.reinit_after_fork()
+    # The async translation loop notices the new pid and starts its own loop and client
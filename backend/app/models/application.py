@@ -1,6 +1,6 @@
 # backend/app/models/application.py
-from typing import Optional, Dict, Any
-from pydantic import BaseModel, UUID4
+from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, UUID4, Field
 from datetime import datetime
 from enum import Enum
 
@@ -53,3 +53,15 @@ class ApplicationResponse(BaseModel):
     updated_at: datetime
     recruiter_notes: Optional[str]
     interview_scheduled_at: Optional[datetime]
+
+class ApplicationStatusFilter(BaseModel):
+    """Filter selecting applications for a bulk status change"""
+    internship_id: Optional[UUID4] = None
+    job_id: Optional[UUID4] = None
+    status: Optional[ApplicationStatus] = None
+
+class ApplicationBulkStatusUpdate(BaseModel):
+    """Model for a recruiter's bulk status change (explicit ids and/or a filter)"""
+    status: ApplicationStatus
+    application_ids: Optional[List[UUID4]] = Field(default=None, max_length=1000)
+    filter: Optional[ApplicationStatusFilter] = None
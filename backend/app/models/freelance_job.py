@@ -0,0 +1,60 @@
+# backend/app/models/freelance_job.py
+from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, UUID4, field_validator
+from datetime import datetime
+from enum import Enum
+from app.models.internship import WorkType, split_list_field
+
+class ProjectScope(str, Enum):
+    SMALL = "small"
+    MEDIUM = "medium"
+    LARGE = "large"
+
+class BudgetType(str, Enum):
+    FIXED = "fixed"
+    HOURLY = "hourly"
+
+class ExperienceLevel(str, Enum):
+    BEGINNER = "beginner"
+    INTERMEDIATE = "intermediate"
+    EXPERT = "expert"
+    ANY = "any"
+
+class FreelanceJobStatus(str, Enum):
+    OPEN = "open"
+    IN_PROGRESS = "in-progress"
+    COMPLETED = "completed"
+    CANCELLED = "cancelled"
+
+class FreelanceJobCreate(BaseModel):
+    """Model for creating a freelance job posting"""
+    recruiter_id: Optional[UUID4] = None
+    title: str
+    client_company: Optional[str] = None
+    description: str
+    project_scope: ProjectScope
+    deliverables: Optional[List[str]] = None
+    budget_type: BudgetType
+    budget_min: Optional[float] = None
+    budget_max: Optional[float] = None
+    estimated_hours: Optional[int] = None
+    deadline: Optional[datetime] = None
+    project_duration: Optional[str] = None
+    skills_required: List[str]
+    experience_level: Optional[ExperienceLevel] = ExperienceLevel.ANY
+    portfolio_required: Optional[bool] = False
+    location: Optional[str] = None
+    work_type: Optional[WorkType] = WorkType.REMOTE
+    communication_preference: Optional[List[str]] = None
+    category: str
+    subcategory: Optional[str] = None
+    application_deadline: Optional[datetime] = None
+    application_process: Optional[str] = None
+    client_info: Optional[Dict[str, Any]] = None
+    project_examples: Optional[List[str]] = None
+    special_requirements: Optional[str] = None
+    status: Optional[FreelanceJobStatus] = FreelanceJobStatus.OPEN
+
+    _split_lists = field_validator(
+        'deliverables', 'skills_required', 'communication_preference', 'project_examples', mode='before'
+    )(split_list_field)
@@ -0,0 +1,74 @@
+# backend/app/models/internship.py
+from typing import List, Optional
+from pydantic import BaseModel, UUID4, field_validator
+from datetime import datetime
+from enum import Enum
+
+class WorkType(str, Enum):
+    REMOTE = "remote"
+    HYBRID = "hybrid"
+    ONSITE = "onsite"
+
+class InternshipStatus(str, Enum):
+    OPEN = "open"
+    CLOSED = "closed"
+    PAUSED = "paused"
+
+class EducationLevel(str, Enum):
+    HIGH_SCHOOL = "high-school"
+    DIPLOMA = "diploma"
+    BACHELORS = "bachelors"
+    MASTERS = "masters"
+    ANY = "any"
+
+class ExperienceRequired(str, Enum):
+    NONE = "none"
+    ZERO_TO_ONE = "0-1"
+    ONE_TO_TWO = "1-2"
+    TWO_PLUS = "2+"
+
+class CompanySize(str, Enum):
+    STARTUP = "startup"
+    SMALL = "small"
+    MEDIUM = "medium"
+    LARGE = "large"
+    ENTERPRISE = "enterprise"
+
+def split_list_field(value):
+    """Accept '|' or ',' separated strings (CSV cells) for text[] columns"""
+    if isinstance(value, str):
+        sep = '|' if '|' in value else ','
+        return [part.strip() for part in value.split(sep) if part.strip()]
+    return value
+
+class InternshipCreate(BaseModel):
+    """Model for creating an internship posting"""
+    recruiter_id: Optional[UUID4] = None
+    title: str
+    company: str
+    company_logo_url: Optional[str] = None
+    description: str
+    responsibilities: Optional[List[str]] = None
+    learning_outcomes: Optional[List[str]] = None
+    location: Optional[str] = None
+    work_type: Optional[WorkType] = WorkType.ONSITE
+    stipend_min: Optional[int] = None
+    stipend_max: Optional[int] = None
+    duration_months: int
+    hours_per_week: Optional[int] = 40
+    required_skills: List[str]
+    preferred_skills: Optional[List[str]] = None
+    education_level: Optional[EducationLevel] = None
+    experience_required: Optional[ExperienceRequired] = None
+    application_deadline: Optional[datetime] = None
+    start_date: Optional[datetime] = None
+    positions_available: Optional[int] = 1
+    application_process: Optional[str] = None
+    company_website: Optional[str] = None
+    company_size: Optional[CompanySize] = None
+    industry: Optional[str] = None
+    status: Optional[InternshipStatus] = InternshipStatus.OPEN
+
+    _split_lists = field_validator(
+        'responsibilities', 'learning_outcomes', 'required_skills', 'preferred_skills', mode='before'
+    )(split_list_field)
@@ -0,0 +1,70 @@
+# backend/benchmark_vector_store.py
+"""
+Recall and latency of each VectorStore quantization level against exact float32 search.
+
+Usage:
+  python backend/benchmark_vector_store.py --rows 100000 --dimension 384 --queries 200 --k 10
+
+Vectors are synthetic (unit-normalized points around random cluster centres, similar in shape to
+sentence embeddings), so no model or database is needed.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# Add the backend directory to Python path
+backend_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, backend_dir)
+
+from app.core.vector_store import VectorStore, DTYPES
+
+
+def synthetic_vectors(rows: int, dimension: int, clusters: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centres = rng.standard_normal((clusters, dimension)).astype(np.float32)
+    vectors = centres[rng.integers(0, clusters, rows)] + 0.6 * rng.standard_normal((rows, dimension)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark VectorStore quantization levels')
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--dimension', type=int, default=384)
+    parser.add_argument('--clusters', type=int, default=200)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--k', type=int, default=10)
+    args = parser.parse_args()
+
+    vectors = synthetic_vectors(args.rows, args.dimension, args.clusters)
+    queries = synthetic_vectors(args.queries, args.dimension, args.clusters, seed=1)
+    ids = [str(i) for i in range(args.rows)]
+
+    # Exact float32 baseline, in memory
+    truth = [set(np.argpartition(-(vectors @ q), args.k - 1)[:args.k].tolist()) for q in queries]
+
+    print(f"{args.rows} rows x {args.dimension} dims, {args.queries} queries, k={args.k}\n")
+    print(f"{'dtype':<8} {'size MB':>8} {'recall@k':>9} {'p50 ms':>8} {'p99 ms':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        for dtype in DTYPES:
+            path = os.path.join(directory, dtype)
+            VectorStore.write(path, ids, vectors, dtype=dtype)
+            store = VectorStore(path)
+            store.search(queries[0], args.k)  # fault the pages in once
+            latencies, hits = [], 0
+            for q, expected in zip(queries, truth):
+                started = time.perf_counter()
+                found = store.search(q, args.k)
+                latencies.append((time.perf_counter() - started) * 1000)
+                hits += len(expected & {int(row_id) for row_id, _ in found})
+            size_mb = os.path.getsize(store.data_path) / 1e6
+            recall = hits / (args.k * len(queries))
+            print(f"{dtype:<8} {size_mb:>8.1f} {recall:>9.4f} {np.percentile(latencies, 50):>8.2f} {np.percentile(latencies, 99):>8.2f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,32 @@
+# backend/build_recommendation_index.py
+"""
+Rebuild the persisted recommendation indexes from all open internships and freelance jobs.
+
+Usage:
+  python backend/build_recommendation_index.py
+
+Workers load the saved index on first use instead of embedding every posting themselves.
+"""
+import os
+import sys
+
+# Add the backend directory to Python path
+backend_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, backend_dir)
+
+# Add the root directory to Python path for .env access
+root_dir = os.path.dirname(backend_dir)
+sys.path.insert(0, root_dir)
+
+from app.core.recommendations import posting_indexes
+
+
+def main():
+    for table, index in posting_indexes.items():
+        count = index.build()
+        index.save()
+        print(f"✓ Indexed {count} open {table} into {index.index_dir}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+# backend/bulk_ingest.py
+"""
+Bulk-load internships or freelance jobs from a CSV or NDJSON file.
+
+Usage:
+  python backend/bulk_ingest.py postings.csv --recruiter-id <uuid>
+  python backend/bulk_ingest.py gigs.ndjson --table freelance_jobs --batch-size 200
+
+List columns (required_skills, skills_required, ...) are '|' separated in CSV files.
+"""
+import argparse
+import json
+import os
+import sys
+
+# Add the backend directory to Python path
+backend_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, backend_dir)
+
+# Add the root directory to Python path for .env access
+root_dir = os.path.dirname(backend_dir)
+sys.path.insert(0, root_dir)
+
+from app.core.bulk_ingest import ingest_postings, wait_for_translations, DEFAULT_BATCH_SIZE, INGEST_TARGETS
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bulk-load postings into Supabase')
+    parser.add_argument('path', help="CSV or NDJSON file, or '-' for stdin")
+    parser.add_argument('--table', choices=sorted(INGEST_TARGETS), default='internships')
+    parser.add_argument('--format', choices=['csv', 'ndjson'], help='Defaults to the file extension')
+    parser.add_argument('--recruiter-id', help='Owner recorded on every inserted row')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument('--no-translate', action='store_true', help='Skip *_translations backfill')
+    args = parser.parse_args()
+
+    fmt = args.format
+    if not fmt:
+        fmt = 'csv' if args.path.lower().endswith('.csv') else 'ndjson'
+
+    stream = sys.stdin if args.path == '-' else open(args.path, encoding='utf-8', newline='')
+    try:
+        summary = ingest_postings(
+            stream,
+            fmt,
+            table=args.table,
+            recruiter_id=args.recruiter_id,
+            batch_size=args.batch_size,
+            translate=not args.no_translate
+        )
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+    if not args.no_translate:
+        print('Waiting for queued translations...', file=sys.stderr)
+        wait_for_translations()
+
+    print(json.dumps(summary, indent=2))
+    return 0 if not summary['failed'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
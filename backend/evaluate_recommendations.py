@@ -0,0 +1,365 @@
+# backend/evaluate_recommendations.py
+"""
+Offline quality and latency evaluation of the matching engines on a synthetic marketplace.
+
+Usage:
+  python backend/evaluate_recommendations.py --talents 100000 --postings 100000 --queries 500 --k 10
+  python backend/evaluate_recommendations.py --output before.json
+  python backend/evaluate_recommendations.py --compare before.json
+
+Talents, internships and applications are generated from a fixed seed: every talent and posting
+belongs to a domain (web, data, design, ...) and talents apply to the in-domain postings whose
+skills they cover best, preferring their stated role, with some noise. Applications are the
+relevance judgements (shortlisted counts double). No database, network or model download is
+needed: the hashing embedder is used unless EMBEDDING_BACKEND is set.
+
+Engines:
+  semantic    RecommendationIndex (HNSW) search for a talent, as GET /api/recommendations/
+  exact       brute-force inner product over the same embeddings (the ceiling for `semantic`)
+  skills      weighted skill overlap, as GET /api/recommendations/skills
+  candidates  CandidateRankingService for a posting, as GET /api/internships/<id>/candidates
+
+Reported per engine: recall@k and NDCG@k against the applications, p50/p99 query latency
+(including query embedding), index build time and resident memory growth during the build.
+Postings compete for a fixed number of applications, so recall falls as --postings grows;
+compare runs made with the same sizes and seed.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# Offline defaults; must be set before the app modules read them
+os.environ.setdefault('EMBEDDING_BACKEND', 'hashing')
+os.environ.setdefault('RECOMMENDATION_SYNC_INTERVAL', 'inf')
+
+# Add the backend directory to Python path
+backend_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, backend_dir)
+
+from app.core.candidate_ranking import CandidateRankingService, TalentPool
+from app.core.embeddings import EmbeddingService, internship_text, talent_text
+from app.core.recommendations import RecommendationIndex
+from app.core.skill_matching import SkillIndex, SkillVocabulary, POSTING_SKILL_FIELDS
+
+ENGINES = ('semantic', 'exact', 'skills', 'candidates')
+BUILD_PAGE_SIZE = 1000
+CANDIDATES_PER_TALENT = 100
+
+# name -> (roles, skills, description words); at most 16 skills per domain (bitmask)
+DOMAINS = {
+    'web': (['Frontend Developer', 'Backend Developer', 'Full Stack Developer'],
+            ['javascript', 'react', 'node.js', 'html', 'css', 'typescript', 'next.js', 'rest api',
+             'django', 'flask', 'postgresql', 'graphql'],
+            ['web', 'application', 'browser', 'api', 'frontend', 'backend', 'components', 'responsive']),
+    'data': (['Data Analyst', 'Data Scientist', 'Machine Learning Engineer'],
+             ['python', 'pandas', 'numpy', 'sql', 'machine learning', 'scikit-learn', 'tensorflow',
+              'pytorch', 'statistics', 'tableau', 'power bi', 'spark'],
+             ['data', 'models', 'analysis', 'insights', 'dashboards', 'datasets', 'prediction', 'experiments']),
+    'mobile': (['Android Developer', 'iOS Developer', 'Mobile Developer'],
+               ['kotlin', 'java', 'swift', 'flutter', 'dart', 'react native', 'android', 'ios',
+                'firebase', 'xcode', 'jetpack compose', 'sqlite'],
+               ['mobile', 'app', 'android', 'ios', 'screens', 'offline', 'notifications', 'store']),
+    'devops': (['DevOps Engineer', 'Cloud Engineer', 'Site Reliability Engineer'],
+               ['docker', 'kubernetes', 'aws', 'azure', 'terraform', 'linux', 'bash', 'ci/cd',
+                'jenkins', 'ansible', 'prometheus', 'nginx'],
+               ['infrastructure', 'cloud', 'deployment', 'pipelines', 'monitoring', 'clusters', 'uptime', 'automation']),
+    'design': (['UI/UX Designer', 'Product Designer', 'Graphic Designer'],
+               ['figma', 'adobe xd', 'photoshop', 'illustrator', 'wireframing', 'prototyping',
+                'user research', 'typography', 'design systems', 'sketch', 'canva', 'accessibility'],
+               ['design', 'users', 'interfaces', 'visual', 'brand', 'layouts', 'usability', 'mockups']),
+    'marketing': (['Digital Marketing Intern', 'Content Marketer', 'SEO Specialist'],
+                  ['seo', 'google analytics', 'social media', 'content writing', 'copywriting',
+                   'email marketing', 'google ads', 'canva', 'wordpress', 'market research', 'hubspot', 'excel'],
+                  ['campaigns', 'audience', 'content', 'growth', 'brand', 'engagement', 'traffic', 'leads']),
+    'finance': (['Finance Analyst', 'Accounting Intern', 'Investment Analyst'],
+                ['excel', 'accounting', 'tally', 'financial modeling', 'valuation', 'gst',
+                 'bookkeeping', 'sql', 'power bi', 'taxation', 'auditing', 'budgeting'],
+                ['finance', 'reports', 'accounts', 'investments', 'budgets', 'forecasts', 'compliance', 'ledger']),
+    'embedded': (['Embedded Engineer', 'IoT Developer', 'Firmware Engineer'],
+                 ['c', 'c++', 'embedded c', 'arduino', 'raspberry pi', 'rtos', 'microcontrollers',
+                  'pcb design', 'iot', 'matlab', 'verilog', 'linux'],
+                 ['firmware', 'hardware', 'sensors', 'devices', 'circuits', 'prototypes', 'signals', 'boards']),
+}
+GENERAL_SKILLS = ['git', 'communication', 'teamwork', 'problem solving', 'english', 'presentation']
+GENERAL_WORDS = ['team', 'learn', 'projects', 'work', 'build', 'support', 'help', 'develop', 'mentorship', 'startup']
+CITIES = ['Chennai, Tamil Nadu', 'Bengaluru, Karnataka', 'Mumbai, Maharashtra', 'Hyderabad, Telangana',
+          'Delhi, Delhi', 'Pune, Maharashtra', 'Kolkata, West Bengal', 'Kochi, Kerala']
+POPCOUNT = np.array([bin(i).count('1') for i in range(1 << 16)], dtype=np.float32)
+
+
+def _rss_mb() -> float:
+    """Current resident set size (peak size where /proc is unavailable)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1e6
+    except (OSError, ValueError, AttributeError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3
+
+
+def _mask(skills, domain_skills) -> int:
+    return sum(1 << domain_skills.index(s) for s in skills if s in domain_skills)
+
+
+def generate_postings(n: int, rnd: random.Random):
+    """Internship rows plus, per row, its domain, role and required-skill bitmask"""
+    names = list(DOMAINS)
+    rows, domains, role_ids, masks = [], np.zeros(n, dtype=np.int16), np.zeros(n, dtype=np.int16), np.zeros(n, dtype=np.int32)
+    for i in range(n):
+        d = rnd.randrange(len(names))
+        roles, skills, words = DOMAINS[names[d]]
+        role = rnd.randrange(len(roles))
+        other = DOMAINS[names[rnd.randrange(len(names))]][2]
+        required = rnd.sample(skills, rnd.randint(2, 5))
+        preferred = rnd.sample([s for s in skills + GENERAL_SKILLS if s not in required], rnd.randint(0, 3))
+        description = rnd.choices(words, k=8) + rnd.choices(other, k=2) + rnd.choices(GENERAL_WORDS, k=4)
+        rnd.shuffle(description)
+        rows.append({
+            'id': f'internship-{i}',
+            'title': f"{roles[role]} Intern",
+            'description': ' '.join(description),
+            'required_skills': required,
+            'preferred_skills': preferred,
+            'status': 'open',
+            'location': rnd.choice(CITIES),
+            'work_type': rnd.choice(['remote', 'onsite', 'hybrid']),
+            'hours_per_week': rnd.choice([20, 30, 40]),
+            'experience_required': rnd.choice(['none', '0-1', '1-2']),
+        })
+        domains[i], role_ids[i], masks[i] = d, role, _mask(required, skills)
+    return rows, domains, role_ids, masks
+
+
+def generate_talents(n: int, rnd: random.Random):
+    """Talent rows plus, per row, its domain, preferred role and skill bitmask"""
+    names = list(DOMAINS)
+    rows, domains, role_ids, masks = [], np.zeros(n, dtype=np.int16), np.zeros(n, dtype=np.int16), np.zeros(n, dtype=np.int32)
+    for i in range(n):
+        d = rnd.randrange(len(names))
+        roles, skills, words = DOMAINS[names[d]]
+        role = rnd.randrange(len(roles))
+        own = rnd.sample(skills, rnd.randint(3, 8))
+        summary = rnd.choices(words, k=6) + rnd.choices(GENERAL_WORDS, k=4)
+        rnd.shuffle(summary)
+        rows.append({
+            'id': f'talent-{i}',
+            'full_name': f'Talent {i}',
+            'location': rnd.choice(CITIES),
+            'current_position': rnd.choice(['Student', 'Fresher', roles[role]]),
+            'professional_summary': ' '.join(summary),
+            'experience_level': rnd.choice(['fresher', 'junior', 'mid', 'senior', 'expert']),
+            'years_of_experience': rnd.randint(0, 4),
+            'availability': rnd.choice(['full-time', 'part-time', 'freelance', 'contract']),
+            'skills': own + rnd.sample(GENERAL_SKILLS, rnd.randint(0, 2)),
+            'preferred_work_type': rnd.sample(['remote', 'onsite', 'hybrid'], rnd.randint(1, 2)),
+            'job_preferences': {'roles': [roles[role]]},
+        })
+        domains[i], role_ids[i], masks[i] = d, role, _mask(own, skills)
+    return rows, domains, role_ids, masks
+
+
+def generate_applications(talent, posting, per_talent: int, seed: int):
+    """
+    (talent, posting, grade) arrays from (domains, roles, masks) of each side. Each talent looks
+    at CANDIDATES_PER_TALENT random postings in its domain and applies to the `per_talent` whose
+    required skills it covers best, favouring its preferred role (plus noise); a posting it
+    covers at least 75% of counts as shortlisted (grade 2).
+    """
+    talent_domains, talent_roles, talent_masks = talent
+    posting_domains, posting_roles, posting_masks = posting
+    rng = np.random.default_rng(seed)
+    talents, postings, grades = [], [], []
+    for d in range(len(DOMAINS)):
+        t = np.flatnonzero(talent_domains == d)
+        p = np.flatnonzero(posting_domains == d)
+        if not len(t) or not len(p):
+            continue
+        seen = rng.integers(0, len(p), (len(t), min(CANDIDATES_PER_TALENT, len(p))))
+        required = posting_masks[p][seen]
+        coverage = POPCOUNT[talent_masks[t][:, None] & required] / np.maximum(POPCOUNT[required], 1)
+        same_role = posting_roles[p][seen] == talent_roles[t][:, None]
+        noisy = coverage + 0.3 * same_role + 0.25 * rng.random(coverage.shape)
+        n = min(per_talent, seen.shape[1])
+        best = np.argpartition(-noisy, n - 1, axis=1)[:, :n]
+        rows = np.repeat(np.arange(len(t)), n)
+        cols = best.ravel()
+        talents.append(t[rows])
+        postings.append(p[seen[rows, cols]])
+        grades.append(np.where(coverage[rows, cols] >= 0.75, 2, 1))
+    talents, postings, grades = (np.concatenate(a) if a else np.zeros(0, dtype=np.int64) for a in (talents, postings, grades))
+    # A posting seen twice by the same talent is one application
+    _, unique = np.unique(talents.astype(np.int64) * len(posting_domains) + postings, return_index=True)
+    return talents[unique], postings[unique], grades[unique]
+
+
+def judgements(keys, values, grades, wanted, value_ids):
+    """{key: {id: grade}} for the keys in `wanted`"""
+    wanted = set(wanted)
+    truth = {}
+    for key, value, grade in zip(keys.tolist(), values.tolist(), grades.tolist()):
+        if key in wanted:
+            truth.setdefault(key, {})[value_ids[value]] = grade
+    return truth
+
+
+def recall_at_k(ranked, relevant) -> float:
+    return len(set(ranked) & set(relevant)) / len(relevant) if relevant else 0.0
+
+
+def ndcg_at_k(ranked, relevant, k: int) -> float:
+    gains = [(2 ** relevant.get(item, 0) - 1) / np.log2(i + 2) for i, item in enumerate(ranked[:k])]
+    ideal = [(2 ** g - 1) / np.log2(i + 2) for i, g in enumerate(sorted(relevant.values(), reverse=True)[:k])]
+    return float(sum(gains) / sum(ideal)) if ideal else 0.0
+
+
+def run_queries(queries, search, truth, k: int):
+    latencies, recalls, ndcgs, results = [], [], [], {}
+    for key, query in queries:
+        started = time.perf_counter()
+        ranked = search(query)
+        latencies.append((time.perf_counter() - started) * 1000)
+        results[key] = ranked
+        recalls.append(recall_at_k(ranked, truth[key]))
+        ndcgs.append(ndcg_at_k(ranked, truth[key], k))
+    return {
+        'queries': len(latencies),
+        'recall': float(np.mean(recalls)) if recalls else 0.0,
+        'ndcg': float(np.mean(ndcgs)) if ndcgs else 0.0,
+        'p50_ms': float(np.percentile(latencies, 50)) if latencies else 0.0,
+        'p99_ms': float(np.percentile(latencies, 99)) if latencies else 0.0,
+    }, results
+
+
+def timed_build(build):
+    rss = _rss_mb()
+    started = time.perf_counter()
+    built = build()
+    return built, time.perf_counter() - started, max(0.0, _rss_mb() - rss)
+
+
+def evaluate(args) -> dict:
+    rnd = random.Random(args.seed)
+    started = time.perf_counter()
+    postings, *posting_traits = generate_postings(args.postings, rnd)
+    talents, *talent_traits = generate_talents(args.talents, rnd)
+    app_talents, app_postings, app_grades = generate_applications(talent_traits, posting_traits, args.applications, args.seed)
+    print(f"Generated {len(talents)} talents, {len(postings)} postings, {len(app_talents)} applications "
+          f"in {time.perf_counter() - started:.1f}s\n")
+
+    sample = random.Random(args.seed + 1)
+    talent_queries = sample.sample(sorted(set(app_talents.tolist())), min(args.queries, len(set(app_talents.tolist()))))
+    posting_queries = sample.sample(sorted(set(app_postings.tolist())), min(args.queries, len(set(app_postings.tolist()))))
+    posting_ids = [r['id'] for r in postings]
+    talent_ids = [r['id'] for r in talents]
+    talent_truth = judgements(app_talents, app_postings, app_grades, talent_queries, posting_ids)
+    posting_truth = judgements(app_postings, app_talents, app_grades, posting_queries, talent_ids)
+    by_talent = [(t, talents[t]) for t in talent_queries]
+
+    embedder = EmbeddingService()
+    k = args.k
+    results, ranked = {}, {}
+    for engine in args.engines:
+        if engine == 'semantic':
+            with tempfile.TemporaryDirectory() as directory:
+                index = RecommendationIndex('internships', embedder, index_dir=directory)
+                pages = (postings[i:i + BUILD_PAGE_SIZE] for i in range(0, len(postings), BUILD_PAGE_SIZE))
+                _, build_s, memory = timed_build(lambda: index.build(pages))
+                search = lambda talent: [pid for pid, _ in index.search(embedder.encode([talent_text(talent)])[0], k)]
+                metrics, ranked[engine] = run_queries(by_talent, search, talent_truth, k)
+        elif engine == 'exact':
+            matrix, build_s, memory = timed_build(lambda: embedder.encode_rows(postings, internship_text))
+
+            def search(talent):
+                scores = matrix @ embedder.encode([talent_text(talent)])[0]
+                top = np.argpartition(-scores, k - 1)[:k]
+                return [posting_ids[i] for i in top[np.argsort(-scores[top], kind='stable')]]
+            metrics, ranked[engine] = run_queries(by_talent, search, talent_truth, k)
+            del matrix
+        elif engine == 'skills':
+            skill_index, build_s, memory = timed_build(
+                lambda: SkillIndex(SkillVocabulary(), POSTING_SKILL_FIELDS['internships']).fit(postings)
+            )
+            search = lambda talent: [skill_index.ids[i] for i in skill_index.top(skill_index.coverage_of_rows(talent['skills']), k)]
+            metrics, ranked[engine] = run_queries(by_talent, search, talent_truth, k)
+        elif engine == 'candidates':
+            service = CandidateRankingService(embedder)
+            pool, build_s, memory = timed_build(lambda: TalentPool(talents, embedder))
+            search = lambda posting: [item['id'] for item in service.rank(pool, posting, k)['items']]
+            metrics, ranked[engine] = run_queries([(p, postings[p]) for p in posting_queries], search, posting_truth, k)
+            del pool
+        metrics.update({'build_s': build_s, 'memory_mb': memory})
+        results[engine] = metrics
+
+    if 'semantic' in ranked and 'exact' in ranked:
+        # How much of the exact top-k the HNSW index returns
+        overlap = [recall_at_k(ranked['semantic'][t], ranked['exact'][t]) for t in talent_queries]
+        results['semantic']['index_recall'] = float(np.mean(overlap)) if overlap else 0.0
+
+    return {
+        'config': {
+            'talents': args.talents, 'postings': args.postings, 'applications': int(len(app_talents)),
+            'queries': args.queries, 'k': k, 'seed': args.seed, 'embedding_backend': embedder.backend,
+        },
+        'results': results,
+    }
+
+
+COLUMNS = [('recall', 'recall@k', '.4f'), ('ndcg', 'ndcg@k', '.4f'), ('p50_ms', 'p50 ms', '.2f'),
+           ('p99_ms', 'p99 ms', '.2f'), ('build_s', 'build s', '.1f'), ('memory_mb', 'mem MB', '.1f')]
+
+
+def print_report(report: dict, baseline: dict = None):
+    config = report['config']
+    print(f"{config['talents']} talents, {config['postings']} postings, {config['applications']} applications, "
+          f"{config['queries']} queries, k={config['k']}, embeddings={config['embedding_backend']}\n")
+    print(f"{'engine':<11} {'queries':>7} " + ' '.join(f'{label:>9}' for _, label, _ in COLUMNS))
+    for engine, metrics in report['results'].items():
+        print(f"{engine:<11} {metrics['queries']:>7} " + ' '.join(f'{metrics[key]:>9{fmt}}' for key, _, fmt in COLUMNS))
+        before = (baseline or {}).get('results', {}).get(engine)
+        if before:
+            print(f"{'  vs base':<11} {'':>7} " + ' '.join(
+                f'{metrics[key] - before.get(key, 0.0):>+9{fmt}}' for key, _, fmt in COLUMNS
+            ))
+    if 'index_recall' in report['results'].get('semantic', {}):
+        print(f"\nHNSW recall@k against exact search: {report['results']['semantic']['index_recall']:.4f}")
+    if baseline and baseline.get('config') != config:
+        print("\nNote: the baseline was produced with a different configuration")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Evaluate recommendation quality and latency on synthetic data')
+    parser.add_argument('--talents', type=int, default=10000)
+    parser.add_argument('--postings', type=int, default=10000)
+    parser.add_argument('--applications', type=int, default=5, help='applications per talent')
+    parser.add_argument('--queries', type=int, default=500, help='talents (and postings) evaluated per engine')
+    parser.add_argument('--k', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--engines', default=','.join(ENGINES), help=f"comma-separated subset of {','.join(ENGINES)}")
+    parser.add_argument('--output', help='write the results as JSON')
+    parser.add_argument('--compare', help='JSON results of an earlier run to print deltas against')
+    args = parser.parse_args()
+    args.engines = [e.strip() for e in args.engines.split(',') if e.strip()]
+    unknown = set(args.engines) - set(ENGINES)
+    if unknown:
+        parser.error(f"unknown engines: {', '.join(sorted(unknown))}")
+
+    report = evaluate(args)
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,27 @@
+# backend/gunicorn.conf.py
+# Usage (from backend/): gunicorn wsgi:app
+import os
+import tempfile
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5000')
+# Exported so the app sizes per-worker pools (e.g. RESUME_WORKERS) for this many workers
+workers = int(os.environ.setdefault('WEB_CONCURRENCY', '2'))
+threads = int(os.getenv('GUNICORN_THREADS', '4'))
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '60'))
+
+# Import the app and warm it up once in the master; workers fork from the loaded image and
+# share the detector tables, models and indexes copy-on-write instead of each loading them
+preload_app = True
+os.environ.setdefault('WARM_UP', '1')
+# Must be set before prometheus_client is imported, so every worker's samples land in one place
+os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', tempfile.mkdtemp(prefix='jobbly-metrics-'))
+
+
+def post_fork(server, worker):
+    from app.core.warmup import after_fork
+    after_fork()
+
+
+def child_exit(server, worker):
+    from app.core.metrics import mark_process_dead
+    mark_process_dead(worker.pid)
@@ -3,8 +3,14 @@
 
 -- Schema updates for better role separation and additional features
 
--- Ensure required extension for UUID generation
-CREATE EXTENSION IF NOT EXISTS pgcrypto;
+-- Ensure required extension for UUID generation (gen_random_uuid is built in from Postgres 13,
+-- so a missing pgcrypto package is not fatal on local databases)
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pgcrypto') THEN
+        CREATE EXTENSION IF NOT EXISTS pgcrypto;
+    END IF;
+END $$;
 
 -- Base users table (if it doesn't already exist)
 CREATE TABLE IF NOT EXISTS public.users (
@@ -67,6 +73,83 @@ ALTER TABLE public.users
 ADD COLUMN IF NOT EXISTS full_name_translations jsonb,
 ADD COLUMN IF NOT EXISTS full_name_source_language text;
 
+-- Create freelance_jobs table (recruiter-owned gigs)
+CREATE TABLE IF NOT EXISTS public.freelance_jobs (
+  id uuid NOT NULL DEFAULT gen_random_uuid(),
+  recruiter_id uuid,
+  title text NOT NULL,
+  client_company text,
+  description text NOT NULL,
+  project_scope text NOT NULL CHECK (project_scope = ANY (ARRAY['small'::text, 'medium'::text, 'large'::text])),
+  deliverables text[],
+  budget_type text NOT NULL CHECK (budget_type = ANY (ARRAY['fixed'::text, 'hourly'::text])),
+  budget_min numeric,
+  budget_max numeric,
+  estimated_hours integer,
+  deadline timestamp with time zone,
+  project_duration text,
+  skills_required text[] NOT NULL,
+  experience_level text DEFAULT 'any'::text CHECK (experience_level = ANY (ARRAY['beginner'::text, 'intermediate'::text, 'expert'::text, 'any'::text])),
+  portfolio_required boolean DEFAULT false,
+  location text,
+  work_type text DEFAULT 'remote'::text CHECK (work_type = ANY (ARRAY['remote'::text, 'hybrid'::text, 'onsite'::text])),
+  communication_preference text[],
+  category text NOT NULL,
+  subcategory text,
+  application_deadline timestamp with time zone,
+  application_process text,
+  client_info jsonb,
+  project_examples text[],
+  special_requirements text,
+  status text DEFAULT 'open'::text CHECK (status = ANY (ARRAY['open'::text, 'in-progress'::text, 'completed'::text, 'cancelled'::text])),
+  posted_at timestamp with time zone DEFAULT now(),
+  updated_at timestamp with time zone DEFAULT now(),
+  title_translations jsonb,
+  description_translations jsonb,
+  title_source_language text,
+  description_source_language text,
+  CONSTRAINT freelance_jobs_pkey PRIMARY KEY (id),
+  CONSTRAINT freelance_jobs_recruiter_id_fkey FOREIGN KEY (recruiter_id) REFERENCES public.users(id) ON DELETE SET NULL
+);
+
+-- Create internships table (recruiter-owned internships)
+CREATE TABLE IF NOT EXISTS public.internships (
+  id uuid NOT NULL DEFAULT gen_random_uuid(),
+  recruiter_id uuid,
+  title text NOT NULL,
+  company text NOT NULL,
+  company_logo_url text,
+  description text NOT NULL,
+  responsibilities text[],
+  learning_outcomes text[],
+  location text,
+  work_type text DEFAULT 'onsite'::text CHECK (work_type = ANY (ARRAY['remote'::text, 'hybrid'::text, 'onsite'::text])),
+  stipend_min integer,
+  stipend_max integer,
+  duration_months integer NOT NULL,
+  hours_per_week integer DEFAULT 40,
+  required_skills text[] NOT NULL,
+  preferred_skills text[],
+  education_level text CHECK (education_level = ANY (ARRAY['high-school'::text, 'diploma'::text, 'bachelors'::text, 'masters'::text, 'any'::text])),
+  experience_required text CHECK (experience_required = ANY (ARRAY['none'::text, '0-1'::text, '1-2'::text, '2+'::text])),
+  application_deadline timestamp with time zone,
+  start_date timestamp with time zone,
+  positions_available integer DEFAULT 1,
+  application_process text,
+  company_website text,
+  company_size text CHECK (company_size = ANY (ARRAY['startup'::text, 'small'::text, 'medium'::text, 'large'::text, 'enterprise'::text])),
+  industry text,
+  status text DEFAULT 'open'::text CHECK (status = ANY (ARRAY['open'::text, 'closed'::text, 'paused'::text])),
+  posted_at timestamp with time zone DEFAULT now(),
+  updated_at timestamp with time zone DEFAULT now(),
+  title_translations jsonb,
+  description_translations jsonb,
+  title_source_language text,
+  description_source_language text,
+  CONSTRAINT internships_pkey PRIMARY KEY (id),
+  CONSTRAINT internships_recruiter_id_fkey FOREIGN KEY (recruiter_id) REFERENCES public.users(id) ON DELETE SET NULL
+);
+
 -- Create applications table to track job/internship applications
 CREATE TABLE IF NOT EXISTS public.applications (
   id uuid NOT NULL DEFAULT gen_random_uuid(),
@@ -151,83 +234,6 @@ CREATE TABLE IF NOT EXISTS public.company_profiles (
   CONSTRAINT company_profiles_recruiter_id_fkey FOREIGN KEY (recruiter_id) REFERENCES public.users(id) ON DELETE CASCADE
 );
 
--- Create freelance_jobs table (recruiter-owned gigs)
-CREATE TABLE IF NOT EXISTS public.freelance_jobs (
-  id uuid NOT NULL DEFAULT gen_random_uuid(),
-  recruiter_id uuid,
-  title text NOT NULL,
-  client_company text,
-  description text NOT NULL,
-  project_scope text NOT NULL CHECK (project_scope = ANY (ARRAY['small'::text, 'medium'::text, 'large'::text])),
-  deliverables text[],
-  budget_type text NOT NULL CHECK (budget_type = ANY (ARRAY['fixed'::text, 'hourly'::text])),
-  budget_min numeric,
-  budget_max numeric,
-  estimated_hours integer,
-  deadline timestamp with time zone,
-  project_duration text,
-  skills_required text[] NOT NULL,
-  experience_level text DEFAULT 'any'::text CHECK (experience_level = ANY (ARRAY['beginner'::text, 'intermediate'::text, 'expert'::text, 'any'::text])),
-  portfolio_required boolean DEFAULT false,
-  location text,
-  work_type text DEFAULT 'remote'::text CHECK (work_type = ANY (ARRAY['remote'::text, 'hybrid'::text, 'onsite'::text])),
-  communication_preference text[],
-  category text NOT NULL,
-  subcategory text,
-  application_deadline timestamp with time zone,
-  application_process text,
-  client_info jsonb,
-  project_examples text[],
-  special_requirements text,
-  status text DEFAULT 'open'::text CHECK (status = ANY (ARRAY['open'::text, 'in-progress'::text, 'completed'::text, 'cancelled'::text])),
-  posted_at timestamp with time zone DEFAULT now(),
-  updated_at timestamp with time zone DEFAULT now(),
-  title_translations jsonb,
-  description_translations jsonb,
-  title_source_language text,
-  description_source_language text,
-  CONSTRAINT freelance_jobs_pkey PRIMARY KEY (id),
-  CONSTRAINT freelance_jobs_recruiter_id_fkey FOREIGN KEY (recruiter_id) REFERENCES public.users(id) ON DELETE SET NULL
-);
-
--- Create internships table (recruiter-owned internships)
-CREATE TABLE IF NOT EXISTS public.internships (
-  id uuid NOT NULL DEFAULT gen_random_uuid(),
-  recruiter_id uuid,
-  title text NOT NULL,
-  company text NOT NULL,
-  company_logo_url text,
-  description text NOT NULL,
-  responsibilities text[],
-  learning_outcomes text[],
-  location text,
-  work_type text DEFAULT 'onsite'::text CHECK (work_type = ANY (ARRAY['remote'::text, 'hybrid'::text, 'onsite'::text])),
-  stipend_min integer,
-  stipend_max integer,
-  duration_months integer NOT NULL,
-  hours_per_week integer DEFAULT 40,
-  required_skills text[] NOT NULL,
-  preferred_skills text[],
-  education_level text CHECK (education_level = ANY (ARRAY['high-school'::text, 'diploma'::text, 'bachelors'::text, 'masters'::text, 'any'::text])),
-  experience_required text CHECK (experience_required = ANY (ARRAY['none'::text, '0-1'::text, '1-2'::text, '2+'::text])),
-  application_deadline timestamp with time zone,
-  start_date timestamp with time zone,
-  positions_available integer DEFAULT 1,
-  application_process text,
-  company_website text,
-  company_size text CHECK (company_size = ANY (ARRAY['startup'::text, 'small'::text, 'medium'::text, 'large'::text, 'enterprise'::text])),
-  industry text,
-  status text DEFAULT 'open'::text CHECK (status = ANY (ARRAY['open'::text, 'closed'::text, 'paused'::text])),
-  posted_at timestamp with time zone DEFAULT now(),
-  updated_at timestamp with time zone DEFAULT now(),
-  title_translations jsonb,
-  description_translations jsonb,
-  title_source_language text,
-  description_source_language text,
-  CONSTRAINT internships_pkey PRIMARY KEY (id),
-  CONSTRAINT internships_recruiter_id_fkey FOREIGN KEY (recruiter_id) REFERENCES public.users(id) ON DELETE SET NULL
-);
-
 -- Create portfolios table (owned by talents in users table)
 CREATE TABLE IF NOT EXISTS public.portfolios (
   id uuid NOT NULL DEFAULT gen_random_uuid(),
@@ -265,23 +271,188 @@ CREATE TABLE IF NOT EXISTS public.translation_logs (
   CONSTRAINT translation_logs_pkey PRIMARY KEY (id)
 );
 
+-- Precomputed top-N internship recommendations per talent, one row per talent so the dashboard
+-- reads a single key. The API refreshes rows in the background (see RecommendationService).
+CREATE TABLE IF NOT EXISTS public.talent_recommendations (
+  talent_id uuid NOT NULL,
+  items jsonb NOT NULL DEFAULT '[]'::jsonb,
+  computed_at timestamp with time zone NOT NULL DEFAULT now(),
+  CONSTRAINT talent_recommendations_pkey PRIMARY KEY (talent_id),
+  CONSTRAINT talent_recommendations_talent_id_fkey FOREIGN KEY (talent_id) REFERENCES public.users(id) ON DELETE CASCADE
+);
+
+-- Signup in a single round-trip: insert the credentials row and the role profile in one
+-- transaction. Duplicate emails are rejected by the users.email UNIQUE constraint
+-- (SQLSTATE 23505) instead of a racy pre-check from the API.
+CREATE OR REPLACE FUNCTION public.signup_user(
+    p_email text,
+    p_password_hash text,
+    p_full_name text DEFAULT '',
+    p_role text DEFAULT 'talent'
+)
+RETURNS uuid AS $$
+DECLARE
+    new_user_id uuid;
+    profile_table text;
+BEGIN
+    INSERT INTO public.users (role, full_name, email, password_hash)
+    VALUES (p_role, COALESCE(p_full_name, ''), lower(p_email), p_password_hash)
+    RETURNING id INTO new_user_id;
+
+    -- Legacy role-specific profile tables are optional; when present they must be written
+    -- in the same transaction so a failed profile insert rolls back the user row too.
+    profile_table := CASE WHEN p_role = 'recruiter' THEN 'recruiters' ELSE 'talents' END;
+    IF to_regclass('public.' || profile_table) IS NOT NULL THEN
+        EXECUTE format('INSERT INTO public.%I (id, email, full_name) VALUES ($1, $2, $3)', profile_table)
+        USING new_user_id, lower(p_email), COALESCE(p_full_name, '');
+    END IF;
+
+    RETURN new_user_id;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- SECURITY DEFINER bypasses RLS and this skips the API's validation, so only the backend's
+-- service role may call it; PostgREST would otherwise expose it to the anon key
+REVOKE EXECUTE ON FUNCTION public.signup_user(text, text, text, text) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.signup_user(text, text, text, text) TO service_role;
+
+-- Recruiter bulk status change: one set-based UPDATE limited to applications for postings the
+-- recruiter owns. Either pass explicit ids or narrow by posting/current status.
+-- Returns the updated rows with their previous status so the API can report per-id outcomes.
+CREATE OR REPLACE FUNCTION public.bulk_update_application_status(
+    p_recruiter_id uuid,
+    p_status text,
+    p_application_ids uuid[] DEFAULT NULL,
+    p_internship_id uuid DEFAULT NULL,
+    p_job_id uuid DEFAULT NULL,
+    p_current_status text DEFAULT NULL
+)
+RETURNS TABLE (id uuid, previous_status text, status text) AS $$
+#variable_conflict use_column
+BEGIN
+    RETURN QUERY
+    WITH targets AS (
+        SELECT a.id AS application_id, a.status AS old_status
+        FROM public.applications a
+        LEFT JOIN public.internships i ON i.id = a.internship_id
+        LEFT JOIN public.freelance_jobs f ON f.id = a.job_id
+        WHERE (i.recruiter_id = p_recruiter_id OR f.recruiter_id = p_recruiter_id)
+          AND (p_application_ids IS NULL OR a.id = ANY (p_application_ids))
+          AND (p_internship_id IS NULL OR a.internship_id = p_internship_id)
+          AND (p_job_id IS NULL OR a.job_id = p_job_id)
+          AND (p_current_status IS NULL OR a.status = p_current_status)
+        FOR UPDATE OF a
+    )
+    UPDATE public.applications AS app
+    SET status = p_status, updated_at = now()
+    FROM targets t
+    WHERE app.id = t.application_id
+    RETURNING app.id, t.old_status, app.status;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- p_recruiter_id is trusted as proof of ownership, so only the backend (which takes it from the
+-- verified JWT) may call this; never expose it to the anon or authenticated API roles
+REVOKE EXECUTE ON FUNCTION public.bulk_update_application_status(uuid, text, uuid[], uuid, uuid, text) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.bulk_update_application_status(uuid, text, uuid[], uuid, uuid, text) TO service_role;
+
+-- Keep postings' updated_at current on every write; API workers page on (updated_at, id) to
+-- pick up postings changed by other workers into their in-memory recommendation index.
+-- clock_timestamp() rather than now() (the transaction start), so a long transaction does not
+-- stamp its rows far behind those of transactions that committed meanwhile; the sync re-reads
+-- RECOMMENDATION_SYNC_OVERLAP behind its cursor for writes that commit after later-stamped rows.
+CREATE OR REPLACE FUNCTION touch_updated_at()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at := clock_timestamp();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_touch_internships_updated_at ON public.internships;
+CREATE TRIGGER trigger_touch_internships_updated_at
+    BEFORE INSERT OR UPDATE ON public.internships
+    FOR EACH ROW
+    EXECUTE FUNCTION touch_updated_at();
+
+DROP TRIGGER IF EXISTS trigger_touch_freelance_jobs_updated_at ON public.freelance_jobs;
+CREATE TRIGGER trigger_touch_freelance_jobs_updated_at
+    BEFORE INSERT OR UPDATE ON public.freelance_jobs
+    FOR EACH ROW
+    EXECUTE FUNCTION touch_updated_at();
+
+-- Profiles too: GET /api/users/<id> derives its ETag from updated_at
+DROP TRIGGER IF EXISTS trigger_touch_users_updated_at ON public.users;
+CREATE TRIGGER trigger_touch_users_updated_at
+    BEFORE UPDATE ON public.users
+    FOR EACH ROW
+    EXECUTE FUNCTION touch_updated_at();
+
 -- Add indexes for better performance
 CREATE INDEX IF NOT EXISTS idx_users_role ON public.users(role);
 CREATE INDEX IF NOT EXISTS idx_users_email ON public.users(email);
-CREATE INDEX IF NOT EXISTS idx_applications_talent_id ON public.applications(talent_id);
 CREATE INDEX IF NOT EXISTS idx_applications_status ON public.applications(status);
 CREATE INDEX IF NOT EXISTS idx_applications_job_type ON public.applications(job_type);
-CREATE INDEX IF NOT EXISTS idx_saved_jobs_talent_id ON public.saved_jobs(talent_id);
 CREATE INDEX IF NOT EXISTS idx_freelance_jobs_recruiter_id ON public.freelance_jobs(recruiter_id);
 CREATE INDEX IF NOT EXISTS idx_internships_recruiter_id ON public.internships(recruiter_id);
 CREATE INDEX IF NOT EXISTS idx_portfolios_talent_id ON public.portfolios(talent_id);
 
+-- Composite and GIN indexes matching the filters issued by app/core/services.py and the blueprints.
+-- backend/test_query_plans.py EXPLAINs each of these query shapes and fails on sequential scans.
+
+-- Listings: eq('status') + order('posted_at', desc=True)
+CREATE INDEX IF NOT EXISTS idx_internships_status_posted_at ON public.internships(status, posted_at DESC);
+CREATE INDEX IF NOT EXISTS idx_freelance_jobs_status_posted_at ON public.freelance_jobs(status, posted_at DESC);
+-- Freelance listings: eq('status') + eq('category') + order('posted_at', desc=True)
+CREATE INDEX IF NOT EXISTS idx_freelance_jobs_status_category_posted_at ON public.freelance_jobs(status, category, posted_at DESC);
+
+-- Skill containment: cs('required_skills' | 'skills' | 'skills_required', [...])
+CREATE INDEX IF NOT EXISTS idx_internships_required_skills ON public.internships USING gin (required_skills);
+CREATE INDEX IF NOT EXISTS idx_freelance_jobs_skills_required ON public.freelance_jobs USING gin (skills_required);
+CREATE INDEX IF NOT EXISTS idx_users_skills ON public.users USING gin (skills);
+
+-- Talent filters: eq('role') + eq('experience_level') / eq('availability')
+CREATE INDEX IF NOT EXISTS idx_users_role_experience_level ON public.users(role, experience_level);
+CREATE INDEX IF NOT EXISTS idx_users_role_availability ON public.users(role, availability);
+
+-- Saved jobs and applications: eq('talent_id') + eq('job_type'); these supersede the talent_id-only indexes
+CREATE INDEX IF NOT EXISTS idx_saved_jobs_talent_id_job_type ON public.saved_jobs(talent_id, job_type);
+CREATE INDEX IF NOT EXISTS idx_applications_talent_id_job_type ON public.applications(talent_id, job_type);
+DROP INDEX IF EXISTS public.idx_saved_jobs_talent_id;
+DROP INDEX IF EXISTS public.idx_applications_talent_id;
+
+-- Recommendation index catch-up: order('updated_at').order('id') after a (updated_at, id) cursor
+CREATE INDEX IF NOT EXISTS idx_internships_updated_at_id ON public.internships(updated_at, id);
+CREATE INDEX IF NOT EXISTS idx_freelance_jobs_updated_at_id ON public.freelance_jobs(updated_at, id);
+
+-- Applications by posting (recruiter views, bulk_update_application_status, FK cascades) and the
+-- applicant exports, which page each posting with order('id') after an id cursor; these supersede
+-- the posting-only indexes
+CREATE INDEX IF NOT EXISTS idx_applications_internship_id_id ON public.applications(internship_id, id);
+CREATE INDEX IF NOT EXISTS idx_applications_job_id_id ON public.applications(job_id, id);
+DROP INDEX IF EXISTS public.idx_applications_internship_id;
+DROP INDEX IF EXISTS public.idx_applications_job_id;
+
+-- Substring search: ilike('location', '%...%') and the users name/email search need trigram
+-- indexes; pg_trgm ships with Supabase but may be missing on plain local installs
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm') THEN
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        CREATE INDEX IF NOT EXISTS idx_internships_location_trgm ON public.internships USING gin (location gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS idx_users_location_trgm ON public.users USING gin (location gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS idx_users_full_name_trgm ON public.users USING gin (full_name gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS idx_users_email_trgm ON public.users USING gin (email gin_trgm_ops);
+    END IF;
+END $$;
+
 -- Add RLS policies for role-based access control
 ALTER TABLE public.users ENABLE ROW LEVEL SECURITY;
 ALTER TABLE public.applications ENABLE ROW LEVEL SECURITY;
 ALTER TABLE public.saved_jobs ENABLE ROW LEVEL SECURITY;
 ALTER TABLE public.company_profiles ENABLE ROW LEVEL SECURITY;
 ALTER TABLE public.portfolios ENABLE ROW LEVEL SECURITY;
+ALTER TABLE public.talent_recommendations ENABLE ROW LEVEL SECURITY;
 
 -- RLS policies for users table (skip if already exists)
 DO $$ 
@@ -381,6 +552,24 @@ BEGIN
     END IF;
 END $$;
 
+-- RLS policies for talent_recommendations table (written by the service role only)
+DO $$ 
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_policies 
+        WHERE tablename = 'talent_recommendations' AND policyname = 'Talents can view own recommendations'
+    ) THEN
+        CREATE POLICY "Talents can view own recommendations" ON public.talent_recommendations
+          FOR SELECT USING (
+            EXISTS (
+              SELECT 1 FROM public.users 
+              WHERE users.id = talent_recommendations.talent_id 
+              AND users.auth_id = auth.uid()
+            )
+          );
+    END IF;
+END $$;
+
 -- RLS policies for company_profiles table
 DO $$ 
 BEGIN
@@ -432,90 +621,180 @@ END $$;
 DROP FUNCTION IF EXISTS public.calculate_talent_profile_completion(uuid);
 DROP FUNCTION IF EXISTS public.calculate_recruiter_profile_completion(uuid);
 
--- Functions to calculate profile completion
-CREATE OR REPLACE FUNCTION calculate_talent_profile_completion(user_id uuid)
+-- Profile completion is tracked incrementally. The score has two parts:
+--   * points earned from columns on the users row itself, computed from NEW in the users trigger
+--     without re-selecting the row;
+--   * points earned from the linked portfolio (talents) or company profile (recruiters), cached in
+--     users.profile_completion_linked_points and maintained by triggers on those tables.
+ALTER TABLE public.users
+ADD COLUMN IF NOT EXISTS profile_completion_linked_points integer DEFAULT 0;
+
+-- Points from the users row (talent: 70 max)
+CREATE OR REPLACE FUNCTION talent_user_completion_points(u public.users)
 RETURNS integer AS $$
-DECLARE
-    completion_score integer := 0;
-    user_data record;
-    portfolio_data record;
 BEGIN
-    -- Get user data
-    SELECT * INTO user_data FROM public.users WHERE id = user_id;
-    
-    -- Get portfolio data
-    SELECT * INTO portfolio_data FROM public.portfolios WHERE talent_id = user_id;
-    
-    -- Basic info (40 points)
-    IF user_data.full_name IS NOT NULL THEN completion_score := completion_score + 5; END IF;
-    IF user_data.email IS NOT NULL THEN completion_score := completion_score + 5; END IF;
-    IF user_data.phone IS NOT NULL THEN completion_score := completion_score + 5; END IF;
-    IF user_data.location IS NOT NULL THEN completion_score := completion_score + 5; END IF;
-    IF user_data.profile_picture_url IS NOT NULL THEN completion_score := completion_score + 10; END IF;
-    IF user_data.professional_summary IS NOT NULL THEN completion_score := completion_score + 10; END IF;
-    
-    -- Professional info (30 points)
-    IF user_data.skills IS NOT NULL AND array_length(user_data.skills, 1) > 0 THEN completion_score := completion_score + 10; END IF;
-    IF user_data.experience_level IS NOT NULL THEN completion_score := completion_score + 5; END IF;
-    IF user_data.education IS NOT NULL THEN completion_score := completion_score + 10; END IF;
-    IF user_data.resume_url IS NOT NULL THEN completion_score := completion_score + 5; END IF;
-    
-    -- Portfolio info (30 points)
-    IF portfolio_data.bio IS NOT NULL THEN completion_score := completion_score + 10; END IF;
-    IF portfolio_data.projects IS NOT NULL THEN completion_score := completion_score + 10; END IF;
-    IF portfolio_data.work_experience IS NOT NULL THEN completion_score := completion_score + 10; END IF;
-    
-    RETURN completion_score;
+    RETURN
+        -- Basic info (40 points)
+        (CASE WHEN u.full_name IS NOT NULL THEN 5 ELSE 0 END) +
+        (CASE WHEN u.email IS NOT NULL THEN 5 ELSE 0 END) +
+        (CASE WHEN u.phone IS NOT NULL THEN 5 ELSE 0 END) +
+        (CASE WHEN u.location IS NOT NULL THEN 5 ELSE 0 END) +
+        (CASE WHEN u.profile_picture_url IS NOT NULL THEN 10 ELSE 0 END) +
+        (CASE WHEN u.professional_summary IS NOT NULL THEN 10 ELSE 0 END) +
+        -- Professional info (30 points)
+        (CASE WHEN u.skills IS NOT NULL AND array_length(u.skills, 1) > 0 THEN 10 ELSE 0 END) +
+        (CASE WHEN u.experience_level IS NOT NULL THEN 5 ELSE 0 END) +
+        (CASE WHEN u.education IS NOT NULL THEN 10 ELSE 0 END) +
+        (CASE WHEN u.resume_url IS NOT NULL THEN 5 ELSE 0 END);
 END;
-$$ LANGUAGE plpgsql;
+$$ LANGUAGE plpgsql IMMUTABLE;
 
-CREATE OR REPLACE FUNCTION calculate_recruiter_profile_completion(user_id uuid)
+-- Points from the users row (recruiter: 40 max)
+CREATE OR REPLACE FUNCTION recruiter_user_completion_points(u public.users)
 RETURNS integer AS $$
-DECLARE
-    completion_score integer := 0;
-    user_data record;
-    company_data record;
 BEGIN
-    -- Get user data
-    SELECT * INTO user_data FROM public.users WHERE id = user_id;
-    
-    -- Get company data
-    SELECT * INTO company_data FROM public.company_profiles WHERE recruiter_id = user_id;
-    
-    -- Basic info (40 points)
-    IF user_data.full_name IS NOT NULL THEN completion_score := completion_score + 10; END IF;
-    IF user_data.email IS NOT NULL THEN completion_score := completion_score + 10; END IF;
-    IF user_data.phone IS NOT NULL THEN completion_score := completion_score + 10; END IF;
-    IF user_data.recruiter_position IS NOT NULL THEN completion_score := completion_score + 10; END IF;
-    
-    -- Company info (60 points)
-    IF company_data.company_name IS NOT NULL THEN completion_score := completion_score + 15; END IF;
-    IF company_data.company_logo_url IS NOT NULL THEN completion_score := completion_score + 10; END IF;
-    IF company_data.company_website IS NOT NULL THEN completion_score := completion_score + 10; END IF;
-    IF company_data.industry IS NOT NULL THEN completion_score := completion_score + 10; END IF;
-    IF company_data.description IS NOT NULL THEN completion_score := completion_score + 15; END IF;
-    
-    RETURN completion_score;
+    RETURN
+        (CASE WHEN u.full_name IS NOT NULL THEN 10 ELSE 0 END) +
+        (CASE WHEN u.email IS NOT NULL THEN 10 ELSE 0 END) +
+        (CASE WHEN u.phone IS NOT NULL THEN 10 ELSE 0 END) +
+        (CASE WHEN u.recruiter_position IS NOT NULL THEN 10 ELSE 0 END);
 END;
-$$ LANGUAGE plpgsql;
+$$ LANGUAGE plpgsql IMMUTABLE;
+
+-- Points from a portfolio row (30 max)
+CREATE OR REPLACE FUNCTION portfolio_completion_points(p public.portfolios)
+RETURNS integer AS $$
+BEGIN
+    RETURN
+        (CASE WHEN p.bio IS NOT NULL THEN 10 ELSE 0 END) +
+        (CASE WHEN p.projects IS NOT NULL THEN 10 ELSE 0 END) +
+        (CASE WHEN p.work_experience IS NOT NULL THEN 10 ELSE 0 END);
+END;
+$$ LANGUAGE plpgsql IMMUTABLE;
+
+-- Points from a company profile row (60 max)
+CREATE OR REPLACE FUNCTION company_completion_points(c public.company_profiles)
+RETURNS integer AS $$
+BEGIN
+    RETURN
+        (CASE WHEN c.company_name IS NOT NULL THEN 15 ELSE 0 END) +
+        (CASE WHEN c.company_logo_url IS NOT NULL THEN 10 ELSE 0 END) +
+        (CASE WHEN c.company_website IS NOT NULL THEN 10 ELSE 0 END) +
+        (CASE WHEN c.industry IS NOT NULL THEN 10 ELSE 0 END) +
+        (CASE WHEN c.description IS NOT NULL THEN 15 ELSE 0 END);
+END;
+$$ LANGUAGE plpgsql IMMUTABLE;
+
+-- Linked-table points for a user, read from portfolios/company_profiles (used on role change and backfill)
+CREATE OR REPLACE FUNCTION linked_profile_completion_points(p_user_id uuid, p_role text)
+RETURNS integer AS $$
+BEGIN
+    IF p_role = 'talent' THEN
+        RETURN COALESCE((SELECT max(portfolio_completion_points(p)) FROM public.portfolios p WHERE p.talent_id = p_user_id), 0);
+    ELSIF p_role = 'recruiter' THEN
+        RETURN COALESCE((SELECT company_completion_points(c) FROM public.company_profiles c WHERE c.recruiter_id = p_user_id), 0);
+    END IF;
+    RETURN 0;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- Full recomputation, kept for ad-hoc checks and callers of the original API
+CREATE OR REPLACE FUNCTION calculate_talent_profile_completion(user_id uuid)
+RETURNS integer AS $$
+    SELECT talent_user_completion_points(u) + linked_profile_completion_points(u.id, 'talent')
+    FROM public.users u WHERE u.id = user_id;
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION calculate_recruiter_profile_completion(user_id uuid)
+RETURNS integer AS $$
+    SELECT recruiter_user_completion_points(u) + linked_profile_completion_points(u.id, 'recruiter')
+    FROM public.users u WHERE u.id = user_id;
+$$ LANGUAGE sql STABLE;
 
 -- Triggers to update profile completion automatically
 CREATE OR REPLACE FUNCTION update_profile_completion()
 RETURNS TRIGGER AS $$
 BEGIN
+    -- The linked contribution comes from a different table when the role changes
+    IF TG_OP = 'INSERT' OR NEW.role IS DISTINCT FROM OLD.role THEN
+        NEW.profile_completion_linked_points = linked_profile_completion_points(NEW.id, NEW.role);
+    END IF;
+
     IF NEW.role = 'talent' THEN
-        NEW.profile_completion_percentage = calculate_talent_profile_completion(NEW.id);
+        NEW.profile_completion_percentage = talent_user_completion_points(NEW) + COALESCE(NEW.profile_completion_linked_points, 0);
     ELSIF NEW.role = 'recruiter' THEN
-        NEW.profile_completion_percentage = calculate_recruiter_profile_completion(NEW.id);
+        NEW.profile_completion_percentage = recruiter_user_completion_points(NEW) + COALESCE(NEW.profile_completion_linked_points, 0);
     END IF;
     
     RETURN NEW;
 END;
 $$ LANGUAGE plpgsql;
 
--- Recreate trigger idempotently
+-- Recreate trigger idempotently; it only fires when a column that affects the score changes
 DROP TRIGGER IF EXISTS trigger_update_user_profile_completion ON public.users;
 CREATE TRIGGER trigger_update_user_profile_completion
-    BEFORE UPDATE ON public.users
+    BEFORE INSERT OR UPDATE OF role, full_name, email, phone, location, profile_picture_url,
+        professional_summary, skills, experience_level, education, resume_url, recruiter_position,
+        profile_completion_linked_points
+    ON public.users
     FOR EACH ROW
-    EXECUTE FUNCTION update_profile_completion();
\ No newline at end of file
+    EXECUTE FUNCTION update_profile_completion();
+
+-- Push portfolio changes into the owning talent's cached contribution
+CREATE OR REPLACE FUNCTION sync_portfolio_completion()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.talent_id IS NOT NULL THEN
+        UPDATE public.users
+        SET profile_completion_linked_points = linked_profile_completion_points(OLD.talent_id, 'talent')
+        WHERE id = OLD.talent_id AND role = 'talent';
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.talent_id IS NOT NULL
+       AND (TG_OP = 'INSERT' OR NEW.talent_id IS DISTINCT FROM OLD.talent_id) THEN
+        UPDATE public.users
+        SET profile_completion_linked_points = linked_profile_completion_points(NEW.talent_id, 'talent')
+        WHERE id = NEW.talent_id AND role = 'talent';
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_sync_portfolio_completion ON public.portfolios;
+CREATE TRIGGER trigger_sync_portfolio_completion
+    AFTER INSERT OR DELETE OR UPDATE OF talent_id, bio, projects, work_experience
+    ON public.portfolios
+    FOR EACH ROW
+    EXECUTE FUNCTION sync_portfolio_completion();
+
+-- Push company profile changes into the owning recruiter's cached contribution
+CREATE OR REPLACE FUNCTION sync_company_profile_completion()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE public.users
+        SET profile_completion_linked_points = CASE WHEN TG_OP = 'DELETE' THEN 0
+            ELSE linked_profile_completion_points(OLD.recruiter_id, 'recruiter') END
+        WHERE id = OLD.recruiter_id AND role = 'recruiter';
+    END IF;
+    IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND NEW.recruiter_id IS DISTINCT FROM OLD.recruiter_id) THEN
+        UPDATE public.users
+        SET profile_completion_linked_points = company_completion_points(NEW)
+        WHERE id = NEW.recruiter_id AND role = 'recruiter';
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_sync_company_profile_completion ON public.company_profiles;
+CREATE TRIGGER trigger_sync_company_profile_completion
+    AFTER INSERT OR DELETE OR UPDATE OF recruiter_id, company_name, company_logo_url, company_website, industry, description
+    ON public.company_profiles
+    FOR EACH ROW
+    EXECUTE FUNCTION sync_company_profile_completion();
+
+-- One-time backfill of the cached linked contribution (safe to re-run); the users trigger
+-- recomputes profile_completion_percentage for every touched row
+UPDATE public.users u
+SET profile_completion_linked_points = linked_profile_completion_points(u.id, u.role)
+WHERE u.role IN ('talent', 'recruiter')
+  AND u.profile_completion_linked_points IS DISTINCT FROM linked_profile_completion_points(u.id, u.role);
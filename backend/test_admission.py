@@ -0,0 +1,141 @@
+# backend/test_admission.py
+"""
+Admission control checks for app/core/admission.py.
+
+Usage:
+  python backend/test_admission.py
+
+Checks the in-memory token buckets (refill and eviction), client_key() behind trusted proxies
+and the 411/413/429/503 answers of admission_control() through a throwaway Flask app and the
+test client. No database, Redis or server is needed. Exits 1 on any failure.
+"""
+import io
+import os
+import sys
+import time
+
+import jwt
+from flask import Flask, Response, jsonify
+
+backend_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, backend_dir)
+
+from app.core import admission  # noqa: E402
+from app.core.admission import EndpointClass, MemoryRateLimiter, admission_control, client_key  # noqa: E402
+
+# Slow enough that no token refills while the checks run
+ENDPOINT_CLASS = EndpointClass('admission_test', rate_per_minute=0.6, burst=2, concurrency=1, max_body_bytes=1024)
+
+
+def make_app():
+    app = Flask(__name__)
+    admission.ENDPOINT_CLASSES[ENDPOINT_CLASS.name] = ENDPOINT_CLASS
+    # Process-local buckets even when RATE_LIMIT_REDIS_URL is set in the environment
+    admission.rate_limiter = MemoryRateLimiter()
+
+    @app.route('/limited', methods=['GET', 'POST'])
+    @admission_control(ENDPOINT_CLASS.name)
+    def limited():
+        return jsonify({'ok': True})
+
+    @app.route('/stream')
+    @admission_control(ENDPOINT_CLASS.name)
+    def stream():
+        return Response((line for line in ['{"a": 1}\n'] * 3), mimetype='application/x-ndjson')
+
+    @app.route('/key')
+    def key():
+        return jsonify({'key': client_key()})
+
+    return app
+
+
+def limiter_checks():
+    checks = []
+
+    limiter = MemoryRateLimiter()
+    checks.append(('full bucket admits up to the burst', limiter.acquire('a', 10, 2) == 0 and limiter.acquire('a', 10, 2) == 0))
+    wait = limiter.acquire('a', 10, 2)
+    checks.append(('empty bucket returns the time until a token refills', 0.05 < wait <= 0.1))
+    time.sleep(0.15)
+    checks.append(('tokens refill at the rate', limiter.acquire('a', 10, 2) == 0))
+    checks.append(('a cost above the tokens left is refused', limiter.acquire('b', 10, 2, cost=3) > 0))
+
+    limiter = MemoryRateLimiter(max_keys=2)
+    limiter.acquire('a', 0.01, 1)
+    limiter.acquire('b', 0.01, 1)
+    limiter.acquire('a', 0.01, 1)
+    limiter.acquire('c', 0.01, 1)
+    checks.append(('least recently seen key evicted past max_keys', list(limiter._buckets) == ['a', 'c']))
+    checks.append(('an evicted client starts with a full bucket', limiter.acquire('b', 0.01, 1) == 0))
+    return checks
+
+
+def admission_checks(client):
+    checks = []
+
+    def as_client(address):
+        return {'REMOTE_ADDR': address}
+
+    res = client.post('/limited', data=b'x' * 2048, environ_base=as_client('192.0.2.1'))
+    checks.append(('413 over max_body_bytes', res.status_code == 413))
+    res = client.post('/limited', headers={'Transfer-Encoding': 'chunked'}, input_stream=io.BytesIO(b'x'),
+                      environ_base=as_client('192.0.2.1'))
+    checks.append(('411 for a chunked body', res.status_code == 411))
+
+    res = [client.get('/limited', environ_base=as_client('192.0.2.2')) for _ in range(3)]
+    checks.append(('admitted up to the burst', [r.status_code for r in res] == [200, 200, 429]))
+    checks.append(('429 carries Retry-After', int(res[-1].headers.get('Retry-After', 0)) >= 1))
+    res = client.get('/limited', environ_base=as_client('192.0.2.3'))
+    checks.append(('buckets are per client', res.status_code == 200))
+
+    streamed = client.get('/stream', environ_base=as_client('192.0.2.4'))
+    res = client.get('/limited', environ_base=as_client('192.0.2.4'))
+    checks.append(('503 while the class is at its concurrency', res.status_code == 503 and res.headers.get('Retry-After') == '1'))
+    streamed.close()
+    res = [client.get('/limited', environ_base=as_client('192.0.2.4')) for _ in range(2)]
+    checks.append(('streamed responses release their slot when closed, and a 503 takes no tokens',
+                   [r.status_code for r in res] == [200, 429]))
+    return checks
+
+
+def client_key_checks(client):
+    checks = []
+    forwarded = {'X-Forwarded-For': '198.51.100.9, 203.0.113.7'}
+
+    def key(headers=None):
+        return client.get('/key', headers=headers, environ_base={'REMOTE_ADDR': '10.0.0.1'}).get_json()['key']
+
+    try:
+        admission.TRUSTED_PROXY_COUNT = 0
+        checks.append(('peer address without trusted proxies', key(forwarded) == 'ip:10.0.0.1'))
+        admission.TRUSTED_PROXY_COUNT = 1
+        checks.append(('address the trusted proxy saw', key(forwarded) == 'ip:203.0.113.7'))
+        checks.append(('single forwarded entry behind one proxy', key({'X-Forwarded-For': '203.0.113.7'}) == 'ip:203.0.113.7'))
+        checks.append(('peer address when the header is missing', key() == 'ip:10.0.0.1'))
+        admission.TRUSTED_PROXY_COUNT = 2
+        checks.append(('outermost of two trusted proxies', key(forwarded) == 'ip:198.51.100.9'))
+        admission.TRUSTED_PROXY_COUNT = 3
+        checks.append(('peer address when fewer entries than proxies', key(forwarded) == 'ip:10.0.0.1'))
+    finally:
+        admission.TRUSTED_PROXY_COUNT = 0
+
+    token = jwt.encode({'sub': 'user-1', 'email': 'a@example.com'}, os.getenv('JWT_SECRET', 'dev-secret'), algorithm='HS256')
+    checks.append(('signed-in users limited per account', key({'Authorization': f'Bearer {token}', **forwarded}) == 'user:user-1'))
+    return checks
+
+
+def main():
+    client = make_app().test_client()
+    checks = limiter_checks() + admission_checks(client) + client_key_checks(client)
+    for name, ok in checks:
+        print(f"  {'✅' if ok else '❌'} {name}")
+    failed = [name for name, ok in checks if not ok]
+    if failed:
+        print(f"\n❌ {len(failed)} of {len(checks)} checks failed")
+        sys.exit(1)
+    print(f"\n🎉 All {len(checks)} checks passed")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+# backend/test_http_cache.py
+"""
+Conditional-request and compression checks for app/core/http_cache.py.
+
+Usage:
+  python backend/test_http_cache.py
+
+Runs a throwaway Flask app with the http_cache hooks through the test client (no database or
+server needed) and checks ETags, 304s and gzip/brotli compression. Exits 1 on any failure.
+"""
+import gzip
+import os
+import sys
+
+from flask import Flask, Response, jsonify
+
+backend_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, backend_dir)
+
+from app.core import http_cache  # noqa: E402
+from app.core.http_cache import COMPRESS_MIN_SIZE, not_modified, version_etag  # noqa: E402
+
+UPDATED_AT = '2026-01-01T10:00:00+00:00'
+BIG = {'items': ['x' * 64] * (COMPRESS_MIN_SIZE // 32)}
+
+
+def make_app():
+    app = Flask(__name__)
+    http_cache.init_app(app)
+
+    @app.route('/big', methods=['GET', 'POST'])
+    def big():
+        return jsonify(BIG)
+
+    @app.route('/small')
+    def small():
+        return jsonify({'ok': True})
+
+    @app.route('/versioned')
+    def versioned():
+        return not_modified(version_etag('items', 1, UPDATED_AT), UPDATED_AT) or jsonify(BIG)
+
+    @app.route('/stream')
+    def stream():
+        return Response((line for line in ['{"a": 1}\n'] * COMPRESS_MIN_SIZE), mimetype='application/x-ndjson')
+
+    return app
+
+
+def run_checks(client):
+    checks = []
+
+    def check(name, ok):
+        checks.append((name, bool(ok)))
+
+    identity = client.get('/big')
+    etag = identity.get_etag()[0]
+    check('content-hash ETag on a plain GET', etag and 'Content-Encoding' not in identity.headers)
+    check('Vary: Accept-Encoding on compressible bodies', 'Accept-Encoding' in identity.headers.get('Vary', ''))
+
+    gzipped = client.get('/big', headers={'Accept-Encoding': 'gzip'})
+    check('bodies over COMPRESS_MIN_SIZE are gzipped', gzipped.headers.get('Content-Encoding') == 'gzip')
+    check('gzip body decompresses to the original', gzip.decompress(gzipped.get_data()) == identity.get_data())
+    check('encoded representation gets its own ETag', gzipped.get_etag()[0] == f'{etag}-gzip')
+
+    small = client.get('/small', headers={'Accept-Encoding': 'gzip'})
+    check('bodies under COMPRESS_MIN_SIZE are not compressed', 'Content-Encoding' not in small.headers)
+
+    if http_cache.brotli is not None:
+        br = client.get('/big', headers={'Accept-Encoding': 'gzip, br'})
+        check('brotli preferred when installed', br.headers.get('Content-Encoding') == 'br')
+
+    res = client.get('/big', headers={'If-None-Match': f'"{etag}"'})
+    check('304 on the strong ETag', res.status_code == 304 and not res.get_data())
+    res = client.get('/big', headers={'If-None-Match': f'"{etag}-gzip"', 'Accept-Encoding': 'gzip'})
+    check('304 on an encoding-suffixed ETag', res.status_code == 304 and 'Content-Encoding' not in res.headers)
+    res = client.get('/big', headers={'If-None-Match': '"stale"'})
+    check('200 on a stale ETag', res.status_code == 200)
+    res = client.post('/big', headers={'If-None-Match': f'"{etag}"'})
+    check('no 304 for POST', res.status_code == 200)
+
+    version = version_etag('items', 1, UPDATED_AT)
+    res = client.get('/versioned', headers={'If-None-Match': f'"{version}-br"'})
+    check('not_modified() answers 304 before the body is built', res.status_code == 304 and res.get_etag()[0] == version)
+    res = client.get('/versioned', headers={'If-Modified-Since': 'Thu, 01 Jan 2026 10:00:00 GMT'})
+    check('304 on If-Modified-Since', res.status_code == 304)
+    res = client.get('/versioned', headers={'If-Modified-Since': 'Thu, 01 Jan 2026 09:59:59 GMT'})
+    check('200 when modified since', res.status_code == 200 and res.last_modified is not None)
+    res = client.get('/versioned')
+    check('route validators are attached to the full response', res.get_etag()[0] == version)
+
+    res = client.get('/stream', headers={'Accept-Encoding': 'gzip'})
+    check('streamed responses are neither compressed nor tagged',
+          'Content-Encoding' not in res.headers and not res.get_etag()[0])
+    return checks
+
+
+def main():
+    checks = run_checks(make_app().test_client())
+    for name, ok in checks:
+        print(f"  {'✅' if ok else '❌'} {name}")
+    failed = [name for name, ok in checks if not ok]
+    if failed:
+        print(f"\n❌ {len(failed)} of {len(checks)} checks failed")
+        sys.exit(1)
+    print(f"\n🎉 All {len(checks)} checks passed")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+# backend/test_localization.py
+"""
+Language negotiation and translated-field projection checks for app/core/localization.py.
+
+Usage:
+  python backend/test_localization.py
+
+Checks request_language() (including the Vary header shared caches rely on, on 200s and 304s)
+through a throwaway Flask app and the test client, and the fallback order of localize().
+No database or translation provider is needed. Exits 1 on any failure.
+"""
+import os
+import sys
+
+from flask import Flask, jsonify
+
+backend_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, backend_dir)
+
+from app.core import http_cache  # noqa: E402
+from app.core.http_cache import not_modified, version_etag  # noqa: E402
+from app.core.localization import localize, localized_columns, request_language  # noqa: E402
+
+
+def make_app():
+    app = Flask(__name__)
+    http_cache.init_app(app)
+
+    @app.route('/item')
+    def item():
+        lang = request_language()
+        return not_modified(version_etag('item', lang)) or jsonify({'lang': lang})
+
+    return app
+
+
+def _vary(response):
+    return {v.strip() for v in response.headers.get('Vary', '').split(',') if v.strip()}
+
+
+def negotiation_checks(client):
+    checks = []
+
+    res = client.get('/item?lang=hi', headers={'Accept-Language': 'ta'})
+    checks.append(('?lang= wins over Accept-Language', res.get_json()['lang'] == 'hi'))
+    checks.append(('?lang= responses do not vary on Accept-Language', 'Accept-Language' not in _vary(res)))
+
+    res = client.get('/item', headers={'Accept-Language': 'fr, ta;q=0.8'})
+    checks.append(('best supported Accept-Language match', res.get_json()['lang'] == 'ta'))
+    checks.append(('Vary: Accept-Language when negotiated', 'Accept-Language' in _vary(res)))
+
+    res = client.get('/item', headers={'Accept-Language': 'fr'})
+    checks.append(('English when no language is supported', res.get_json()['lang'] == 'en'))
+
+    res = client.get('/item')
+    checks.append(('full maps (None) without ?lang= or Accept-Language', res.get_json()['lang'] is None))
+    checks.append(('Vary: Accept-Language on full-map responses', 'Accept-Language' in _vary(res)))
+
+    res = client.get('/item?lang=xx')
+    checks.append(('unsupported ?lang= falls back to the header', res.get_json()['lang'] is None
+                   and 'Accept-Language' in _vary(res)))
+
+    res = client.get('/item', headers={'If-None-Match': f'"{version_etag("item", None)}"'})
+    checks.append(('Vary: Accept-Language on 304s', res.status_code == 304 and 'Accept-Language' in _vary(res)))
+    return checks
+
+
+def localize_checks():
+    checks = []
+
+    columns = localized_columns('id,title', 'internships', 'hi')
+    checks.append(('lang and English entries selected as JSON paths',
+                   'title__hi:title_translations->>hi' in columns and 'title__en:title_translations->>en' in columns
+                   and 'title_translations,' not in columns))
+    checks.append(('full maps selected without a language',
+                   localized_columns('id', 'internships', None) == 'id,title_translations,description_translations'))
+
+    def row(source_language, **translations):
+        r = {'title': 'source title', 'title_source_language': source_language,
+             'description': 'source description', 'description_source_language': source_language}
+        r.update({f'title__{code}': text for code, text in translations.items()})
+        return r
+
+    r = localize([row('hi', hi='other', en='english')], 'internships', 'hi')[0]
+    checks.append(('source text kept when already in the language', r['title'] == 'source title' and r['title_language'] == 'hi'))
+
+    r = localize([row('ta', hi='hindi', en='english')], 'internships', 'hi')[0]
+    checks.append(('translation in the language next', r['title'] == 'hindi' and r['title_language'] == 'hi'))
+
+    r = localize([row('ta', en='english')], 'internships', 'hi')[0]
+    checks.append(('then English', r['title'] == 'english' and r['title_language'] == 'en'))
+
+    r = localize([row('ta')], 'internships', 'hi')[0]
+    checks.append(('then the source text', r['title'] == 'source title' and r['title_language'] == 'ta'))
+    checks.append(('projection columns removed', not any('__' in key for key in r)))
+
+    original = row('ta', hi='hindi')
+    checks.append(('rows untouched without a language', localize([dict(original)], 'internships', None)[0] == original))
+    return checks
+
+
+def main():
+    checks = negotiation_checks(make_app().test_client()) + localize_checks()
+    for name, ok in checks:
+        print(f"  {'✅' if ok else '❌'} {name}")
+    failed = [name for name, ok in checks if not ok]
+    if failed:
+        print(f"\n❌ {len(failed)} of {len(checks)} checks failed")
+        sys.exit(1)
+    print(f"\n🎉 All {len(checks)} checks passed")
+
+
+if __name__ == '__main__':
+    main()
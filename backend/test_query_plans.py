@@ -0,0 +1,257 @@
+# backend/test_query_plans.py
+"""
+Query-plan regression tests for the indexes in schema.sql.
+
+Usage:
+  QUERY_PLAN_DATABASE_URL=postgresql://postgres@localhost/jobbly_plans python backend/test_query_plans.py
+
+Point QUERY_PLAN_DATABASE_URL at a disposable local Postgres database (never Supabase):
+the script applies schema.sql, seeds synthetic rows, ANALYZEs, then EXPLAINs every query
+shape issued by app/core/services.py and the blueprints. Plans are taken with
+enable_seqscan = off, so a sequential scan in the output means no index can serve that
+shape; each shape also names the index it is expected to use, so a plan that merely
+filters through a less specific index fails as well.
+"""
+import json
+import os
+import sys
+
+try:
+    import psycopg2  # type: ignore
+except Exception:
+    psycopg2 = None  # Only needed for this harness, not by the API
+
+backend_dir = os.path.dirname(os.path.abspath(__file__))
+SCHEMA_PATH = os.path.join(backend_dir, 'schema.sql')
+SEED_ROWS = int(os.getenv('QUERY_PLAN_SEED_ROWS', '20000'))
+
+TALENT_ID = '00000000-0000-4000-8000-000000000001'
+RECRUITER_ID = '00000000-0000-4000-8000-000000000002'
+POSTING_ID = '00000000-0000-4000-8000-000000000003'
+
+# (name, SQL mirroring the PostgREST query, tables that must not be sequentially scanned,
+#  index the plan must use or None, needs pg_trgm)
+QUERY_SHAPES = [
+    ("InternshipService.get_internships (status, order by posted_at)",
+     "SELECT * FROM public.internships WHERE status = 'open' ORDER BY posted_at DESC LIMIT 50",
+     ['internships'], 'idx_internships_status_posted_at', False),
+    ("InternshipService.get_internships (page, order by posted_at, id)",
+     "SELECT id, title FROM public.internships WHERE status = 'open' ORDER BY posted_at DESC, id DESC LIMIT 21 OFFSET 40",
+     ['internships'], 'idx_internships_status_posted_at', False),
+    ("InternshipService.get_internships (skills)",
+     "SELECT * FROM public.internships WHERE status = 'open' AND required_skills @> ARRAY['python','rust'] "
+     "ORDER BY posted_at DESC",
+     ['internships'], 'idx_internships_required_skills', False),
+    ("InternshipService.get_internships (location)",
+     "SELECT * FROM public.internships WHERE status = 'open' AND location ILIKE '%chennai%' ORDER BY posted_at DESC",
+     ['internships'], 'idx_internships_location_trgm', True),
+    ("FreelanceJobService.get_freelance_jobs (status, order by posted_at)",
+     "SELECT * FROM public.freelance_jobs WHERE status = 'open' ORDER BY posted_at DESC LIMIT 50",
+     ['freelance_jobs'], 'idx_freelance_jobs_status_posted_at', False),
+    ("FreelanceJobService.get_freelance_jobs (page, order by posted_at, id)",
+     "SELECT id, title FROM public.freelance_jobs WHERE status = 'open' ORDER BY posted_at DESC, id DESC LIMIT 21 OFFSET 40",
+     ['freelance_jobs'], 'idx_freelance_jobs_status_posted_at', False),
+    ("FreelanceJobService.get_freelance_jobs (category)",
+     "SELECT * FROM public.freelance_jobs WHERE status = 'open' AND category = 'design' ORDER BY posted_at DESC",
+     ['freelance_jobs'], 'idx_freelance_jobs_status_category_posted_at', False),
+    ("UserService.get_talents (skills)",
+     "SELECT * FROM public.users WHERE role = 'talent' AND skills @> ARRAY['rust']",
+     ['users'], 'idx_users_skills', False),
+    ("UserService.get_talents (experience_level)",
+     "SELECT * FROM public.users WHERE role = 'talent' AND experience_level = 'senior'",
+     ['users'], 'idx_users_role_experience_level', False),
+    ("UserService.get_talents (availability)",
+     "SELECT * FROM public.users WHERE role = 'talent' AND availability = 'part-time'",
+     ['users'], 'idx_users_role_availability', False),
+    ("UserService.get_talents (location)",
+     "SELECT * FROM public.users WHERE role = 'talent' AND location ILIKE '%chennai%'",
+     ['users'], 'idx_users_location_trgm', True),
+    ("/api/users/search",
+     "SELECT * FROM public.users WHERE role = 'talent' AND (full_name ILIKE '%user 42%' OR email ILIKE '%user 42%')",
+     ['users'], None, True),
+    ("/api/users/login (email lookup)",
+     "SELECT id, email, full_name, password_hash, role FROM public.users WHERE email = 'user42@example.com' LIMIT 1",
+     ['users'], None, False),
+    ("/api/saved-jobs GET (talent_id, job_type)",
+     f"SELECT * FROM public.saved_jobs WHERE talent_id = '{TALENT_ID}' AND job_type = 'internship'",
+     ['saved_jobs'], 'idx_saved_jobs_talent_id_job_type', False),
+    ("/api/multilingual/applications GET (talent_id, job_type, status)",
+     f"SELECT * FROM public.applications WHERE talent_id = '{TALENT_ID}' AND job_type = 'internship' "
+     "AND status = 'pending'",
+     ['applications'], 'idx_applications_talent_id_job_type', False),
+    ("RecommendationService.postings_changed_at (latest internship write)",
+     "SELECT updated_at FROM public.internships ORDER BY updated_at DESC LIMIT 1",
+     ['internships'], 'idx_internships_updated_at_id', False),
+    ("RecommendationIndex.sync (internships changed within the overlap window)",
+     "SELECT id, status FROM public.internships WHERE updated_at >= now() - interval '3 minutes' "
+     "ORDER BY updated_at, id LIMIT 1000",
+     ['internships'], 'idx_internships_updated_at_id', False),
+    ("RecommendationIndex.sync (internships changed since cursor)",
+     "SELECT id, status FROM public.internships WHERE updated_at > now() - interval '1 minute' "
+     f"OR (updated_at = now() - interval '1 minute' AND id > '{POSTING_ID}') ORDER BY updated_at, id LIMIT 1000",
+     ['internships'], 'idx_internships_updated_at_id', False),
+    ("bulk_update_application_status (recruiter's postings)",
+     f"SELECT id FROM public.internships WHERE recruiter_id = '{RECRUITER_ID}'",
+     ['internships'], 'idx_internships_recruiter_id', False),
+    ("bulk_update_application_status (applications for a posting)",
+     f"SELECT id, status FROM public.applications WHERE internship_id = '{POSTING_ID}'",
+     ['applications'], 'idx_applications_internship_id_id', False),
+    ("/api/multilingual/applications/export (posting, after an id cursor)",
+     f"SELECT * FROM public.applications WHERE internship_id = '{POSTING_ID}' AND id > '{TALENT_ID}' "
+     "ORDER BY id LIMIT 500",
+     ['applications'], 'idx_applications_internship_id_id', False),
+    ("/api/users/talents/export (after an id cursor)",
+     f"SELECT id, full_name, email FROM public.users WHERE role = 'talent' AND id > '{TALENT_ID}' ORDER BY id LIMIT 500",
+     ['users'], 'users_pkey', False),
+]
+
+# Skill arrays mix a few common skills with a rare one ('rust', 1%), like a real skill vocabulary
+SEED_SQL = """
+INSERT INTO public.users (id, role, full_name, email, location, experience_level, availability, skills)
+SELECT CASE WHEN g = 1 THEN '{talent_id}'::uuid ELSE gen_random_uuid() END,
+       CASE WHEN g % 10 = 0 THEN 'recruiter' ELSE 'talent' END,
+       'User ' || g, 'user' || g || '@example.com',
+       (ARRAY['Chennai','Bengaluru','Mumbai','Delhi','Kochi'])[1 + g % 5],
+       (ARRAY['junior','mid','senior'])[1 + g % 3],
+       (ARRAY['full-time','part-time','contract'])[1 + g % 3],
+       ARRAY[(ARRAY['python','react','sql','figma','java'])[1 + g % 5], (ARRAY['git','docker','aws'])[1 + g % 3]]
+         || CASE WHEN g % 100 = 0 THEN ARRAY['rust'] ELSE '{{}}'::text[] END
+FROM generate_series(1, {n}) g;
+
+INSERT INTO public.internships (recruiter_id, title, company, description, duration_months, required_skills, location, status, posted_at)
+SELECT (SELECT id FROM public.users WHERE role = 'recruiter' ORDER BY id LIMIT 1 OFFSET g % 50),
+       'Internship ' || g, 'Company ' || g % 200, 'Description ' || g, 1 + g % 6,
+       ARRAY[(ARRAY['python','react','sql','figma','java'])[1 + g % 5], (ARRAY['git','docker','aws'])[1 + g % 3]]
+         || CASE WHEN g % 100 = 0 THEN ARRAY['rust'] ELSE '{{}}'::text[] END,
+       (ARRAY['Chennai','Bengaluru','Mumbai','Delhi','Kochi'])[1 + g % 5],
+       (ARRAY['open','closed','paused'])[1 + g % 3],
+       now() - (g || ' minutes')::interval
+FROM generate_series(1, {n}) g;
+
+INSERT INTO public.freelance_jobs (title, description, project_scope, budget_type, skills_required, category, status, posted_at)
+SELECT 'Gig ' || g, 'Description ' || g, 'small', 'fixed',
+       ARRAY[(ARRAY['python','react','sql','figma','java'])[1 + g % 5]],
+       (ARRAY['design','development','writing','marketing'])[1 + g % 4],
+       (ARRAY['open','in-progress','completed','cancelled'])[1 + g % 4],
+       now() - (g || ' minutes')::interval
+FROM generate_series(1, {n}) g;
+
+INSERT INTO public.applications (talent_id, internship_id, job_type, status)
+SELECT u.id, i.id, 'internship', (ARRAY['pending','reviewing','shortlisted'])[1 + (row_number() OVER ()) % 3]
+FROM (SELECT id, row_number() OVER (ORDER BY id) AS rn FROM public.users WHERE role = 'talent') u
+JOIN (SELECT id, row_number() OVER (ORDER BY id) AS rn FROM public.internships) i ON i.rn = u.rn;
+
+INSERT INTO public.saved_jobs (talent_id, internship_id, job_type)
+SELECT talent_id, internship_id, 'internship' FROM public.applications;
+
+ANALYZE;
+"""
+
+
+def _connect():
+    url = os.getenv('QUERY_PLAN_DATABASE_URL')
+    if not url:
+        return None
+    conn = psycopg2.connect(url)
+    conn.autocommit = True
+    return conn
+
+
+def setup_database(conn):
+    """Apply schema.sql and seed synthetic data into an empty database"""
+    with conn.cursor() as cur:
+        # Supabase provides auth.uid() and the API roles; stub them so the RLS policies and
+        # grants in schema.sql apply locally
+        cur.execute("""
+            CREATE SCHEMA IF NOT EXISTS auth;
+            CREATE OR REPLACE FUNCTION auth.uid() RETURNS uuid LANGUAGE sql STABLE AS 'SELECT NULL::uuid';
+            DO $$
+            DECLARE role_name text;
+            BEGIN
+                FOREACH role_name IN ARRAY ARRAY['anon', 'authenticated', 'service_role'] LOOP
+                    IF NOT EXISTS (SELECT 1 FROM pg_roles WHERE rolname = role_name) THEN
+                        EXECUTE format('CREATE ROLE %I NOLOGIN', role_name);
+                    END IF;
+                END LOOP;
+            END $$;
+        """)
+        with open(SCHEMA_PATH, encoding='utf-8') as f:
+            cur.execute(f.read())
+        cur.execute("SELECT count(*) FROM public.internships")
+        if cur.fetchone()[0] == 0:
+            cur.execute(SEED_SQL.format(n=SEED_ROWS, talent_id=TALENT_ID))
+        cur.execute("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')")
+        return cur.fetchone()[0]
+
+
+def _plan_nodes(plan):
+    yield plan
+    for child in plan.get('Plans', []):
+        yield from _plan_nodes(child)
+
+
+def _seq_scans(plan, tables):
+    """Return the relations in `tables` that the plan reads with a sequential scan"""
+    return [node['Relation Name'] for node in _plan_nodes(plan)
+            if node.get('Node Type') == 'Seq Scan' and node.get('Relation Name') in tables]
+
+
+def _indexes_used(plan):
+    return {node['Index Name'] for node in _plan_nodes(plan) if node.get('Index Name')}
+
+
+def explain(conn, sql):
+    with conn.cursor() as cur:
+        cur.execute("BEGIN")
+        try:
+            cur.execute("SET LOCAL enable_seqscan = off")
+            cur.execute(f"EXPLAIN (FORMAT JSON) {sql}")
+            plan = cur.fetchone()[0]
+        finally:
+            cur.execute("ROLLBACK")
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]['Plan']
+
+
+def test_query_plans():
+    """Fail if any service-layer query shape falls back to a sequential scan"""
+    if psycopg2 is None:
+        print("⚠️ psycopg2 not installed - skipping query plan tests")
+        return
+    conn = _connect()
+    if conn is None:
+        print("⚠️ QUERY_PLAN_DATABASE_URL not set - skipping query plan tests")
+        return
+
+    try:
+        has_trgm = setup_database(conn)
+        failures = []
+        for name, sql, tables, expected_index, needs_trgm in QUERY_SHAPES:
+            if needs_trgm and not has_trgm:
+                print(f"  ⚠️ {name}: pg_trgm not available, skipped")
+                continue
+            plan = explain(conn, sql)
+            seq = _seq_scans(plan, tables)
+            used = _indexes_used(plan)
+            if seq:
+                failures.append(name)
+                print(f"  ❌ {name}: sequential scan on {', '.join(sorted(set(seq)))}")
+            elif expected_index and expected_index not in used:
+                failures.append(name)
+                print(f"  ❌ {name}: expected {expected_index}, plan used {', '.join(sorted(used)) or 'no index'}")
+            else:
+                print(f"  ✅ {name} ({', '.join(sorted(used))})")
+        assert not failures, f"{len(failures)} query shape(s) fell back to a sequential scan or the wrong index"
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    print("🧪 Checking query plans\n")
+    try:
+        test_query_plans()
+    except AssertionError as e:
+        print(f"\n❌ {e}")
+        sys.exit(1)
+    print("\n🎉 All query shapes use indexes")
@@ -0,0 +1,80 @@
+# backend/test_startup_time.py
+"""
+Cold-start budget for the API.
+
+Usage:
+  python backend/test_startup_time.py
+  STARTUP_BUDGET_SECONDS=0.8 STARTUP_RUNS=5 python backend/test_startup_time.py
+
+Imports `app` and calls create_app() in fresh interpreters, takes the median time, and
+fails when it is over STARTUP_BUDGET_SECONDS or when any of LAZY_MODULES was imported:
+translation providers, language detection, ML models and the Supabase client must load
+on first use or in an explicit warm-up, never at startup. On failure the slowest imports
+(from `python -X importtime`) are listed.
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+backend_dir = os.path.dirname(os.path.abspath(__file__))
+STARTUP_BUDGET_SECONDS = float(os.getenv('STARTUP_BUDGET_SECONDS', '1.0'))
+STARTUP_RUNS = int(os.getenv('STARTUP_RUNS', '3'))
+
+# Heavy packages that create_app() must not import
+LAZY_MODULES = [
+    'langdetect', 'deep_translator', 'deepl', 'httpx', 'supabase', 'scipy',
+    'sentence_transformers', 'torch', 'faiss', 'hnswlib', 'spacy', 'pypdf', 'docx',
+]
+
+PROBE = f"""
+import json, sys, time
+started = time.perf_counter()
+from app import create_app
+create_app()
+elapsed = time.perf_counter() - started
+print(json.dumps({{'seconds': elapsed, 'loaded': [m for m in {LAZY_MODULES!r} if m in sys.modules]}}))
+"""
+
+
+def _cold_start(log_dir):
+    env = dict(os.environ, LOG_DIR=log_dir)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', PROBE],
+        cwd=backend_dir, env=env, capture_output=True, text=True, check=True
+    )
+    imports = []
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            _, cumulative, name = line.split('|')
+            if cumulative.strip().isdigit():
+                imports.append((int(cumulative), name.rstrip()))
+    return json.loads(result.stdout.strip().splitlines()[-1]), imports
+
+
+def main():
+    with tempfile.TemporaryDirectory() as log_dir:
+        runs = [_cold_start(log_dir) for _ in range(STARTUP_RUNS)]
+    seconds = statistics.median(probe['seconds'] for probe, _ in runs)
+    loaded = sorted({m for probe, _ in runs for m in probe['loaded']})
+
+    print(f"create_app() cold start: {seconds:.3f}s median of {STARTUP_RUNS} (budget {STARTUP_BUDGET_SECONDS:.3f}s)")
+    failed = False
+    if loaded:
+        print(f"❌ Imported at startup but should load lazily: {', '.join(loaded)}")
+        failed = True
+    if seconds > STARTUP_BUDGET_SECONDS:
+        print("❌ Over the startup budget")
+        failed = True
+    if failed:
+        print("\nSlowest imports (cumulative µs):")
+        for cumulative, name in sorted(runs[-1][1], reverse=True)[:15]:
+            print(f"  {cumulative:>9} {name}")
+        sys.exit(1)
+    print("🎉 Startup is within budget")
+
+
+if __name__ == '__main__':
+    main()
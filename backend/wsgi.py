@@ -11,8 +11,11 @@ root_dir = os.path.dirname(backend_dir)
 sys.path.insert(0, root_dir)
 
 from app import create_app
+from app.core.warmup import WARM_UP, warm_up
 
 application = create_app()
+if WARM_UP:
+    warm_up()
 app = application  # For compatibility
 
 if __name__ == "__main__":
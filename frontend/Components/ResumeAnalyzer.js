@@ -14,28 +14,37 @@ export default function ResumeAnalyzer() {
     setResult(await res.json());
   }
 
-  function onDrop(e) {
-    e.preventDefault();
-    const file = e.dataTransfer.files?.[0];
+  // PDF/DOCX are parsed server-side; plain text goes into the editor first
+  async function analyzeFile(file) {
+    const body = new FormData();
+    body.append('file', file);
+    const res = await fetch('/api/resume-analyze', { method: 'POST', body });
+    setResult(await res.json());
+  }
+
+  function loadFile(file) {
     if (!file) return;
+    if (/\.(pdf|docx)$/i.test(file.name)) {
+      analyzeFile(file);
+      return;
+    }
     const reader = new FileReader();
     reader.onload = () => setText(String(reader.result || ''));
     reader.readAsText(file);
   }
 
+  function onDrop(e) {
+    e.preventDefault();
+    loadFile(e.dataTransfer.files?.[0]);
+  }
+
   return (
     <Card variant="glass" className="p-5 md:p-6 motion-ready hover:shadow-lg transition-shadow" onDragOver={(e)=>e.preventDefault()} onDrop={onDrop}>
       <h3 className="text-h3 font-semibold mb-3 text-center">Resume Analyzer</h3>
       <p className="text-sm text-textSecondary mb-3 leading-relaxed text-center">Paste, drop, or upload your resume.</p>
       <div className="flex items-center justify-center gap-2 mb-3">
         <label className="btn-secondary cursor-pointer">
-          <input type="file" accept=".pdf,.doc,.docx,.txt" className="hidden" onChange={(e)=>{
-            const file = e.target.files?.[0];
-            if (!file) return;
-            const reader = new FileReader();
-            reader.onload = () => setText(String(reader.result || ''));
-            reader.readAsText(file);
-          }} />
+          <input type="file" accept=".pdf,.docx,.txt" className="hidden" onChange={(e)=>loadFile(e.target.files?.[0])} />
           Upload
         </label>
       </div>
@@ -1,12 +1,25 @@
 import { listInternships, addInternship, dataStore } from '@/utils/dataStore';
 import { isRateLimited } from './_rateLimiter';
 
-export default function handler(req, res) {
+// Single internship from the Flask API; null when the backend is down or does not know the id
+async function fetchInternship(id) {
+  const base = process.env.API_BASE || 'http://localhost:5000';
+  try {
+    const r = await fetch(`${base}/api/internships/${encodeURIComponent(id)}`);
+    if (!r.ok) return null;
+    const { item } = await r.json();
+    return item ? { ...item, skills: item.skills || item.required_skills } : null;
+  } catch (e) {
+    return null;
+  }
+}
+
+export default async function handler(req, res) {
   const { id } = req.query || {};
 
   if (req.method === 'GET') {
     if (id) {
-      const found = (dataStore.internships || []).find(x => x.id === id);
+      const found = (await fetchInternship(id)) || (dataStore.internships || []).find(x => x.id === id);
       return found ? res.status(200).json({ item: found }) : res.status(404).json({ error: 'Not found' });
     }
     return res.status(200).json({ items: listInternships() });
@@ -11,9 +11,8 @@ export default function InternshipDetail(){
 
   useEffect(()=>{
     if (!id) return;
-    fetch('/api/internships').then(r=>r.json()).then(d=>{
-      const found = (d.items||[]).find(x=>x.id === id);
-      setItem(found || null);
+    fetch('/api/internships?id=' + encodeURIComponent(id)).then(r=>r.json()).then(d=>{
+      setItem(d.item || null);
     }).finally(()=>setLoading(false));
   }, [id]);
 
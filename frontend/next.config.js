@@ -20,6 +20,10 @@ const nextConfig = {
         source: '/api/applications',
         destination: 'http://localhost:5000/api/multilingual/applications'
       }
+      ,{
+        source: '/api/resume-analyze',
+        destination: 'http://localhost:5000/api/resume-analyze'
+      }
     ];
   }
 };